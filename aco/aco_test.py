@@ -1,6 +1,8 @@
 import pytest
 import random
 from unittest.mock import patch, MagicMock
+from utils import avaliar_solucao
+from controle import ControleExecucao
 from algColonFormigas_ref import (
     inicializar_feromonios,
     calcular_atratividade,
@@ -268,4 +270,22 @@ class TestACO:
         # Verifica se a função foi chamada
         assert mock_avaliar.called
         assert valor == 100
-        assert peso == 5
\ No newline at end of file
+        assert peso == 5
+    def test_aco_knapsack_esgotado_na_primeira_iteracao(self):
+        """Testa que as formigas avaliadas antes de o orçamento esgotar entram no resultado"""
+        avaliadas = []
+
+        def avaliar(solucao, pesos, valores, capacidade):
+            valor, peso = avaliar_solucao(solucao, pesos, valores, capacidade)
+            avaliadas.append((solucao[:], valor, peso))
+            return valor, peso
+
+        controle = ControleExecucao(max_avaliacoes=3)
+        solucao, valor, peso = aco_knapsack(
+            self.pesos, self.valores, self.capacidade,
+            n_formigas=10, n_iteracoes=5, avaliar=avaliar, controle=controle
+        )
+
+        assert len(avaliadas) == 3
+        assert (solucao, valor, peso) == max(avaliadas, key=lambda x: x[1])
+        assert controle.melhor_valor == valor > 0
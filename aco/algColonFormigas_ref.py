@@ -1,7 +1,11 @@
-import random
 import time
-import pandas as pd
 from utils import avaliar_solucao, gerar_instancia_aleatoria
+from aleatorio import gerador, uniformes_em_bloco
+from controle import ExecucaoEsgotada
+from partida_gulosa import feromonios_de_solucao, solucao_gulosa
+from busca_local import criar_busca_local
+from registros import criar_registro
+from checkpoint import codificar_bits, codificar_reais, decodificar_bits, decodificar_reais, validar_estado
 
 def inicializar_feromonios(n_itens):
     """Inicializa as trilhas de feromônio com valores iniciais."""
@@ -16,32 +20,45 @@ def calcular_probabilidade(feromonio, atratividade, alfa, beta):
     prob = (feromonio ** alfa) * (atratividade ** beta)
     return prob / (1 + prob)
 
-def construir_solucao_formiga(pesos, valores, capacidade, feromonios, alfa, beta):
+def construir_solucao_formiga(pesos, valores, capacidade, feromonios, alfa, beta, rng=None):
     """Constrói uma solução para uma formiga seguindo as probabilidades."""
     n = len(pesos)
     solucao = [0] * n
     peso_total = 0
 
+    # Com um GeradorEmBloco, um sorteio por item (lido do bloco) em vez de um por item que cabe
+    sorteios = uniformes_em_bloco(rng, n)
+    if sorteios is not None:
+        for i, u in zip(range(n), sorteios):
+            if peso_total + pesos[i] <= capacidade:
+                atratividade = calcular_atratividade(valores[i], pesos[i])
+                if u < calcular_probabilidade(feromonios[i], atratividade, alfa, beta):
+                    solucao[i] = 1
+                    peso_total += pesos[i]
+        return solucao
+
+    rng = gerador(rng)
     for i in range(n):
         if peso_total + pesos[i] <= capacidade:
             atratividade = calcular_atratividade(valores[i], pesos[i])
             probabilidade = calcular_probabilidade(feromonios[i], atratividade, alfa, beta)
 
-            if random.random() < probabilidade:
+            if rng.random() < probabilidade:
                 solucao[i] = 1
                 peso_total += pesos[i]
 
     return solucao
 
-def encontrar_melhor_solucao_iteracao(pesos, valores, capacidade, feromonios, n_formigas, alfa, beta, melhor_valor_atual):
+def encontrar_melhor_solucao_iteracao(pesos, valores, capacidade, feromonios, n_formigas, alfa, beta, melhor_valor_atual,
+                                      avaliar=None, rng=None):
     """Encontra a melhor solução em uma iteração usando todas as formigas."""
     melhor_solucao_iteracao = None
     melhor_valor_iteracao = melhor_valor_atual
     melhor_peso_iteracao = 0
 
     for _ in range(n_formigas):
-        solucao = construir_solucao_formiga(pesos, valores, capacidade, feromonios, alfa, beta)
-        valor, peso = avaliar_solucao(solucao, pesos, valores, capacidade)
+        solucao = construir_solucao_formiga(pesos, valores, capacidade, feromonios, alfa, beta, rng)
+        valor, peso = (avaliar or avaliar_solucao)(solucao, pesos, valores, capacidade)
 
         if valor > melhor_valor_iteracao:
             melhor_solucao_iteracao = solucao
@@ -74,12 +91,16 @@ def atualizar_melhor_global(solucao_atual, valor_atual, peso_atual, melhor_soluc
         return solucao_atual[:], valor_atual, peso_atual
     return melhor_solucao, melhor_valor, melhor_peso
 
-def executar_iteracao_aco(pesos, valores, capacidade, feromonios, n_formigas, alfa, beta, melhor_solucao, melhor_valor, melhor_peso, rho, Q):
-    """Executa uma iteração completa do algoritmo ACO."""
-    # Construir soluções com as formigas
+def executar_iteracao_aco(pesos, valores, capacidade, feromonios, n_formigas, alfa, beta, melhor_solucao, melhor_valor, melhor_peso, rho, Q,
+                          avaliar=None, rng=None, melhorar=None):
+    """Executa uma iteração completa do algoritmo ACO (com melhorar, busca local na melhor formiga)."""
+    # Construir soluções com as formigas; com busca local, a melhor da iteração mesmo sem superar a global
     solucao_iteracao, valor_iteracao, peso_iteracao = encontrar_melhor_solucao_iteracao(
-        pesos, valores, capacidade, feromonios, n_formigas, alfa, beta, melhor_valor
+        pesos, valores, capacidade, feromonios, n_formigas, alfa, beta,
+        melhor_valor if melhorar is None else -1, avaliar, rng
     )
+    if melhorar is not None and solucao_iteracao is not None:
+        solucao_iteracao, valor_iteracao, peso_iteracao = melhorar(solucao_iteracao)
 
     # Atualizar melhor solução global
     melhor_solucao, melhor_valor, melhor_peso = atualizar_melhor_global(
@@ -92,7 +113,51 @@ def executar_iteracao_aco(pesos, valores, capacidade, feromonios, n_formigas, al
 
     return melhor_solucao, melhor_valor, melhor_peso
 
-def aco_knapsack(pesos, valores, capacidade, n_formigas=50, n_iteracoes=50, alfa=1.0, beta=2.0, rho=0.1, Q=100):
+def envolver_registro_formigas(controle, avaliar, melhor):
+    """
+    Retorna um avaliador contado pelo controle que registra cada formiga que supera
+    melhor ([solucao, valor, peso], atualizada no lugar), de modo que o resultado
+    anytime inclui as formigas já avaliadas de uma iteração interrompida.
+    """
+    avaliar_contado = controle.envolver(avaliar)
+
+    def avaliar_registrando(solucao, pesos, valores, capacidade):
+        valor, peso = avaliar_contado(solucao, pesos, valores, capacidade)
+        if valor > melhor[1]:
+            melhor[:] = [solucao[:], valor, peso]
+            controle.registrar(valor, peso)
+        return valor, peso
+
+    return avaliar_registrando
+
+def criar_estado_aco(iteracao, feromonios, melhor_solucao, melhor_valor, melhor_peso, rng=None):
+    """Monta o snapshot do ACO: feromônios, incumbente e estado do gerador aleatório."""
+    return {
+        "algoritmo": "aco",
+        "n_itens": len(feromonios),
+        "iteracao": iteracao,
+        "feromonios": codificar_reais(feromonios),
+        "melhor_solucao": None if melhor_solucao is None else codificar_bits(melhor_solucao),
+        "melhor_valor": melhor_valor,
+        "melhor_peso": melhor_peso,
+        "rng": gerador(rng).getstate(),
+    }
+
+def restaurar_estado_aco(estado, n_itens, rng=None):
+    """Restaura um snapshot do ACO; retorna (proxima_iteracao, feromonios, solucao, valor, peso)."""
+    validar_estado(estado, "aco", n_itens)
+    gerador(rng).setstate(estado["rng"])
+    melhor_solucao = estado["melhor_solucao"]
+    return (
+        estado["iteracao"] + 1,
+        decodificar_reais(estado["feromonios"]),
+        None if melhor_solucao is None else decodificar_bits(melhor_solucao),
+        estado["melhor_valor"],
+        estado["melhor_peso"],
+    )
+
+def aco_knapsack(pesos, valores, capacidade, n_formigas=50, n_iteracoes=50, alfa=1.0, beta=2.0, rho=0.1, Q=100,
+                 avaliar=None, controle=None, checkpoint=None, partida_gulosa=False, rng=None, busca_local=None):
     """
     Implementa o Algoritmo de Colônia de Formigas para o Problema da Mochila 0/1.
 
@@ -106,42 +171,77 @@ def aco_knapsack(pesos, valores, capacidade, n_formigas=50, n_iteracoes=50, alfa
         beta: Parâmetro de importância da heurística
         rho: Taxa de evaporação do feromônio
         Q: Constante para depósito de feromônio
+        avaliar: Backend de avaliação com a assinatura de utils.avaliar_solucao
+            (padrão: avaliar_solucao)
+        controle: ControleExecucao opcional (prazo, orçamento de avaliações e
+            notificação de melhorias); cada formiga que melhora a solução é
+            registrada ao ser avaliada e, ao esgotar, retorna a melhor até ali
+        checkpoint: Checkpoint opcional; se houver snapshot gravado, a execução
+            continua dele (com o mesmo resultado de uma execução ininterrupta)
+        partida_gulosa: Parte da solução gulosa por razão valor/peso como
+            incumbente, com o feromônio inicial reforçado nos seus itens
+            (ver partida_gulosa.py)
+        rng: Gerador aleatório (random.Random ou equivalente) usado em todos os
+            sorteios (padrão: o módulo random; ver aleatorio.py)
+        busca_local: "primeira" ou "melhor" aplica a busca local 1-flip/troca
+            (ver busca_local.py) à melhor formiga de cada iteração
 
     Returns:
         Tupla contendo (melhor_solucao, melhor_valor, melhor_peso)
     """
     n_itens = len(pesos)
-
-    # Fase 1: Inicialização
-    feromonios = inicializar_feromonios(n_itens)
-    melhor_solucao = None
-    melhor_valor = 0
-    melhor_peso = 0
+    melhorar = criar_busca_local(busca_local, pesos, valores, capacidade)
+
+    # Fase 1: Inicialização (ou retomada do último checkpoint)
+    estado = checkpoint.carregar() if checkpoint is not None else None
+    if estado is not None:
+        inicio, feromonios, melhor_solucao, melhor_valor, melhor_peso = restaurar_estado_aco(estado, n_itens, rng)
+    else:
+        inicio = 0
+        feromonios = inicializar_feromonios(n_itens)
+        melhor_solucao = None
+        melhor_valor = 0
+        melhor_peso = 0
+        if partida_gulosa:
+            melhor_solucao = solucao_gulosa(pesos, valores, capacidade)
+            melhor_valor, melhor_peso = (avaliar or avaliar_solucao)(melhor_solucao, pesos, valores, capacidade)
+            feromonios = feromonios_de_solucao(melhor_solucao)
+    melhor_formiga = [melhor_solucao, melhor_valor, melhor_peso]
+    if controle is not None:
+        avaliar = envolver_registro_formigas(controle, avaliar, melhor_formiga)
 
     # Fase 2: Loop principal das iterações
-    for iteracao in range(n_iteracoes):
-        melhor_solucao, melhor_valor, melhor_peso = executar_iteracao_aco(
-            pesos, valores, capacidade, feromonios, n_formigas, alfa, beta,
-            melhor_solucao, melhor_valor, melhor_peso, rho, Q
-        )
+    try:
+        for iteracao in range(inicio, n_iteracoes):
+            melhor_solucao, melhor_valor, melhor_peso = executar_iteracao_aco(
+                pesos, valores, capacidade, feromonios, n_formigas, alfa, beta,
+                melhor_solucao, melhor_valor, melhor_peso, rho, Q, avaliar, rng, melhorar
+            )
+            if controle is not None:
+                controle.registrar(melhor_valor, melhor_peso)
+                controle.concluir_iteracao(iteracao)
+            if checkpoint is not None:
+                checkpoint.talvez_salvar(iteracao, lambda: criar_estado_aco(
+                    iteracao, feromonios, melhor_solucao, melhor_valor, melhor_peso, rng
+                ))
+    except ExecucaoEsgotada:
+        # Formigas da iteração interrompida que superaram a melhor global
+        if melhor_formiga[1] > melhor_valor:
+            melhor_solucao, melhor_valor, melhor_peso = melhor_formiga
+    finally:
+        if checkpoint is not None:
+            checkpoint.aguardar()
 
     return melhor_solucao, melhor_valor, melhor_peso
 
-def criar_resultado_teste_aco(n_itens, capacidade, valor, peso, tempo_execucao, pesos, valores, solucao):
-    """Cria um dicionário com os resultados de um teste ACO."""
-    return {
-        "algoritmo": "Algoritmo ACO",
-        "n_itens": n_itens,
-        "capacidade": capacidade,
-        "valor_total": valor,
-        "peso_total": peso,
-        "tempo_execucao": round(tempo_execucao, 5),
-        "pesos": pesos,
-        "valores": valores,
-        "melhor_solucao": solucao
-    }
+def criar_resultado_teste_aco(n_itens, capacidade, valor, peso, tempo_execucao, pesos, valores, solucao,
+                              catalogo=None):
+    """Cria o registro com os resultados de um teste ACO."""
+    return criar_registro(
+        "Algoritmo ACO", n_itens, capacidade, valor, peso, tempo_execucao, pesos, valores, solucao, catalogo=catalogo
+    )
 
-def executar_teste_aco_para_instancia(n_itens):
+def executar_teste_aco_para_instancia(n_itens, catalogo=None):
     """Executa um teste completo do ACO para uma instância com n_itens."""
     pesos, valores, capacidade = gerar_instancia_aleatoria(n_itens)
 
@@ -153,16 +253,25 @@ def executar_teste_aco_para_instancia(n_itens):
 
     return criar_resultado_teste_aco(
         n_itens, capacidade, valor, peso,
-        tempo_execucao, pesos, valores, solucao
+        tempo_execucao, pesos, valores, solucao, catalogo
     )
 
-def main():
-    """Função principal que executa os testes ACO para diferentes tamanhos de instância."""
+def main(ao_concluir=None, catalogo=None, concluidos=()):
+    """
+    Função principal que executa os testes ACO para diferentes tamanhos de instância.
+    ao_concluir(resultado) é chamado com cada registro assim que ele termina, e os
+    tamanhos em concluidos (varredura retomada) não são executados. Com um
+    CatalogoInstancias (registros.py), os registros guardam as instâncias nele.
+    """
     tamanhos_instancia = [5, 1000, 10000]
     resultados_testes = []
 
     for n_itens in tamanhos_instancia:
-        resultado = executar_teste_aco_para_instancia(n_itens)
+        if n_itens in concluidos:
+            continue
+        resultado = executar_teste_aco_para_instancia(n_itens, catalogo)
         resultados_testes.append(resultado)
+        if ao_concluir is not None:
+            ao_concluir(resultado)
 
-    return pd.DataFrame(resultados_testes)
\ No newline at end of file
+    return resultados_testes
\ No newline at end of file
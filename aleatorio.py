@@ -0,0 +1,189 @@
+import hashlib
+import os
+import random
+from collections import deque
+from itertools import chain, islice
+
+
+def gerador(rng=None):
+    """O gerador a usar: rng, ou o próprio módulo random (estado global) quando rng é None."""
+    return random if rng is None else rng
+
+
+class SequenciaSementes:
+    """
+    Semente raiz mais um caminho de derivação, no estilo de numpy.random.SeedSequence.
+
+    spawn(n) cria n filhas independentes (o caminho da mãe acrescido do índice
+    de cada filha); cada uma cria o seu próprio random.Random. Colônias, ilhas,
+    blocos de partículas ou workers sorteiam, assim, em fluxos separados, sem
+    estado compartilhado, e a execução inteira é reproduzível a partir da
+    semente raiz, qualquer que seja a ordem ou o processo em que cada fluxo roda.
+    """
+
+    def __init__(self, entropia=None, caminho=()):
+        if entropia is None:
+            entropia = int.from_bytes(os.urandom(16), "little")
+        self.entropia = entropia
+        self.caminho = tuple(caminho)
+        self._n_filhas = 0
+
+    def __repr__(self):
+        return f"SequenciaSementes({self.entropia!r}, caminho={self.caminho})"
+
+    def spawn(self, n):
+        """n sequências filhas independentes; chamadas sucessivas continuam a numeração."""
+        filhas = [SequenciaSementes(self.entropia, self.caminho + (self._n_filhas + i,)) for i in range(n)]
+        self._n_filhas += n
+        return filhas
+
+    def filha(self, *indices):
+        """Sequência no caminho indicado abaixo desta, sem alterar a numeração de spawn()."""
+        return SequenciaSementes(self.entropia, self.caminho + indices)
+
+    def semente(self):
+        """Semente inteira de 128 bits derivada da entropia e do caminho."""
+        digest = hashlib.blake2b(repr((self.entropia, self.caminho)).encode(), digest_size=16).digest()
+        return int.from_bytes(digest, "little")
+
+    def criar_gerador(self):
+        """random.Random próprio desta sequência."""
+        return random.Random(self.semente())
+
+    def criar_gerador_numpy(self):
+        """numpy.random.Generator próprio desta sequência (numpy só é importado aqui)."""
+        import numpy as np
+        return np.random.default_rng(np.random.SeedSequence(self.semente()))
+
+
+def criar_geradores(semente, n):
+    """n geradores independentes derivados de uma mesma semente raiz."""
+    return [filha.criar_gerador() for filha in SequenciaSementes(semente).spawn(n)]
+
+
+class _FluxoEmBloco:
+    """Números de um gerador numpy, sorteados em blocos e servidos um a um por proximo()."""
+
+    def __init__(self, gerador_numpy, sortear_bloco, tamanho_bloco):
+        self._gerador = gerador_numpy
+        self._sortear_bloco = sortear_bloco
+        self.tamanho_bloco = tamanho_bloco
+        self.posicionar(gerador_numpy.bit_generator.state, 0)
+
+    def _blocos(self):
+        while True:
+            self._estado_bloco = self._gerador.bit_generator.state
+            self._bloco = iter(self._sortear_bloco(self._gerador, self.tamanho_bloco).tolist())
+            yield self._bloco
+
+    def posicionar(self, estado_bloco, consumidos):
+        """Volta ao bloco que começa em estado_bloco, já com consumidos números servidos."""
+        self._gerador.bit_generator.state = estado_bloco
+        self._estado_bloco, self._bloco = estado_bloco, None
+        # Iterado direto em C: sem quadro Python por número servido
+        self.iterador = chain.from_iterable(self._blocos())
+        self.proximo = self.iterador.__next__
+        if consumidos:
+            deque(islice(self.iterador, consumidos), maxlen=0)
+
+    def estado(self):
+        """(estado do gerador no início do bloco atual, números já servidos dele)."""
+        if self._bloco is None:
+            return self._estado_bloco, 0
+        return self._estado_bloco, self.tamanho_bloco - self._bloco.__length_hint__()
+
+
+class GeradorEmBloco:
+    """
+    Gerador com a interface de random.Random usada pelos algoritmos, servido de blocos pré-sorteados.
+
+    Os laços escalares sorteiam um número por bit ou dimensão; em random.randint
+    e random.uniform cada sorteio custa várias chamadas Python. Aqui uniformes e
+    bits são gerados em blocos de tamanho_bloco por geradores numpy e servidos
+    um a um: random() custa o mesmo que random.random(), e randint(0, 1) e
+    uniform() ficam bem mais baratos. Os demais sorteios (gauss, sample, ...)
+    vêm de um random.Random próprio. Cada fluxo deriva de semente (inteiro ou
+    SequenciaSementes), e getstate()/setstate() guardam a posição dentro dos
+    blocos, de modo que um checkpoint retoma exatamente a mesma sequência.
+    """
+
+    def __init__(self, semente=None, tamanho_bloco=8192):
+        sementes = semente if isinstance(semente, SequenciaSementes) else SequenciaSementes(semente)
+        self.tamanho_bloco = tamanho_bloco
+        self._uniformes = _FluxoEmBloco(
+            sementes.filha(0).criar_gerador_numpy(), lambda g, n: g.random(n), tamanho_bloco
+        )
+        self._bits = _FluxoEmBloco(
+            sementes.filha(1).criar_gerador_numpy(), lambda g, n: g.integers(0, 2, n, dtype="uint8"), tamanho_bloco
+        )
+        self._auxiliar = sementes.filha(2).criar_gerador()
+        self._ligar()
+
+    def _ligar(self):
+        """Expõe os iteradores dos blocos como métodos (sem quadro Python por sorteio)."""
+        self.random = self._uniformes.proximo
+        self.bit = self._bits.proximo
+
+    def randint(self, a, b):
+        """Inteiro uniforme em [a, b]; randint(0, 1) vem direto do bloco de bits."""
+        if a == 0 and b == 1:
+            return self.bit()
+        return a + int(self.random() * (b - a + 1))
+
+    def uniform(self, a, b):
+        """Real uniforme entre a e b (mesma fórmula de random.uniform)."""
+        return a + (b - a) * self.random()
+
+    def uniformes(self, n):
+        """Iterador com os próximos n uniformes, lidos direto dos blocos."""
+        return islice(self._uniformes.iterador, n)
+
+    def bits(self, n):
+        """Lista com os próximos n bits."""
+        return list(islice(self._bits.iterador, n))
+
+    # Sorteios menos frequentes: direto do random.Random auxiliar
+    def gauss(self, mu=0.0, sigma=1.0):
+        return self._auxiliar.gauss(mu, sigma)
+
+    def sample(self, populacao, k):
+        return self._auxiliar.sample(populacao, k)
+
+    def choice(self, sequencia):
+        return self._auxiliar.choice(sequencia)
+
+    def shuffle(self, sequencia):
+        self._auxiliar.shuffle(sequencia)
+
+    def getrandbits(self, k):
+        return self._auxiliar.getrandbits(k)
+
+    def getstate(self):
+        """Estado dos três fluxos, com a posição dentro do bloco atual de cada um."""
+        return self._uniformes.estado(), self._bits.estado(), self._auxiliar.getstate()
+
+    def setstate(self, estado):
+        """Restaura um estado de getstate(), inclusive de outra instância."""
+        uniformes, bits, auxiliar = estado
+        self._uniformes.posicionar(*uniformes)
+        self._bits.posicionar(*bits)
+        self._auxiliar.setstate(auxiliar)
+        self._ligar()
+
+
+def uniformes_em_bloco(rng, n):
+    """
+    Iterador com os próximos n uniformes de um GeradorEmBloco; None para outros geradores.
+
+    Os laços escalares iteram direto sobre ele, sem uma chamada por sorteio;
+    com os demais geradores (inclusive o módulo random) seguem chamando
+    rng.random(), com a mesma sequência de antes.
+    """
+    return rng.uniformes(n) if isinstance(rng, GeradorEmBloco) else None
+
+def sortear_bits(rng, n):
+    """Lista com n bits: fatia do bloco de bits de um GeradorEmBloco, ou rng.randint(0, 1) um a um."""
+    rng = gerador(rng)
+    if isinstance(rng, GeradorEmBloco):
+        return rng.bits(n)
+    return [rng.randint(0, 1) for _ in range(n)]
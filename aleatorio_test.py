@@ -0,0 +1,149 @@
+import pytest
+import random
+from aleatorio import GeradorEmBloco, SequenciaSementes, criar_geradores, gerador, uniformes_em_bloco
+from checkpoint import Checkpoint
+from aco.algColonFormigas_ref import aco_knapsack
+from utils import gerar_instancia_aleatoria, gerar_solucao_binaria
+from resolvedores import resolver, resolver_replicas
+
+
+class TestAleatorio:
+    """Classe de testes para os geradores explícitos e as sequências de sementes"""
+
+    def setup_method(self):
+        """Configuração executada antes de cada teste"""
+        self.pesos, self.valores, self.capacidade = gerar_instancia_aleatoria(30, rng=random.Random(7))
+
+    def test_gerador_padrao_e_modulo_random(self):
+        """Testa que sem rng os sorteios continuam vindo do módulo random"""
+        rng = random.Random(1)
+        assert gerador() is random
+        assert gerador(rng) is rng
+
+    def test_spawn_deterministico_e_independente(self):
+        """Testa que filhas da mesma semente coincidem e filhas distintas divergem"""
+        a = [filha.criar_gerador().random() for filha in SequenciaSementes(42).spawn(4)]
+        b = [filha.criar_gerador().random() for filha in SequenciaSementes(42).spawn(4)]
+        assert a == b
+        assert len(set(a)) == 4
+        assert SequenciaSementes(43).spawn(1)[0].semente() != SequenciaSementes(42).spawn(1)[0].semente()
+
+    def test_spawn_continua_numeracao(self):
+        """Testa que chamadas sucessivas de spawn não repetem filhas e que filha() segue o mesmo caminho"""
+        raiz = SequenciaSementes(5)
+        primeiras, segundas = raiz.spawn(2), raiz.spawn(2)
+        assert [s.caminho for s in primeiras + segundas] == [(0,), (1,), (2,), (3,)]
+        neta = SequenciaSementes(5).spawn(2)[1].spawn(3)[2]
+        assert neta.semente() == SequenciaSementes(5).filha(1, 2).semente()
+
+    def test_criar_geradores(self):
+        """Testa a criação de vários geradores independentes a partir de uma semente raiz"""
+        sorteios = [g.random() for g in criar_geradores(3, 3)]
+        assert sorteios == [g.random() for g in criar_geradores(3, 3)]
+        assert len(set(sorteios)) == 3
+
+    def test_utils_com_rng(self):
+        """Testa que os geradores de utils são reproduzíveis com rng e não tocam o estado global"""
+        estado = random.getstate()
+        assert gerar_solucao_binaria(50, random.Random(9)) == gerar_solucao_binaria(50, random.Random(9))
+        assert gerar_instancia_aleatoria(20, rng=random.Random(9)) == gerar_instancia_aleatoria(20, rng=random.Random(9))
+        assert random.getstate() == estado
+
+    @pytest.mark.parametrize("algoritmo, parametros", [
+        ("aco", {"n_formigas": 5, "n_iteracoes": 5}),
+        ("bee", {"n_abelhas": 8, "n_melhores": 3, "n_vizinhos": 2, "n_iter": 5}),
+        ("cuckoo", {"n_ninhos": 6, "n_iteracoes": 5}),
+        ("cuckoo", {"n_ninhos": 6, "n_iteracoes": 5, "matricial": True}),
+        ("genetico", {"tam_populacao": 6, "n_geracoes": 5}),
+        ("genetico", {"tam_populacao": 6, "n_geracoes": 5, "buffer_duplo": True, "partida_gulosa": True}),
+        ("pso", {}),
+    ])
+    def test_resolver_reproduzivel_com_rng(self, algoritmo, parametros):
+        """Testa que o mesmo gerador semeado reproduz o resultado sem alterar o estado global"""
+        estado = random.getstate()
+        primeiro = resolver(algoritmo, self.pesos, self.valores, self.capacidade, rng=random.Random(11), **parametros)
+        segundo = resolver(algoritmo, self.pesos, self.valores, self.capacidade, rng=random.Random(11), **parametros)
+        assert primeiro == segundo
+        assert random.getstate() == estado
+
+    @pytest.mark.parametrize("algoritmo, parametros", [
+        ("aco", {"n_formigas": 5, "n_iteracoes": 5}),
+        ("bee", {"n_abelhas": 8, "n_melhores": 3, "n_vizinhos": 2, "n_iter": 5}),
+        ("cuckoo", {"n_ninhos": 6, "n_iteracoes": 5, "levy_mantegna": True}),
+        ("genetico", {"tam_populacao": 6, "n_geracoes": 5, "buffer_duplo": True}),
+        ("pso", {}),
+    ])
+    def test_resolver_com_gerador_em_bloco(self, algoritmo, parametros):
+        """Testa que os algoritmos aceitam o gerador em bloco e continuam reproduzíveis"""
+        primeiro = resolver(algoritmo, self.pesos, self.valores, self.capacidade, rng=GeradorEmBloco(11, 64),
+                            **parametros)
+        segundo = resolver(algoritmo, self.pesos, self.valores, self.capacidade, rng=GeradorEmBloco(11, 64),
+                           **parametros)
+        assert primeiro == segundo
+        assert primeiro.peso <= self.capacidade
+
+    def test_gerador_em_bloco_intervalos(self):
+        """Testa os intervalos dos sorteios servidos pelo gerador em bloco"""
+        rng = GeradorEmBloco(3, tamanho_bloco=32)
+        assert all(0 <= rng.random() < 1 for _ in range(100))
+        assert {rng.randint(0, 1) for _ in range(100)} == {0, 1}
+        assert {rng.randint(3, 5) for _ in range(100)} == {3, 4, 5}
+        assert all(-4 <= rng.uniform(-4, -2) <= -2 for _ in range(100))
+        assert len(rng.bits(70)) == 70
+        assert len(list(uniformes_em_bloco(rng, 70))) == 70
+        assert uniformes_em_bloco(random.Random(0), 5) is None
+        assert len(set(rng.sample(range(10), 3))) == 3
+        assert 0 <= rng.getrandbits(8) < 256
+
+    @pytest.mark.parametrize("consumidos", [0, 5, 16, 40])
+    def test_gerador_em_bloco_estado(self, consumidos):
+        """Testa que setstate retoma a sequência no meio de um bloco e na fronteira entre blocos"""
+        rng = GeradorEmBloco(8, tamanho_bloco=16)
+        for _ in range(consumidos):
+            rng.random()
+        rng.bits(consumidos // 2)
+        estado = rng.getstate()
+
+        def sortear():
+            return [rng.random() for _ in range(20)] + rng.bits(20) + [rng.gauss(0, 1)]
+
+        esperado = sortear()
+        rng.setstate(estado)
+        assert sortear() == esperado
+        outro = GeradorEmBloco(0, tamanho_bloco=16)
+        outro.setstate(estado)
+        rng.setstate(estado)
+        assert [outro.random() for _ in range(30)] == [rng.random() for _ in range(30)]
+
+    def test_retomada_com_gerador_em_bloco(self, tmp_path):
+        """Testa que o checkpoint guarda a posição nos blocos e a retomada é idêntica"""
+        def executar(rng, checkpoint=None, n_iteracoes=10):
+            return aco_knapsack(self.pesos, self.valores, self.capacidade, n_formigas=5, n_iteracoes=n_iteracoes,
+                                checkpoint=checkpoint, rng=rng)
+
+        esperado = executar(GeradorEmBloco(4, 50))
+        caminho = str(tmp_path / "aco.ck")
+        executar(GeradorEmBloco(4, 50), Checkpoint(caminho, 3), n_iteracoes=7)
+        assert executar(GeradorEmBloco(99, 50), Checkpoint(caminho, 3)) == esperado
+
+    def test_pso_rejeita_outros_parametros(self):
+        """Testa que o PSO aceita rng por chamada mas continua recusando outros parâmetros"""
+        with pytest.raises(TypeError):
+            resolver("pso", self.pesos, self.valores, self.capacidade, rng=random.Random(0), n_particulas=3)
+
+    def test_bee_paralelo_independe_do_numero_de_workers(self):
+        """Testa que o bee em paralelo dá o mesmo resultado com 1 ou 2 workers"""
+        parametros = dict(n_abelhas=8, n_melhores=3, n_vizinhos=2, n_iter=4, semente=3)
+        um = resolver("bee", self.pesos, self.valores, self.capacidade, n_workers=1, rng=random.Random(2), **parametros)
+        dois = resolver("bee", self.pesos, self.valores, self.capacidade, n_workers=2, rng=random.Random(2), **parametros)
+        assert um == dois
+
+    def test_replicas_reproduziveis_em_paralelo(self):
+        """Testa que as réplicas dependem só da semente raiz, não do número de processos"""
+        parametros = dict(n_formigas=4, n_iteracoes=4)
+        serie = resolver_replicas("aco", self.pesos, self.valores, self.capacidade, 3, semente=17, **parametros)
+        paralelo = resolver_replicas(
+            "aco", self.pesos, self.valores, self.capacidade, 3, semente=17, n_workers=2, **parametros
+        )
+        assert serie == paralelo
+        assert len(serie) == 3
@@ -0,0 +1,87 @@
+import numpy as np
+from utils import avaliar_solucao
+
+
+class AvaliadorNumpy:
+    """Avalia soluções com produtos escalares numpy sobre a instância pré-convertida."""
+
+    def __init__(self, pesos, valores):
+        self.pesos = np.asarray(pesos, dtype=np.int64)
+        self.valores = np.asarray(valores, dtype=np.int64)
+
+    def __call__(self, solucao, pesos, valores, capacidade):
+        vetor = np.asarray(solucao, dtype=np.int64)
+        peso_total = int(vetor @ self.pesos)
+        if peso_total > capacidade:
+            return 0, peso_total
+        return int(vetor @ self.valores), peso_total
+
+    def avaliar_lote(self, solucoes, capacidade):
+        """Avalia uma matriz de soluções de uma vez; retorna arrays (valores, pesos)."""
+        matriz = np.asarray(solucoes, dtype=np.int64)
+        pesos_totais = matriz @ self.pesos
+        return np.where(pesos_totais <= capacidade, matriz @ self.valores, 0), pesos_totais
+
+
+class AvaliadorDelta(AvaliadorNumpy):
+    """
+    Avaliação incremental sobre a última solução avaliada.
+
+    Pela interface comum (__call__), que recebe a solução inteira sem dizer o
+    que mudou, a avaliação é completa (como AvaliadorNumpy) e a solução passa a
+    ser a base das trocas. inverter(alteradas, capacidade) inverte na base só as
+    posições indicadas pelo chamador e atualiza os totais brutos em O(k).
+    """
+
+    def __init__(self, pesos, valores):
+        super().__init__(pesos, valores)
+        self._pesos = self.pesos.tolist()
+        self._valores = self.valores.tolist()
+        self._ultima = None
+        self._valor = 0
+        self._peso = 0
+
+    def __call__(self, solucao, pesos, valores, capacidade):
+        vetor = np.asarray(solucao, dtype=np.int64)
+        self._peso = int(vetor @ self.pesos)
+        self._valor = int(vetor @ self.valores)
+        self._ultima = bytearray(vetor.astype(np.uint8))
+        return self._resultado(capacidade)
+
+    def inverter(self, alteradas, capacidade):
+        """Inverte as posições alteradas da última solução; retorna (valor, peso) como avaliar_solucao."""
+        if self._ultima is None:
+            raise ValueError("inverter() requer uma solução avaliada antes")
+        for i in alteradas:
+            sinal = -1 if self._ultima[i] else 1
+            self._ultima[i] ^= 1
+            self._peso += sinal * self._pesos[i]
+            self._valor += sinal * self._valores[i]
+        return self._resultado(capacidade)
+
+    @property
+    def solucao(self):
+        """Cópia da última solução (a base das trocas)."""
+        return list(self._ultima)
+
+    def _resultado(self, capacidade):
+        if self._peso > capacidade:
+            return 0, self._peso
+        return self._valor, self._peso
+
+
+# Fábricas de backend: recebem (pesos, valores) e devolvem a função de avaliação
+BACKENDS = {
+    "python": lambda pesos, valores: avaliar_solucao,
+    "numpy": AvaliadorNumpy,
+    "delta": AvaliadorDelta,
+}
+
+
+def criar_avaliador(backend, pesos, valores):
+    """Cria a função de avaliação do backend escolhido para uma instância."""
+    try:
+        fabrica = BACKENDS[backend]
+    except KeyError:
+        raise ValueError(f"Backend de avaliação desconhecido: {backend!r}") from None
+    return fabrica(pesos, valores)
@@ -0,0 +1,66 @@
+import pytest
+import random
+import numpy as np
+from utils import avaliar_solucao
+from avaliadores import AvaliadorNumpy, AvaliadorDelta, criar_avaliador
+
+
+class TestAvaliadores:
+    """Classe de testes para os backends de avaliação"""
+
+    def setup_method(self):
+        """Configuração executada antes de cada teste"""
+        random.seed(42)
+        self.pesos = [2, 1, 3, 2]
+        self.valores = [12, 10, 20, 15]
+        self.capacidade = 5
+
+    def test_avaliador_numpy_equivale_ao_python(self):
+        """Testa que o backend numpy reproduz utils.avaliar_solucao"""
+        avaliar = AvaliadorNumpy(self.pesos, self.valores)
+        for solucao in ([1, 0, 1, 0], [1, 1, 1, 1], [0, 0, 0, 0]):
+            assert avaliar(solucao, self.pesos, self.valores, self.capacidade) == \
+                avaliar_solucao(solucao, self.pesos, self.valores, self.capacidade)
+
+    def test_avaliador_numpy_lote(self):
+        """Testa a avaliação de uma matriz de soluções"""
+        avaliar = AvaliadorNumpy(self.pesos, self.valores)
+        valores, pesos = avaliar.avaliar_lote([[1, 0, 1, 0], [1, 1, 1, 1]], self.capacidade)
+        assert valores.tolist() == [32, 0]
+        assert pesos.tolist() == [5, 8]
+
+    def test_avaliador_delta_sequencia_de_vizinhos(self):
+        """Testa que as trocas incrementais acompanham o cálculo completo"""
+        n_itens = 200
+        pesos = [random.randint(1, 10) for _ in range(n_itens)]
+        valores = [random.randint(1, 20) for _ in range(n_itens)]
+        capacidade = sum(pesos) // 2
+        avaliar = AvaliadorDelta(pesos, valores)
+
+        solucao = [random.randint(0, 1) for _ in range(n_itens)]
+        assert avaliar(solucao, pesos, valores, capacidade) == avaliar_solucao(solucao, pesos, valores, capacidade)
+        for _ in range(50):
+            alteradas = random.sample(range(n_itens), random.choice([1, 3, 100]))
+            for idx in alteradas:
+                solucao[idx] = 1 - solucao[idx]
+            assert avaliar.inverter(alteradas, capacidade) == avaliar_solucao(solucao, pesos, valores, capacidade)
+        assert avaliar.solucao == solucao
+
+    def test_avaliador_delta_copia_a_solucao(self):
+        """Testa que mutar a solução depois da avaliação não corrompe a base das trocas"""
+        avaliar = AvaliadorDelta(self.pesos, self.valores)
+        with pytest.raises(ValueError):
+            avaliar.inverter([0], self.capacidade)
+        solucao = np.array([1, 0, 1, 0])
+        assert avaliar(solucao, self.pesos, self.valores, self.capacidade) == (32, 5)
+        solucao[1] = 1
+        assert avaliar.inverter([3], 10) == (47, 7)
+        assert avaliar.solucao == [1, 0, 1, 1]
+
+    def test_criar_avaliador(self):
+        """Testa a criação de backends por nome"""
+        assert criar_avaliador("python", self.pesos, self.valores) is avaliar_solucao
+        assert isinstance(criar_avaliador("numpy", self.pesos, self.valores), AvaliadorNumpy)
+        assert isinstance(criar_avaliador("delta", self.pesos, self.valores), AvaliadorDelta)
+        with pytest.raises(ValueError, match="Backend"):
+            criar_avaliador("gpu", self.pesos, self.valores)
@@ -1,23 +1,26 @@
-import random
 import time
-import numpy as np
-import pandas as pd
+from multiprocessing import Pool
 from utils import avaliar_solucao, gerar_solucao_binaria, gerar_vizinho, gerar_instancia_aleatoria
+from partida_gulosa import gerar_populacao_gulosa
+from controle import ExecucaoEsgotada
+from registros import criar_registro
+from aleatorio import SequenciaSementes, gerador
 
-def gerar_solucao_aleatoria(n):
+def gerar_solucao_aleatoria(n, rng=None):
     """Gera uma solução inicial aleatória usando utils."""
-    return gerar_solucao_binaria(n)
+    return gerar_solucao_binaria(n, rng)
 
-def inicializar_populacao_abelhas(n_abelhas, n_itens):
+def inicializar_populacao_abelhas(n_abelhas, n_itens, rng=None):
     """Inicializa a população de abelhas com soluções aleatórias."""
-    return [gerar_solucao_aleatoria(n_itens) for _ in range(n_abelhas)]
+    return [gerar_solucao_aleatoria(n_itens, rng) for _ in range(n_abelhas)]
 
-def avaliar_populacao(abelhas, pesos, valores, capacidade):
+def avaliar_populacao(abelhas, pesos, valores, capacidade, avaliar=None):
     """Avalia toda a população de abelhas e retorna lista com avaliações."""
+    avaliar = avaliar or avaliar_solucao
     avaliacoes = []
     for abelha in abelhas:
         solucao = abelha
-        valor, peso = avaliar_solucao(solucao, pesos, valores, capacidade)
+        valor, peso = avaliar(solucao, pesos, valores, capacidade)
         avaliacoes.append((solucao, valor, peso))
     return avaliacoes
 
@@ -26,31 +29,301 @@ def selecionar_melhores_abelhas(avaliacoes, n_melhores):
     avaliacoes_ordenadas = sorted(avaliacoes, key=lambda x: x[1], reverse=True)
     return avaliacoes_ordenadas[:n_melhores]
 
-def explorar_vizinhanca(solucao, n_vizinhos, pesos, valores, capacidade):
-    """Explora a vizinhança de uma solução e retorna a melhor encontrada."""
-    vizinhos = [gerar_vizinho(solucao) for _ in range(n_vizinhos)]
-    vizinhos.append(solucao)  # Inclui a solução atual
+def explorar_vizinhanca(solucao, n_vizinhos, pesos, valores, capacidade, avaliar=None, rng=None, avaliacao=None):
+    """
+    Explora a vizinhança de uma solução e retorna a melhor encontrada.
+    Com avaliacao=(valor, peso) já conhecidos, a solução atual não é reavaliada.
+    """
+    avaliar = avaliar or avaliar_solucao
+    vizinhos = [gerar_vizinho(solucao, rng) for _ in range(n_vizinhos)]
+    if avaliacao is None:
+        vizinhos.append(solucao)  # Inclui a solução atual
 
     vizinhos_avaliados = []
     for vizinho in vizinhos:
-        valor, peso = avaliar_solucao(vizinho, pesos, valores, capacidade)
+        valor, peso = avaliar(vizinho, pesos, valores, capacidade)
         vizinhos_avaliados.append((vizinho, valor, peso))
+    if avaliacao is not None:
+        vizinhos_avaliados.append((solucao, avaliacao[0], avaliacao[1]))
 
     return max(vizinhos_avaliados, key=lambda x: x[1])
 
-def executar_busca_local(melhores_abelhas, n_vizinhos, pesos, valores, capacidade):
+def executar_busca_local(melhores_abelhas, n_vizinhos, pesos, valores, capacidade, avaliar=None, rng=None):
     """Executa busca local para cada uma das melhores abelhas."""
     novas_solucoes = []
     for solucao, _, _ in melhores_abelhas:
-        melhor_vizinho = explorar_vizinhanca(solucao, n_vizinhos, pesos, valores, capacidade)
+        melhor_vizinho = explorar_vizinhanca(solucao, n_vizinhos, pesos, valores, capacidade, avaliar, rng)
         novas_solucoes.append(melhor_vizinho)
     return novas_solucoes
 
+# Instância anexada pelos workers do pool de busca local
+_instancia_worker = {}
+
+def _anexar_instancia_worker(referencia):
+    """Inicializador dos workers: anexa pesos e valores a partir da memória compartilhada."""
+    from memoria_compartilhada import anexar_instancia
+
+    pesos, valores, capacidade = anexar_instancia(referencia, numpy=False)
+    _instancia_worker.update(pesos=pesos, valores=valores, capacidade=capacidade)
+
+def _explorar_sitio_worker(tarefa):
+    """Explora a vizinhança de um sítio no worker, com o fluxo aleatório próprio do sítio."""
+    solucao, n_vizinhos, sementes_sitio, avaliacao = tarefa
+    return explorar_vizinhanca(
+        solucao, n_vizinhos, _instancia_worker['pesos'], _instancia_worker['valores'],
+        _instancia_worker['capacidade'], rng=sementes_sitio.criar_gerador(), avaliacao=avaliacao
+    )
+
+class ExploradorParalelo:
+    """
+    Pool de workers para a busca local, com a instância em memória compartilhada.
+
+    Pesos e valores são copiados uma única vez para um segmento compartilhado
+    (memoria_compartilhada.InstanciaCompartilhada) e anexados, sem cópia, por
+    cada worker na inicialização; as tarefas carregam apenas a
+    solução do sítio. Cada sítio sorteia no seu próprio gerador, derivado da
+    semente raiz pelo caminho (iteracao, indice) (ver aleatorio.SequenciaSementes),
+    de modo que o resultado não depende do número de workers nem da ordem de
+    execução e nenhum worker altera o estado global de random. Sem semente, a
+    raiz é sorteada de rng (padrão: o módulo random).
+    """
+
+    def __init__(self, pesos, valores, capacidade, n_workers, semente=None, rng=None):
+        # Importado aqui: memoria_compartilhada traz o numpy, dispensável no modo sequencial
+        from memoria_compartilhada import InstanciaCompartilhada
+
+        if semente is None:
+            semente = gerador(rng).getrandbits(128)
+        self.sementes = SequenciaSementes(semente)
+        self._instancia = InstanciaCompartilhada(pesos, valores, capacidade)
+        try:
+            self._pool = Pool(n_workers, initializer=_anexar_instancia_worker, initargs=(self._instancia.referencia,))
+        except BaseException:
+            self._instancia.fechar()
+            raise
+
+    def explorar(self, solucoes, n_recrutas, iteracao, avaliacoes=None):
+        """
+        Explora os sítios em paralelo e retorna o melhor vizinho de cada um.
+        avaliacoes traz os (valor, peso) já conhecidos dos sítios, que então não são reavaliados.
+        """
+        if avaliacoes is None:
+            avaliacoes = [None] * len(solucoes)
+        tarefas = [
+            (solucao, recrutas, self.sementes.filha(iteracao, i), avaliacao)
+            for i, (solucao, recrutas, avaliacao) in enumerate(zip(solucoes, n_recrutas, avaliacoes))
+        ]
+        return self._pool.map(_explorar_sitio_worker, tarefas)
+
+    def fechar(self):
+        """Encerra os workers e libera o segmento de memória compartilhada."""
+        self._pool.terminate()
+        self._pool.join()
+        self._instancia.fechar()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.fechar()
+
+def executar_busca_local_paralela(melhores_abelhas, n_vizinhos, explorador, iteracao):
+    """Executa a busca local das melhores abelhas no pool paralelo."""
+    solucoes = [solucao for solucao, _, _ in melhores_abelhas]
+    return explorador.explorar(solucoes, [n_vizinhos] * len(solucoes), iteracao)
+
 def encontrar_melhor_solucao_global(todas_solucoes):
     """Encontra a melhor solução global dentre todas as soluções encontradas."""
     return max(todas_solucoes, key=lambda x: x[1])
 
-def bee_algorithm(pesos, valores, capacidade, n_abelhas=30, n_melhores=10, n_vizinhos=2, n_iter=50):
+def atualizar_incumbente(incumbente, novas_solucoes):
+    """Compara as soluções da iteração com a melhor corrente e indica se houve melhoria."""
+    melhor_iteracao = encontrar_melhor_solucao_global(novas_solucoes)
+    if incumbente is None or melhor_iteracao[1] > incumbente[1]:
+        return melhor_iteracao, True
+    return incumbente, False
+
+def gerar_escoteiras(n_escoteiras, n_itens, pesos, valores, capacidade, avaliar=None, rng=None):
+    """Gera e avalia as abelhas escoteiras (soluções aleatórias)."""
+    escoteiras = inicializar_populacao_abelhas(n_escoteiras, n_itens, rng)
+    return avaliar_populacao(escoteiras, pesos, valores, capacidade, avaliar)
+
+def explorar_sitios(sitios, estagnacao, n_elite, n_vizinhos_elite, n_vizinhos, pesos, valores, capacidade,
+                    explorador=None, iteracao=0, avaliar=None, rng=None):
+    """
+    Explora a vizinhança de cada sítio, recrutando mais abelhas para os sítios elite.
+    O valor e o peso de cada sítio são reaproveitados, sem reavaliá-lo.
+    """
+    n_recrutas = [n_vizinhos_elite if i < n_elite else n_vizinhos for i in range(len(sitios))]
+    avaliacoes = [(valor, peso) for _, valor, peso in sitios]
+    if explorador is not None:
+        melhores_vizinhos = explorador.explorar([sitio[0] for sitio in sitios], n_recrutas, iteracao, avaliacoes)
+    else:
+        melhores_vizinhos = [
+            explorar_vizinhanca(solucao, recrutas, pesos, valores, capacidade, avaliar, rng, avaliacao)
+            for (solucao, _, _), recrutas, avaliacao in zip(sitios, n_recrutas, avaliacoes)
+        ]
+
+    for i, melhor_vizinho in enumerate(melhores_vizinhos):
+        if melhor_vizinho[1] > sitios[i][1]:
+            sitios[i] = melhor_vizinho
+            estagnacao[i] = 0
+        else:
+            estagnacao[i] += 1
+
+def abandonar_sitios_estagnados(sitios, estagnacao, limite_estagnacao):
+    """Abandona os sítios que não melhoram há limite_estagnacao iterações."""
+    mantidos = [i for i in range(len(sitios)) if estagnacao[i] < limite_estagnacao]
+    return [sitios[i] for i in mantidos], [estagnacao[i] for i in mantidos]
+
+def recrutar_sitios(sitios, estagnacao, escoteiras, n_melhores):
+    """Combina os sítios persistentes com as escoteiras e mantém os n_melhores."""
+    candidatos = list(zip(sitios, estagnacao)) + [(escoteira, 0) for escoteira in escoteiras]
+    candidatos.sort(key=lambda x: x[0][1], reverse=True)
+    candidatos = candidatos[:n_melhores]
+    return [sitio for sitio, _ in candidatos], [contador for _, contador in candidatos]
+
+def _iterar_populacao_regenerada(pesos, valores, capacidade, n_abelhas, n_melhores, n_vizinhos, n_iter,
+                                 explorador=None, avaliar=None, populacao_inicial=None, rng=None,
+                                 ao_concluir_iteracao=None):
+    """Versão original: toda a população é regenerada a cada iteração."""
+    n_itens = len(pesos)
+    incumbente = None
+
+    for iteracao in range(n_iter):
+        # Fase 1: Inicializar população de abelhas (a primeira pode vir da partida gulosa)
+        if iteracao == 0 and populacao_inicial is not None:
+            populacao_abelhas = populacao_inicial
+        else:
+            populacao_abelhas = inicializar_populacao_abelhas(n_abelhas, n_itens, rng)
+
+        # Fase 2: Avaliar população
+        avaliacoes = avaliar_populacao(populacao_abelhas, pesos, valores, capacidade, avaliar)
+
+        # Fase 3: Selecionar melhores abelhas
+        melhores_abelhas = selecionar_melhores_abelhas(avaliacoes, n_melhores)
+
+        # Fase 4: Executar busca local nas melhores soluções
+        if explorador is not None:
+            novas_solucoes = executar_busca_local_paralela(melhores_abelhas, n_vizinhos, explorador, iteracao)
+        else:
+            novas_solucoes = executar_busca_local(
+                melhores_abelhas, n_vizinhos, pesos, valores, capacidade, avaliar, rng
+            )
+
+        # Fase 5: Atualizar a melhor solução corrente
+        incumbente, melhorou = atualizar_incumbente(incumbente, novas_solucoes)
+        if melhorou:
+            yield iteracao, incumbente[0], incumbente[1], incumbente[2]
+        if ao_concluir_iteracao is not None:
+            ao_concluir_iteracao(iteracao)
+
+def _iterar_populacao_persistente(pesos, valores, capacidade, n_abelhas, n_melhores, n_vizinhos, n_iter,
+                                  n_elite, n_vizinhos_elite, limite_estagnacao, explorador=None, avaliar=None,
+                                  populacao_inicial=None, rng=None, ao_concluir_iteracao=None):
+    """Versão padrão do BA: sítios persistem e apenas as escoteiras são regeneradas."""
+    n_itens = len(pesos)
+    incumbente = None
+
+    # Fase 1: População inicial (aleatória ou da partida gulosa) e seleção dos sítios
+    if populacao_inicial is not None:
+        avaliacoes = avaliar_populacao(populacao_inicial, pesos, valores, capacidade, avaliar)
+    else:
+        avaliacoes = gerar_escoteiras(n_abelhas, n_itens, pesos, valores, capacidade, avaliar, rng)
+    sitios = selecionar_melhores_abelhas(avaliacoes, n_melhores)
+    estagnacao = [0] * len(sitios)
+
+    for iteracao in range(n_iter):
+        # Fase 2: Busca local nos sítios (elite recebe mais recrutas)
+        explorar_sitios(
+            sitios, estagnacao, n_elite, n_vizinhos_elite, n_vizinhos, pesos, valores, capacidade,
+            explorador, iteracao, avaliar, rng
+        )
+
+        # Fase 3: Atualizar a melhor solução corrente
+        incumbente, melhorou = atualizar_incumbente(incumbente, sitios)
+        if melhorou:
+            yield iteracao, incumbente[0], incumbente[1], incumbente[2]
+
+        # Fase 4: Abandonar sítios estagnados
+        sitios, estagnacao = abandonar_sitios_estagnados(sitios, estagnacao, limite_estagnacao)
+
+        # Fase 5: Regenerar apenas as escoteiras e recrutar os novos sítios
+        escoteiras = gerar_escoteiras(n_abelhas - len(sitios), n_itens, pesos, valores, capacidade, avaliar, rng)
+        sitios, estagnacao = recrutar_sitios(sitios, estagnacao, escoteiras, n_melhores)
+        if ao_concluir_iteracao is not None:
+            ao_concluir_iteracao(iteracao)
+
+def iterar_bee_algorithm(pesos, valores, capacidade, n_abelhas=30, n_melhores=10, n_vizinhos=2, n_iter=50,
+                         persistente=False, n_elite=None, n_vizinhos_elite=None, limite_estagnacao=10,
+                         n_workers=None, semente=None, avaliar=None, partida_gulosa=False, rng=None,
+                         ao_concluir_iteracao=None):
+    """
+    Executa o Algoritmo das Abelhas produzindo cada nova melhor solução encontrada.
+
+    Mantém apenas a melhor solução corrente, de modo que a memória usada é O(n)
+    independentemente do número de iterações.
+
+    Com persistente=True os sítios selecionados sobrevivem entre iterações, os
+    n_elite melhores recebem n_vizinhos_elite recrutas (padrão: 2 * n_vizinhos),
+    sítios sem melhoria por limite_estagnacao iterações são abandonados e apenas
+    as n_abelhas - n_melhores escoteiras são geradas e avaliadas a cada iteração.
+
+    Com n_workers definido, a busca local dos sítios é distribuída em um pool de
+    processos (ver ExploradorParalelo), reprodutível a partir de semente (sem
+    semente, a raiz é sorteada de rng); os workers sempre usam
+    utils.avaliar_solucao. Os demais sorteios usam rng (padrão: o módulo random).
+
+    Com partida_gulosa=True a população inicial é a solução gulosa por razão
+    valor/peso e perturbações reparadas dela (ver partida_gulosa.py).
+
+    ao_concluir_iteracao(iteracao), se informado, é chamado ao fim de cada
+    iteração, haja ou não melhoria.
+
+    Yields:
+        Tuplas (iteracao, solucao, valor, peso) sempre que a melhor solução melhora
+    """
+    populacao_inicial = gerar_populacao_gulosa(n_abelhas, pesos, valores, capacidade, rng=rng) if partida_gulosa \
+        else None
+    if n_workers is not None:
+        with ExploradorParalelo(pesos, valores, capacidade, n_workers, semente, rng) as explorador:
+            yield from _iterar_bee_algorithm(
+                pesos, valores, capacidade, n_abelhas, n_melhores, n_vizinhos, n_iter,
+                persistente, n_elite, n_vizinhos_elite, limite_estagnacao, explorador, avaliar, populacao_inicial,
+                rng, ao_concluir_iteracao
+            )
+        return
+
+    yield from _iterar_bee_algorithm(
+        pesos, valores, capacidade, n_abelhas, n_melhores, n_vizinhos, n_iter,
+        persistente, n_elite, n_vizinhos_elite, limite_estagnacao, avaliar=avaliar,
+        populacao_inicial=populacao_inicial, rng=rng, ao_concluir_iteracao=ao_concluir_iteracao
+    )
+
+def _iterar_bee_algorithm(pesos, valores, capacidade, n_abelhas, n_melhores, n_vizinhos, n_iter,
+                          persistente, n_elite, n_vizinhos_elite, limite_estagnacao, explorador=None, avaliar=None,
+                          populacao_inicial=None, rng=None, ao_concluir_iteracao=None):
+    """Seleciona a variante do algoritmo (regenerada ou persistente)."""
+    if not persistente:
+        yield from _iterar_populacao_regenerada(
+            pesos, valores, capacidade, n_abelhas, n_melhores, n_vizinhos, n_iter, explorador, avaliar,
+            populacao_inicial, rng, ao_concluir_iteracao
+        )
+        return
+
+    if n_elite is None:
+        n_elite = max(1, n_melhores // 3)
+    if n_vizinhos_elite is None:
+        n_vizinhos_elite = 2 * n_vizinhos
+    yield from _iterar_populacao_persistente(
+        pesos, valores, capacidade, n_abelhas, n_melhores, n_vizinhos, n_iter,
+        n_elite, n_vizinhos_elite, limite_estagnacao, explorador, avaliar, populacao_inicial, rng,
+        ao_concluir_iteracao
+    )
+
+def bee_algorithm(pesos, valores, capacidade, n_abelhas=30, n_melhores=10, n_vizinhos=2, n_iter=50,
+                  callback=None, persistente=False, n_elite=None, n_vizinhos_elite=None, limite_estagnacao=10,
+                  n_workers=None, semente=None, avaliar=None, controle=None, partida_gulosa=False, rng=None):
     """
     Implementa o Algoritmo das Abelhas para o Problema da Mochila 0/1.
 
@@ -62,52 +335,63 @@ def bee_algorithm(pesos, valores, capacidade, n_abelhas=30, n_melhores=10, n_viz
         n_melhores: Número de melhores abelhas selecionadas
         n_vizinhos: Número de vizinhos explorados por cada abelha
         n_iter: Número de iterações
+        callback: Função opcional chamada com (iteracao, solucao, valor, peso)
+            a cada nova melhor solução
+        persistente: Mantém os sítios entre iterações e regenera só as escoteiras
+        n_elite: Número de sítios elite (modo persistente)
+        n_vizinhos_elite: Recrutas por sítio elite (modo persistente)
+        limite_estagnacao: Iterações sem melhoria até abandonar um sítio (modo persistente)
+        n_workers: Número de processos para a busca local paralela (None = sequencial)
+        semente: Semente raiz dos fluxos aleatórios de cada sítio (modo paralelo;
+            padrão: sorteada de rng)
+        avaliar: Backend de avaliação com a assinatura de utils.avaliar_solucao
+        controle: ControleExecucao opcional (prazo, orçamento de avaliações e
+            notificação de melhorias); ao esgotar, retorna a melhor solução até ali.
+            No modo paralelo só as avaliações do processo principal são contadas
+        partida_gulosa: População inicial com a solução gulosa por razão
+            valor/peso e perturbações reparadas dela (ver partida_gulosa.py)
+        rng: Gerador aleatório do processo principal (padrão: o módulo random;
+            ver aleatorio.py)
 
     Returns:
         Tupla contendo (solução, valor, peso)
     """
-    n_itens = len(pesos)
-    todas_solucoes = []
-
-    for iteracao in range(n_iter):
-        # Fase 1: Inicializar população de abelhas
-        populacao_abelhas = inicializar_populacao_abelhas(n_abelhas, n_itens)
-
-        # Fase 2: Avaliar população
-        avaliacoes = avaliar_populacao(populacao_abelhas, pesos, valores, capacidade)
+    melhor_global = None
+    ao_concluir_iteracao = None
+    if controle is not None:
+        avaliar = controle.envolver(avaliar)
+        ao_concluir_iteracao = controle.concluir_iteracao
 
-        # Fase 3: Selecionar melhores abelhas
-        melhores_abelhas = selecionar_melhores_abelhas(avaliacoes, n_melhores)
-
-        # Fase 4: Executar busca local nas melhores soluções
-        novas_solucoes = executar_busca_local(melhores_abelhas, n_vizinhos, pesos, valores, capacidade)
-
-        # Fase 5: Armazenar soluções encontradas
-        todas_solucoes.extend(novas_solucoes)
+    try:
+        for iteracao, solucao, valor, peso in iterar_bee_algorithm(
+            pesos, valores, capacidade, n_abelhas, n_melhores, n_vizinhos, n_iter,
+            persistente, n_elite, n_vizinhos_elite, limite_estagnacao, n_workers, semente, avaliar,
+            partida_gulosa=partida_gulosa, rng=rng, ao_concluir_iteracao=ao_concluir_iteracao
+        ):
+            melhor_global = (solucao, valor, peso)
+            if callback is not None:
+                callback(iteracao, solucao, valor, peso)
+            if controle is not None:
+                controle.registrar(valor, peso)
+    except ExecucaoEsgotada:
+        pass
 
-    # Fase 6: Encontrar melhor solução global
-    melhor_global = encontrar_melhor_solucao_global(todas_solucoes)
+    if melhor_global is None:  # Esgotado antes da primeira iteração: mochila vazia
+        melhor_global = ([0] * len(pesos), 0, 0)
     return melhor_global[0], melhor_global[1], melhor_global[2]
 
 def gerar_instancia_aleatoria_abelha(num_itens, max_peso=10, max_valor=50):
     """Gera uma instância aleatória do Problema da Mochila usando utils."""
     return gerar_instancia_aleatoria(num_itens, max_peso, max_valor)
 
-def criar_resultado_teste(algoritmo_nome, n_itens, capacidade, valor, peso, tempo_execucao, pesos, valores, solucao):
-    """Cria um dicionário com os resultados de um teste."""
-    return {
-        "algoritmo": algoritmo_nome,
-        "n_itens": n_itens,
-        "capacidade": capacidade,
-        "valor_total": valor,
-        "peso_total": peso,
-        "tempo_execucao": round(tempo_execucao, 5),
-        "pesos": pesos,
-        "valores": valores,
-        "melhor_solucao": solucao
-    }
-
-def executar_teste_para_instancia(n_itens):
+def criar_resultado_teste(algoritmo_nome, n_itens, capacidade, valor, peso, tempo_execucao, pesos, valores, solucao,
+                          catalogo=None):
+    """Cria o registro com os resultados de um teste."""
+    return criar_registro(
+        algoritmo_nome, n_itens, capacidade, valor, peso, tempo_execucao, pesos, valores, solucao, catalogo=catalogo
+    )
+
+def executar_teste_para_instancia(n_itens, catalogo=None):
     """Executa um teste completo para uma instância com n_itens."""
     pesos, valores, capacidade = gerar_instancia_aleatoria_abelha(n_itens)
 
@@ -119,16 +403,25 @@ def executar_teste_para_instancia(n_itens):
 
     return criar_resultado_teste(
         "Bee Algorithm", n_itens, capacidade, valor, peso,
-        tempo_execucao, pesos, valores, solucao
+        tempo_execucao, pesos, valores, solucao, catalogo
     )
 
-def main():
-    """Função principal que executa os testes para diferentes tamanhos de instância."""
+def main(ao_concluir=None, catalogo=None, concluidos=()):
+    """
+    Função principal que executa os testes para diferentes tamanhos de instância.
+    ao_concluir(resultado) é chamado com cada registro assim que ele termina, e os
+    tamanhos em concluidos (varredura retomada) não são executados. Com um
+    CatalogoInstancias (registros.py), os registros guardam as instâncias nele.
+    """
     tamanhos_instancia = [5, 1000, 10000]
     resultados_testes = []
 
     for n_itens in tamanhos_instancia:
-        resultado = executar_teste_para_instancia(n_itens)
+        if n_itens in concluidos:
+            continue
+        resultado = executar_teste_para_instancia(n_itens, catalogo)
         resultados_testes.append(resultado)
+        if ao_concluir is not None:
+            ao_concluir(resultado)
 
-    return pd.DataFrame(resultados_testes)
\ No newline at end of file
+    return resultados_testes
\ No newline at end of file
@@ -1,5 +1,9 @@
+import os
+import subprocess
+import sys
 import pytest
 import random
+from multiprocessing import shared_memory
 from unittest.mock import patch, MagicMock
 from beeAlgorithm_ref import (
     gerar_solucao_aleatoria,
@@ -10,8 +14,18 @@ from beeAlgorithm_ref import (
     executar_busca_local,
     encontrar_melhor_solucao_global,
     bee_algorithm,
-    criar_resultado_teste
+    criar_resultado_teste,
+    atualizar_incumbente,
+    iterar_bee_algorithm,
+    explorar_sitios,
+    abandonar_sitios_estagnados,
+    recrutar_sitios,
+    ExploradorParalelo
 )
+from registros import CatalogoInstancias
+from controle import ControleExecucao
+
+RAIZ = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
 
 
 class TestBeeAlgorithm:
@@ -32,7 +46,7 @@ class TestBeeAlgorithm:
         
         solucao = gerar_solucao_aleatoria(self.n_itens)
         
-        mock_gerar.assert_called_once_with(self.n_itens)
+        mock_gerar.assert_called_once_with(self.n_itens, None)
         assert solucao == [1, 0, 1, 0]
     
     def test_inicializar_populacao_abelhas(self):
@@ -229,7 +243,7 @@ class TestBeeAlgorithm:
         """Testa a criação do dicionário de resultados"""
         resultado = criar_resultado_teste(
             "Bee Algorithm", 10, 100, 50, 20, 0.12345,
-            [1, 2, 3], [10, 20, 30], [1, 0, 1]
+            [1, 2, 3], [10, 20, 30], [1, 0, 1], catalogo=CatalogoInstancias()
         )
         
         assert resultado["algoritmo"] == "Bee Algorithm"
@@ -270,4 +284,177 @@ class TestBeeAlgorithm:
             valores_por_iteracao.append(valor)
         
         # Verifica se há uma tendência de melhoria (não estritamente crescente devido à aleatoriedade)
-        assert max(valores_por_iteracao) >= valores_por_iteracao[0]
\ No newline at end of file
+        assert max(valores_por_iteracao) >= valores_por_iteracao[0]
+
+    def test_atualizar_incumbente(self):
+        """Testa a atualização da melhor solução corrente"""
+        incumbente, melhorou = atualizar_incumbente(None, [([1, 0, 0, 0], 12, 2)])
+        assert incumbente == ([1, 0, 0, 0], 12, 2)
+        assert melhorou
+
+        incumbente, melhorou = atualizar_incumbente(incumbente, [([0, 1, 0, 0], 10, 1)])
+        assert incumbente == ([1, 0, 0, 0], 12, 2)
+        assert not melhorou
+
+        incumbente, melhorou = atualizar_incumbente(incumbente, [([1, 0, 1, 0], 32, 5)])
+        assert incumbente == ([1, 0, 1, 0], 32, 5)
+        assert melhorou
+
+    def test_iterar_bee_algorithm_melhorias_crescentes(self):
+        """Testa que o gerador só produz melhorias estritas da melhor solução"""
+        melhorias = list(iterar_bee_algorithm(
+            self.pesos, self.valores, self.capacidade,
+            n_abelhas=10, n_melhores=3, n_vizinhos=2, n_iter=10
+        ))
+
+        assert len(melhorias) >= 1
+        assert melhorias[0][0] == 0
+        valores = [valor for _, _, valor, _ in melhorias]
+        assert valores == sorted(set(valores))
+
+    def test_bee_algorithm_callback(self):
+        """Testa que o callback recebe as melhorias e a última corresponde ao retorno"""
+        chamadas = []
+
+        solucao, valor, peso = bee_algorithm(
+            self.pesos, self.valores, self.capacidade,
+            n_abelhas=10, n_melhores=3, n_vizinhos=2, n_iter=10,
+            callback=lambda *args: chamadas.append(args)
+        )
+
+        assert len(chamadas) >= 1
+        assert chamadas[-1][1:] == (solucao, valor, peso)
+
+    def test_explorar_sitios_elite_e_estagnacao(self):
+        """Testa o recrutamento diferenciado dos sítios elite e o contador de estagnação"""
+        sitios = [([1, 0, 1, 0], 32, 5), ([0, 1, 0, 1], 25, 3)]
+        estagnacao = [0, 3]
+
+        with patch('beeAlgorithm_ref.explorar_vizinhanca') as mock_explorar:
+            mock_explorar.side_effect = [
+                ([1, 0, 1, 0], 32, 5),  # Elite sem melhoria
+                ([1, 1, 0, 1], 37, 4)   # Sítio comum melhorado
+            ]
+
+            explorar_sitios(sitios, estagnacao, 1, 4, 2, self.pesos, self.valores, self.capacidade)
+
+            assert mock_explorar.call_args_list[0][0][1] == 4
+            assert mock_explorar.call_args_list[1][0][1] == 2
+
+        assert sitios[1] == ([1, 1, 0, 1], 37, 4)
+        assert estagnacao == [1, 0]
+
+    def test_abandonar_e_recrutar_sitios(self):
+        """Testa o abandono de sítios estagnados e o recrutamento das escoteiras"""
+        sitios = [([1, 0, 1, 0], 32, 5), ([0, 1, 0, 1], 25, 3), ([1, 0, 0, 0], 12, 2)]
+        sitios, estagnacao = abandonar_sitios_estagnados(sitios, [5, 1, 2], 5)
+
+        assert sitios == [([0, 1, 0, 1], 25, 3), ([1, 0, 0, 0], 12, 2)]
+        assert estagnacao == [1, 2]
+
+        escoteiras = [([0, 0, 1, 0], 20, 3), ([0, 1, 0, 0], 10, 1)]
+        sitios, estagnacao = recrutar_sitios(sitios, estagnacao, escoteiras, 3)
+
+        assert [valor for _, valor, _ in sitios] == [25, 20, 12]
+        assert estagnacao == [1, 0, 2]
+
+    def test_bee_algorithm_persistente_regenera_apenas_escoteiras(self):
+        """Testa que o modo persistente só gera soluções aleatórias para as escoteiras"""
+        with patch('beeAlgorithm_ref.gerar_solucao_aleatoria', wraps=lambda n, rng=None: [0] * n) as mock_gerar:
+            bee_algorithm(
+                self.pesos, self.valores, self.capacidade,
+                n_abelhas=10, n_melhores=4, n_vizinhos=2, n_iter=5,
+                persistente=True, limite_estagnacao=100
+            )
+
+        # 10 na população inicial + 6 escoteiras por iteração
+        assert mock_gerar.call_count == 10 + 5 * 6
+
+    def test_bee_algorithm_persistente_nao_reavalia_sitios(self):
+        """Testa que o modo persistente avalia só os recrutas e as escoteiras, nunca os próprios sítios"""
+        controle = ControleExecucao()
+        bee_algorithm(
+            self.pesos, self.valores, self.capacidade,
+            n_abelhas=10, n_melhores=4, n_vizinhos=2, n_iter=5,
+            persistente=True, limite_estagnacao=100, controle=controle
+        )
+
+        # 10 na população inicial + por iteração: 4 recrutas do sítio elite, 2 de cada
+        # um dos outros 3 sítios e 6 escoteiras
+        assert controle.avaliacoes == 10 + 5 * (4 + 3 * 2 + 6)
+
+    def test_bee_algorithm_persistente_solucao_valida(self):
+        """Testa o modo persistente em uma instância maior"""
+        n_itens = 50
+        pesos = [random.randint(1, 10) for _ in range(n_itens)]
+        valores = [random.randint(1, 50) for _ in range(n_itens)]
+        capacidade = sum(pesos) // 3
+
+        solucao, valor, peso = bee_algorithm(
+            pesos, valores, capacidade,
+            n_abelhas=20, n_melhores=8, n_vizinhos=3, n_iter=20,
+            persistente=True, n_elite=2, limite_estagnacao=3
+        )
+
+        assert len(solucao) == n_itens
+        assert peso <= capacidade
+        assert valor == sum(v * s for v, s in zip(valores, solucao))
+
+    def test_explorador_paralelo_reprodutivel(self):
+        """Testa que a exploração paralela é reprodutível e independente do número de workers"""
+        solucoes = [[1, 0, 0, 0], [0, 1, 0, 1], [0, 0, 1, 0]]
+
+        with ExploradorParalelo(self.pesos, self.valores, self.capacidade, 1, semente=7) as explorador:
+            resultado1 = explorador.explorar(solucoes, [2, 2, 2], iteracao=3)
+        with ExploradorParalelo(self.pesos, self.valores, self.capacidade, 2, semente=7) as explorador:
+            resultado2 = explorador.explorar(solucoes, [2, 2, 2], iteracao=3)
+            nome_memoria = explorador._instancia.referencia.nome
+
+        assert resultado1 == resultado2
+        for vizinho, _, peso in resultado1:
+            assert peso == sum(p * s for p, s in zip(self.pesos, vizinho))
+
+        # O segmento compartilhado é liberado ao sair do contexto
+        with pytest.raises(FileNotFoundError):
+            shared_memory.SharedMemory(name=nome_memoria)
+
+    def test_bee_algorithm_paralelo(self):
+        """Testa o algoritmo com busca local paralela nos dois modos"""
+        for persistente in (False, True):
+            random.seed(1)
+            resultado1 = bee_algorithm(
+                self.pesos, self.valores, self.capacidade,
+                n_abelhas=10, n_melhores=3, n_vizinhos=2, n_iter=4,
+                persistente=persistente, n_workers=2, semente=11
+            )
+            random.seed(1)
+            resultado2 = bee_algorithm(
+                self.pesos, self.valores, self.capacidade,
+                n_abelhas=10, n_melhores=3, n_vizinhos=2, n_iter=4,
+                persistente=persistente, n_workers=1, semente=11
+            )
+
+            assert resultado1 == resultado2
+            assert resultado1[2] <= self.capacidade
+
+    def test_bee_algorithm_paralelo_segue_rng(self):
+        """Testa que, sem semente, os fluxos dos sítios derivam do rng da execução"""
+        resultados = [
+            bee_algorithm(self.pesos, self.valores, self.capacidade, n_abelhas=10, n_melhores=3, n_vizinhos=2,
+                          n_iter=4, n_workers=n_workers, rng=random.Random(5))
+            for n_workers in (1, 2)
+        ]
+        assert resultados[0] == resultados[1]
+        with patch.object(random.Random, "getrandbits", return_value=11) as getrandbits:
+            with ExploradorParalelo(self.pesos, self.valores, self.capacidade, 1, rng=random.Random(5)) as explorador:
+                assert explorador.sementes.entropia == 11
+        getrandbits.assert_called_once_with(128)
+
+    def test_importar_sem_numpy(self):
+        """Testa que importar o módulo não carrega o numpy (só o modo paralelo precisa dele)"""
+        codigo = (
+            "import sys\n"
+            "import bee_algorithm.beeAlgorithm_ref\n"
+            "assert 'numpy' not in sys.modules\n"
+        )
+        subprocess.run([sys.executable, "-c", codigo], check=True, cwd=RAIZ)
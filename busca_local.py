@@ -0,0 +1,271 @@
+import heapq
+import math
+from bisect import bisect_right
+from partida_gulosa import ordenar_por_razao
+
+# Estratégias de aceitação: primeiro movimento que melhora ou o melhor da vizinhança
+ESTRATEGIAS = ("primeira", "melhor")
+# Tamanho das listas de candidatos da troca 1-1 (itens dentro de pior razão x itens fora de melhor razão)
+N_CANDIDATOS = 32
+
+
+def calcular_totais(solucao, pesos, valores):
+    """Valor e peso brutos (sem penalização) da solução."""
+    valor = peso = 0
+    for i, s in enumerate(solucao):
+        if s:
+            valor += valores[i]
+            peso += pesos[i]
+    return valor, peso
+
+def remover_excesso(solucao, valor, peso, pesos, valores, capacidade, ordem):
+    """Remove, em lugar, os itens escolhidos de pior razão até a solução caber; retorna (valor, peso)."""
+    for i in reversed(ordem):
+        if peso <= capacidade:
+            break
+        if solucao[i]:
+            solucao[i] = 0
+            valor -= valores[i]
+            peso -= pesos[i]
+    return valor, peso
+
+def ordenar_por_peso(pesos):
+    """Índices dos itens em ordem crescente de peso."""
+    return sorted(range(len(pesos)), key=pesos.__getitem__)
+
+class _ArvoreMinimos:
+    """Árvore de segmentos de mínimos sobre posições fixas: atualização e consultas em O(log n)."""
+
+    def __init__(self, chaves, vazio):
+        self.vazio = vazio
+        self.tamanho = 1
+        while self.tamanho < len(chaves):
+            self.tamanho *= 2
+        self.nos = [vazio] * (2 * self.tamanho)
+        self.nos[self.tamanho:self.tamanho + len(chaves)] = chaves
+        for k in range(self.tamanho - 1, 0, -1):
+            self.nos[k] = min(self.nos[2 * k], self.nos[2 * k + 1])
+
+    def atualizar(self, posicao, chave):
+        nos = self.nos
+        k = posicao + self.tamanho
+        nos[k] = chave
+        k //= 2
+        while k:
+            minimo = nos[2 * k] if nos[2 * k] <= nos[2 * k + 1] else nos[2 * k + 1]
+            if nos[k] == minimo:  # Os ancestrais não mudam
+                break
+            nos[k] = minimo
+            k //= 2
+
+    def primeira_ate(self, limite):
+        """Menor posição com chave <= limite; None se não há."""
+        if self.nos[1] > limite:
+            return None
+        k = 1
+        while k < self.tamanho:
+            k = 2 * k if self.nos[2 * k] <= limite else 2 * k + 1
+        return k - self.tamanho
+
+    def minimo_prefixo(self, fim):
+        """Menor chave entre as posições [0, fim)."""
+        minimo = self.vazio
+        esquerda, direita = self.tamanho, self.tamanho + fim
+        while esquerda < direita:
+            if esquerda & 1:
+                minimo = min(minimo, self.nos[esquerda])
+                esquerda += 1
+            if direita & 1:
+                direita -= 1
+                minimo = min(minimo, self.nos[direita])
+            esquerda //= 2
+            direita //= 2
+        return minimo
+
+class IndiceMovimentos:
+    """
+    Índices incrementais dos movimentos de busca_local sobre uma solução.
+
+    Montados uma vez por busca em O(n) (mais a ordem por peso, com
+    ordem_peso=None na estratégia "melhor"), são atualizados por alternar() a
+    cada item que muda de lado. Assim a inclusão é escolhida em O(log n) e as
+    listas de candidatos em O(n_candidatos log n), sem varrer os n itens a
+    cada movimento: uma árvore de mínimos dá o primeiro item fora que cabe na
+    ordem de razão, outra (por peso) o de maior valor que cabe, e dois heaps
+    com remoção preguiçosa dão os itens dentro de pior razão e fora de melhor.
+    """
+
+    def __init__(self, solucao, pesos, valores, ordem, melhor=False, ordem_peso=None):
+        self.solucao = solucao
+        self.pesos = pesos
+        self.valores = valores
+        self.ordem = ordem
+        self.posicao = [0] * len(ordem)
+        for k, i in enumerate(ordem):
+            self.posicao[i] = k
+        self.por_razao = _ArvoreMinimos([self._chave_razao(i) for i in ordem], math.inf)
+        self.por_peso = None
+        if melhor:
+            self.ordem_peso = ordem_peso if ordem_peso is not None else ordenar_por_peso(pesos)
+            self.pesos_ordenados = [pesos[i] for i in self.ordem_peso]
+            self.posicao_peso = [0] * len(ordem)
+            for k, i in enumerate(self.ordem_peso):
+                self.posicao_peso[i] = k
+            self.por_peso = _ArvoreMinimos([self._chave_valor(i) for i in self.ordem_peso], (math.inf, math.inf))
+        # Heaps de posições em ordem: dentro com sinal trocado (pior razão no topo), fora (melhor razão no topo)
+        self.dentro = [-k for k, i in enumerate(ordem) if solucao[i]]
+        self.fora = [k for k, i in enumerate(ordem) if not solucao[i]]
+        heapq.heapify(self.dentro)
+        heapq.heapify(self.fora)
+
+    def _chave_razao(self, i):
+        return self.pesos[i] if not self.solucao[i] and self.valores[i] > 0 else math.inf
+
+    def _chave_valor(self, i):
+        return (-self.valores[i], i) if not self.solucao[i] and self.valores[i] > 0 else (math.inf, math.inf)
+
+    def alternar(self, i):
+        """Atualiza os índices depois que o item i entrou ou saiu da mochila."""
+        self.por_razao.atualizar(self.posicao[i], self._chave_razao(i))
+        if self.por_peso is not None:
+            self.por_peso.atualizar(self.posicao_peso[i], self._chave_valor(i))
+        if self.solucao[i]:
+            heapq.heappush(self.dentro, -self.posicao[i])
+        else:
+            heapq.heappush(self.fora, self.posicao[i])
+
+    def primeira_inclusao(self, folga):
+        """Primeiro item fora, na ordem de razão, de valor positivo que cabe na folga; None se não há."""
+        k = self.por_razao.primeira_ate(folga)
+        return None if k is None else self.ordem[k]
+
+    def melhor_inclusao(self, folga):
+        """Item fora de maior valor (o de menor índice, no empate) que cabe na folga; None se nenhum cabe."""
+        _, i = self.por_peso.minimo_prefixo(bisect_right(self.pesos_ordenados, folga))
+        return None if i == math.inf else i
+
+    def _topo(self, heap, n, dentro):
+        """Até n posições válidas do topo do heap, descartando as entradas obsoletas ou repetidas."""
+        topo = []
+        while heap and len(topo) < n:
+            chave = heapq.heappop(heap)
+            i = self.ordem[-chave if dentro else chave]
+            if bool(self.solucao[i]) == dentro and (not topo or chave != topo[-1]):
+                topo.append(chave)
+        for chave in topo:
+            heapq.heappush(heap, chave)
+        return [self.ordem[-chave if dentro else chave] for chave in topo]
+
+    def listas_candidatos(self, n_candidatos=N_CANDIDATOS):
+        """Até n_candidatos itens dentro (pior razão primeiro) e fora (melhor razão primeiro) da mochila."""
+        return self._topo(self.dentro, n_candidatos, True), self._topo(self.fora, n_candidatos, False)
+
+def buscar_troca(dentro, fora, peso, pesos, valores, capacidade, melhor=False):
+    """
+    Troca 1-1 (tira i de dentro, põe j de fora) que aumenta o valor e cabe; retorna (i, j, ganho) ou None.
+
+    Cada par é avaliado em O(1) a partir do peso total em cache. Com
+    melhor=False retorna o primeiro par que melhora, na ordem das listas.
+    """
+    escolhida = None
+    for i in dentro:
+        folga = capacidade - peso + pesos[i]
+        valor_i = valores[i]
+        for j in fora:
+            ganho = valores[j] - valor_i
+            if ganho > 0 and pesos[j] <= folga and (escolhida is None or ganho > escolhida[2]):
+                escolhida = (i, j, ganho)
+                if not melhor:
+                    return escolhida
+    return escolhida
+
+def busca_local(solucao, pesos, valores, capacidade, estrategia="primeira", ordem=None,
+                n_candidatos=N_CANDIDATOS, max_passos=None, totais=None, ordem_peso=None):
+    """
+    Melhora a solução, em lugar, com movimentos 1-flip e troca 1-1.
+
+    Uma solução inviável é primeiro reparada removendo os itens de pior razão.
+    Daí em diante a solução continua viável: um 1-flip inclui um item que cabe
+    (remover nunca aumenta o valor) e uma troca 1-1 substitui um item de dentro
+    por um de fora de valor maior. Valor e peso totais ficam em cache, de modo
+    que cada movimento é avaliado em O(1); as trocas consideram só as listas de
+    candidatos por razão valor/peso, e movimentos e candidatos são escolhidos
+    em índices atualizados a cada passo (IndiceMovimentos), sem varrer os n itens.
+
+    Args:
+        solucao: Lista binária, modificada em lugar
+        estrategia: "primeira" (aceita o primeiro movimento que melhora, na
+            ordem de razão) ou "melhor" (o de maior ganho na vizinhança)
+        ordem: Itens por razão decrescente (padrão: ordenar_por_razao)
+        n_candidatos: Tamanho das listas de candidatos das trocas
+        max_passos: Limite de movimentos aplicados (padrão: até o ótimo local)
+        totais: (valor, peso) brutos da solução, se já conhecidos
+        ordem_peso: Itens por peso crescente, para a estratégia "melhor"
+            (padrão: ordenar_por_peso)
+
+    Returns:
+        Tupla (solucao, valor, peso), com a solução viável
+    """
+    if estrategia not in ESTRATEGIAS:
+        raise ValueError(f"Estratégia de busca local desconhecida: {estrategia!r}")
+    if ordem is None:
+        ordem = ordenar_por_razao(pesos, valores)
+    valor, peso = totais if totais is not None else calcular_totais(solucao, pesos, valores)
+    valor, peso = remover_excesso(solucao, valor, peso, pesos, valores, capacidade, ordem)
+
+    if max_passos == 0:
+        return solucao, valor, peso
+    indice = IndiceMovimentos(solucao, pesos, valores, ordem, estrategia == "melhor", ordem_peso)
+
+    passos = 0
+    while max_passos is None or passos < max_passos:
+        if estrategia == "melhor":
+            j = indice.melhor_inclusao(capacidade - peso)
+            troca = buscar_troca(*indice.listas_candidatos(n_candidatos), peso, pesos, valores, capacidade,
+                                 melhor=True)
+            if troca is not None and (j is None or troca[2] > valores[j]):
+                j = None
+        else:
+            j = indice.primeira_inclusao(capacidade - peso)
+            troca = None if j is not None else buscar_troca(
+                *indice.listas_candidatos(n_candidatos), peso, pesos, valores, capacidade
+            )
+
+        if j is not None:
+            solucao[j] = 1
+            valor += valores[j]
+            peso += pesos[j]
+            indice.alternar(j)
+        elif troca is not None:
+            i, j, ganho = troca
+            solucao[i], solucao[j] = 0, 1
+            valor += ganho
+            peso += pesos[j] - pesos[i]
+            indice.alternar(i)
+            indice.alternar(j)
+        else:
+            break
+        passos += 1
+
+    return solucao, valor, peso
+
+def criar_busca_local(estrategia, pesos, valores, capacidade, **opcoes):
+    """
+    Passo memético para os algoritmos: melhorar(solucao, totais=None) -> (solucao, valor, peso).
+
+    As ordens por razão (e, na estratégia "melhor", por peso) são calculadas
+    uma única vez por instância. Retorna None
+    quando estrategia é None (busca local desligada).
+    """
+    if estrategia is None:
+        return None
+    if estrategia not in ESTRATEGIAS:
+        raise ValueError(f"Estratégia de busca local desconhecida: {estrategia!r}")
+    ordem = ordenar_por_razao(pesos, valores)
+    ordem_peso = ordenar_por_peso(pesos) if estrategia == "melhor" else None
+
+    def melhorar(solucao, totais=None):
+        return busca_local(
+            solucao, pesos, valores, capacidade, estrategia, ordem, totais=totais, ordem_peso=ordem_peso, **opcoes
+        )
+    return melhorar
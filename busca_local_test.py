@@ -0,0 +1,133 @@
+import pytest
+import random
+from itertools import product
+from utils import avaliar_solucao, gerar_instancia_aleatoria, gerar_solucao_binaria
+from busca_local import IndiceMovimentos, busca_local, calcular_totais, criar_busca_local
+from partida_gulosa import ordenar_por_razao
+from resolvedores import resolver
+import pso.algEnxParticulas_ref as modulo_pso
+
+
+def otimo_local(solucao, pesos, valores, capacidade):
+    """Confere que nenhum 1-flip nem troca 1-1 viável aumenta o valor."""
+    valor, peso = calcular_totais(solucao, pesos, valores)
+    fora = [j for j, s in enumerate(solucao) if not s]
+    dentro = [i for i, s in enumerate(solucao) if s]
+    if any(valores[j] > 0 and peso + pesos[j] <= capacidade for j in fora):
+        return False
+    return not any(
+        valores[j] > valores[i] and peso - pesos[i] + pesos[j] <= capacidade for i, j in product(dentro, fora)
+    )
+
+
+class TestBuscaLocal:
+    """Classe de testes para o kernel de busca local 1-flip / troca 1-1"""
+
+    def setup_method(self):
+        """Configuração executada antes de cada teste"""
+        random.seed(42)
+        self.pesos = [2, 1, 3, 2]
+        self.valores = [12, 10, 20, 15]
+        self.capacidade = 5
+
+    @pytest.mark.parametrize("estrategia", ["primeira", "melhor"])
+    def test_repara_e_melhora_solucao_inviavel(self, estrategia):
+        """Testa que a solução inviável é reparada e chega a um ótimo local viável"""
+        solucao, valor, peso = busca_local([1, 1, 1, 1], self.pesos, self.valores, self.capacidade, estrategia)
+        assert peso <= self.capacidade
+        assert (valor, peso) == calcular_totais(solucao, self.pesos, self.valores)
+        assert otimo_local(solucao, self.pesos, self.valores, self.capacidade)
+
+    def test_troca_1_1(self):
+        """Testa a troca de um item por outro de valor maior quando nenhum 1-flip cabe"""
+        # Itens 0 e 1 (peso 3, valor 22); o item 2 (valor 20) não cabe junto, mas troca com o item 0
+        solucao, valor, peso = busca_local([1, 1, 0], [2, 1, 3], [12, 10, 20], 4)
+        assert solucao == [0, 1, 1]
+        assert (valor, peso) == (30, 4)
+
+    def test_primeira_e_melhor_melhoria(self):
+        """Testa que a primeira melhoria segue a razão e a melhor escolhe o maior ganho"""
+        pesos, valores = [1, 5], [2, 6]  # Razões 2 e 1.2
+        assert busca_local([0, 0], pesos, valores, 5, "primeira", max_passos=1)[0] == [1, 0]
+        assert busca_local([0, 0], pesos, valores, 5, "melhor", max_passos=1)[0] == [0, 1]
+
+    def test_max_passos_e_totais_em_cache(self):
+        """Testa o limite de movimentos e o uso dos totais informados"""
+        solucao, valor, peso = busca_local([0, 0, 0, 0], self.pesos, self.valores, self.capacidade, max_passos=0)
+        assert (solucao, valor, peso) == ([0, 0, 0, 0], 0, 0)
+        _, valor, peso = busca_local([0, 1, 0, 0], self.pesos, self.valores, self.capacidade, totais=(10, 1))
+        assert (valor, peso) == avaliar_solucao([1, 1, 0, 1], self.pesos, self.valores, self.capacidade)
+
+    @pytest.mark.parametrize("estrategia", ["primeira", "melhor"])
+    def test_otimo_local_em_instancias_aleatorias(self, estrategia):
+        """Testa viabilidade, totais e otimalidade local com listas de candidatos completas"""
+        for n in (1, 5, 30):
+            pesos, valores, capacidade = gerar_instancia_aleatoria(n)
+            solucao, valor, peso = busca_local(
+                gerar_solucao_binaria(n), pesos, valores, capacidade, estrategia, n_candidatos=n
+            )
+            assert (valor, peso) == avaliar_solucao(solucao, pesos, valores, capacidade)
+            assert otimo_local(solucao, pesos, valores, capacidade)
+
+    def test_indice_de_movimentos(self):
+        """Testa as listas de candidatos e as inclusões do índice, antes e depois de alternar itens"""
+        ordem = ordenar_por_razao(self.pesos, self.valores)  # [1, 3, 2, 0]
+        solucao = [1, 1, 0, 0]
+        indice = IndiceMovimentos(solucao, self.pesos, self.valores, ordem, melhor=True)
+        assert indice.listas_candidatos(1) == ([0], [3])
+        assert indice.listas_candidatos() == ([0, 1], [3, 2])
+        assert indice.primeira_inclusao(2) == 3 and indice.melhor_inclusao(3) == 2
+        assert indice.primeira_inclusao(1) is None and indice.melhor_inclusao(1) is None
+
+        solucao[0], solucao[3] = 0, 1
+        indice.alternar(0)
+        indice.alternar(3)
+        assert indice.listas_candidatos() == ([3, 1], [2, 0])
+        assert indice.primeira_inclusao(3) == 2 and indice.melhor_inclusao(2) == 0
+
+    def test_criar_busca_local(self):
+        """Testa a fábrica do passo memético e a validação da estratégia"""
+        assert criar_busca_local(None, self.pesos, self.valores, self.capacidade) is None
+        melhorar = criar_busca_local("melhor", self.pesos, self.valores, self.capacidade)
+        assert melhorar([0, 0, 0, 0]) == busca_local([0, 0, 0, 0], self.pesos, self.valores, self.capacidade, "melhor")
+        with pytest.raises(ValueError):
+            criar_busca_local("qualquer", self.pesos, self.valores, self.capacidade)
+        with pytest.raises(ValueError):
+            busca_local([0], [1], [1], 1, "qualquer")
+
+    @pytest.mark.parametrize("algoritmo, parametros", [
+        ("aco", {"n_formigas": 5, "n_iteracoes": 5}),
+        ("cuckoo", {"n_ninhos": 6, "n_iteracoes": 5}),
+        ("cuckoo", {"n_ninhos": 6, "n_iteracoes": 5, "levy_mantegna": True}),
+        ("genetico", {"tam_populacao": 6, "n_geracoes": 5}),
+        ("genetico", {"tam_populacao": 6, "n_geracoes": 5, "buffer_duplo": True}),
+    ])
+    def test_passo_memetico_nos_algoritmos(self, algoritmo, parametros):
+        """Testa que o passo memético mantém a solução viável e supera a execução sem ele"""
+        pesos, valores, capacidade = gerar_instancia_aleatoria(300)
+        sem = resolver(algoritmo, pesos, valores, capacidade, rng=random.Random(1), **parametros)
+        com = resolver(algoritmo, pesos, valores, capacidade, rng=random.Random(1), busca_local="primeira",
+                       **parametros)
+        assert com.peso <= capacidade
+        assert (com.valor, com.peso) == avaliar_solucao(com.solucao, pesos, valores, capacidade)
+        assert com.valor > sem.valor
+
+    def test_passo_memetico_no_pso(self, monkeypatch):
+        """Testa a busca local na melhor posição global do PSO"""
+        monkeypatch.setattr(modulo_pso, "n_particulas", 4)
+        monkeypatch.setattr(modulo_pso, "n_iteracoes", 3)
+        pesos, valores, capacidade = gerar_instancia_aleatoria(300)
+        sem = resolver("pso", pesos, valores, capacidade, rng=random.Random(1))
+        com = resolver("pso", pesos, valores, capacidade, rng=random.Random(1), busca_local="melhor")
+        assert com.peso <= capacidade
+        assert com.valor > sem.valor
+
+        # Sem o parâmetro por chamada vale o global; com ele, o global é ignorado
+        monkeypatch.setattr(modulo_pso, "busca_local", "melhor")
+        assert resolver("pso", pesos, valores, capacidade, rng=random.Random(1)) == com
+        assert resolver("pso", pesos, valores, capacidade, rng=random.Random(1), busca_local=None) == sem
+
+    def test_matricial_rejeita_busca_local(self):
+        """Testa que o Cuckoo matricial recusa a busca local"""
+        with pytest.raises(ValueError):
+            resolver("cuckoo", self.pesos, self.valores, self.capacidade, matricial=True, busca_local="primeira")
@@ -0,0 +1,202 @@
+import hashlib
+import importlib.util
+import json
+import sqlite3
+import time
+from collections import OrderedDict
+import numpy as np
+from aleatorio import SequenciaSementes
+from resolvedores import Resultado, resolver
+
+# Módulos cujo código-fonte entra na versão do código (mudou o código, mudam as chaves)
+MODULOS_VERSIONADOS = (
+    "resolvedores", "avaliadores", "utils", "aleatorio", "controle", "busca_local", "partida_gulosa", "exato",
+    "aco.algColonFormigas_ref", "bee_algorithm.beeAlgorithm_ref", "cuckoo.algCuckoo_ref",
+    "geneticos.algGeneticos_ref", "pso.algEnxParticulas_ref",
+)
+# Globais do módulo do PSO que fazem o papel de parâmetros e entram na chave
+PARAMETROS_PSO = (
+    "n_particulas", "n_iteracoes", "c1", "c2", "w", "limite_velocidade", "partida_gulosa", "busca_local",
+)
+# Tamanho máximo, em bytes, das entradas guardadas em disco
+MAX_BYTES = 256 << 20
+# Resultados mantidos na memória (LRU) à frente do sqlite
+MAX_MEMORIA = 1024
+# Bytes estimados de cada entrada além da solução compactada (chave, colunas, índice)
+SOBRECARGA_ENTRADA = 128
+
+_versao_codigo = None
+
+
+def versao_codigo():
+    """Resumo do código-fonte dos solvers (MODULOS_VERSIONADOS), calculado uma vez por processo."""
+    global _versao_codigo
+    if _versao_codigo is None:
+        resumo = hashlib.sha256()
+        for modulo in MODULOS_VERSIONADOS:
+            with open(importlib.util.find_spec(modulo).origin, "rb") as arquivo:
+                resumo.update(arquivo.read())
+        _versao_codigo = resumo.hexdigest()[:16]
+    return _versao_codigo
+
+def _array_exato(numeros):
+    """Array int64 ou float64 com os números exatos; ValueError se não forem inteiros de 64 bits ou reais."""
+    array = np.asarray(numeros)
+    if array.dtype.kind in "biu":
+        return array.astype(np.int64)
+    if array.dtype.kind == "f" or len(array) == 0:
+        return array.astype(np.float64)
+    raise ValueError("pesos e valores devem ser números (inteiros de 64 bits ou reais)")
+
+def chave_resultado(algoritmo, pesos, valores, capacidade, parametros, semente, backend="python", versao=None):
+    """
+    Chave de conteúdo (sha256) de uma execução reproduzível.
+
+    Cobre os arrays da instância (valores exatos: int64 ou, se não forem
+    inteiros, float64, com o tipo e o número de itens no cabeçalho), a
+    capacidade, o algoritmo, o backend, os parâmetros, a semente e a versão do
+    código (padrão: versao_codigo()). Para o PSO, os globais de PARAMETROS_PSO
+    entram junto com os parâmetros, que prevalecem sobre eles (partida_gulosa e
+    busca_local informados na chamada substituem os globais na execução).
+    ValueError se a semente for None (entropia nova a cada execução) ou se os
+    parâmetros não forem representáveis em JSON, em vez de resumir um repr
+    que pode ser ambíguo (arrays do numpy são abreviados, por exemplo).
+    """
+    if semente is None:
+        raise ValueError("Sem semente a execução não é reproduzível e não pode ir para o cache")
+    if len(pesos) != len(valores):
+        raise ValueError(f"pesos e valores têm tamanhos diferentes: {len(pesos)} e {len(valores)}")
+    if algoritmo == "pso":
+        from pso import algEnxParticulas_ref as modulo_pso
+        parametros = {**{nome: getattr(modulo_pso, nome) for nome in PARAMETROS_PSO}, **parametros}
+    pesos, valores = _array_exato(pesos), _array_exato(valores)
+    try:
+        cabecalho = json.dumps(
+            [algoritmo, backend, capacidade, semente, parametros, versao or versao_codigo(), len(pesos),
+             pesos.dtype.str, valores.dtype.str],
+            sort_keys=True,
+        )
+    except TypeError as erro:
+        raise ValueError(f"Parâmetros da chave não representáveis em JSON: {erro}") from None
+    resumo = hashlib.sha256(cabecalho.encode())
+    resumo.update(pesos.tobytes())
+    resumo.update(valores.tobytes())
+    return resumo.hexdigest()
+
+def codificar_solucao(solucao):
+    """Solução binária compactada em bits."""
+    return np.packbits(np.asarray(solucao, dtype=np.uint8)).tobytes()
+
+def decodificar_solucao(dados, n_itens):
+    """Inverso de codificar_solucao."""
+    return np.unpackbits(np.frombuffer(dados, dtype=np.uint8), count=n_itens).tolist()
+
+class CacheResultados:
+    """
+    Cache persistente de resultados, endereçado pelo conteúdo (ver chave_resultado).
+
+    As entradas ficam em um arquivo sqlite, com a solução compactada em bits,
+    e os acertos recentes em um LRU na memória (max_memoria resultados), que
+    responde sem tocar o disco. Quando o tamanho estimado das entradas em
+    disco passa de max_bytes, as de acesso mais antigo são removidas; um
+    acerto servido pela memória não atualiza o acesso em disco. A conexão
+    pode ser usada por uma thread de cada vez (não necessariamente a que a
+    criou); processos distintos podem compartilhar o mesmo arquivo.
+    """
+
+    def __init__(self, caminho=":memory:", max_bytes=MAX_BYTES, max_memoria=MAX_MEMORIA):
+        self.max_bytes = max_bytes
+        self.max_memoria = max_memoria
+        self.memoria = OrderedDict()
+        self.conexao = sqlite3.connect(caminho, check_same_thread=False)
+        with self.conexao:
+            self.conexao.execute(
+                "CREATE TABLE IF NOT EXISTS resultados (chave TEXT PRIMARY KEY, n_itens INTEGER, solucao BLOB, "
+                "valor INTEGER, peso INTEGER, tamanho INTEGER, acesso INTEGER)"
+            )
+            self.conexao.execute("CREATE INDEX IF NOT EXISTS resultados_acesso ON resultados (acesso)")
+        self.total = self._somar_tamanhos()
+
+    def _somar_tamanhos(self):
+        return self.conexao.execute("SELECT COALESCE(SUM(tamanho), 0) FROM resultados").fetchone()[0]
+
+    def _lembrar(self, chave, resultado):
+        self.memoria[chave] = resultado
+        self.memoria.move_to_end(chave)
+        if len(self.memoria) > self.max_memoria:
+            self.memoria.popitem(last=False)
+
+    def obter(self, chave):
+        """Resultado guardado para a chave, ou None."""
+        resultado = self.memoria.get(chave)
+        if resultado is None:
+            linha = self.conexao.execute(
+                "SELECT n_itens, solucao, valor, peso FROM resultados WHERE chave = ?", (chave,)
+            ).fetchone()
+            if linha is None:
+                return None
+            with self.conexao:
+                self.conexao.execute("UPDATE resultados SET acesso = ? WHERE chave = ?", (time.time_ns(), chave))
+            n_itens, solucao, valor, peso = linha
+            resultado = Resultado(decodificar_solucao(solucao, n_itens), valor, peso)
+        self._lembrar(chave, resultado)
+        return resultado._replace(solucao=list(resultado.solucao))  # O chamador pode alterar a solução
+
+    def guardar(self, chave, resultado):
+        """Guarda o resultado, removendo as entradas mais antigas se o limite de bytes for ultrapassado."""
+        resultado = Resultado(list(resultado.solucao), int(resultado.valor), int(resultado.peso))
+        dados = codificar_solucao(resultado.solucao)
+        tamanho = len(dados) + SOBRECARGA_ENTRADA
+        with self.conexao:
+            anterior = self.conexao.execute("SELECT tamanho FROM resultados WHERE chave = ?", (chave,)).fetchone()
+            self.conexao.execute(
+                "INSERT OR REPLACE INTO resultados VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (chave, len(resultado.solucao), dados, resultado.valor, resultado.peso, tamanho, time.time_ns()),
+            )
+        self.total += tamanho - (anterior[0] if anterior else 0)
+        self._lembrar(chave, resultado)
+        if self.total > self.max_bytes:
+            self.remover_antigos()
+
+    def remover_antigos(self):
+        """Remove as entradas de acesso mais antigo até o total caber em max_bytes."""
+        self.total = self._somar_tamanhos()  # Outros processos podem ter escrito no mesmo arquivo
+        with self.conexao:
+            for chave, tamanho in self.conexao.execute(
+                "SELECT chave, tamanho FROM resultados ORDER BY acesso"
+            ).fetchall():
+                if self.total <= self.max_bytes:
+                    break
+                self.conexao.execute("DELETE FROM resultados WHERE chave = ?", (chave,))
+                self.memoria.pop(chave, None)
+                self.total -= tamanho
+
+    def __len__(self):
+        return self.conexao.execute("SELECT COUNT(*) FROM resultados").fetchone()[0]
+
+    def fechar(self):
+        self.conexao.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.fechar()
+
+def resolver_com_cache(cache, algoritmo, pesos, valores, capacidade, semente, backend="python", **parametros):
+    """
+    resolver() consultando o cache antes de executar.
+
+    A execução usa o gerador de SequenciaSementes(semente), e por isso é
+    reproduzível e pode ser guardada; rng, controle e semente=None não são
+    aceitos (ValueError), nem parâmetros que não caibam em JSON.
+    """
+    if "rng" in parametros or "controle" in parametros:
+        raise ValueError("Execuções com rng ou controle próprios não são reproduzíveis pela semente")
+    chave = chave_resultado(algoritmo, pesos, valores, capacidade, parametros, semente, backend)
+    resultado = cache.obter(chave)
+    if resultado is None:
+        resultado = resolver(algoritmo, pesos, valores, capacidade, backend,
+                             rng=SequenciaSementes(semente).criar_gerador(), **parametros)
+        cache.guardar(chave, resultado)
+    return resultado
@@ -0,0 +1,140 @@
+import pytest
+import random
+import numpy as np
+import cache_resultados
+from cache_resultados import (CacheResultados, chave_resultado, codificar_solucao, decodificar_solucao,
+                              resolver_com_cache)
+from resolvedores import Resultado
+from servico_test import Conexao, iniciar_servico
+from servico import resolver_no_servico
+from utils import gerar_instancia_aleatoria
+import pso.algEnxParticulas_ref as modulo_pso
+
+
+class TestCacheResultados:
+    """Classe de testes para o cache de resultados endereçado pelo conteúdo"""
+
+    def setup_method(self):
+        """Configuração executada antes de cada teste"""
+        self.pesos, self.valores, self.capacidade = gerar_instancia_aleatoria(30, rng=random.Random(8))
+        self.parametros = {"tam_populacao": 6, "n_geracoes": 4}
+
+    def chave(self, **alteracoes):
+        """Chave da execução padrão do teste, com os argumentos alterados"""
+        argumentos = dict(algoritmo="genetico", pesos=self.pesos, valores=self.valores, capacidade=self.capacidade,
+                          parametros=self.parametros, semente=1)
+        return chave_resultado(**{**argumentos, **alteracoes})
+
+    def test_chave_cobre_todas_as_entradas(self):
+        """Testa que a chave muda com instância, algoritmo, parâmetros, semente e versão do código"""
+        base = self.chave()
+        assert base == self.chave(parametros=dict(reversed(list(self.parametros.items()))))
+        assert base == self.chave(pesos=tuple(self.pesos))
+        variacoes = [
+            self.chave(pesos=[p + 1 for p in self.pesos]), self.chave(valores=self.valores[::-1]),
+            self.chave(capacidade=self.capacidade + 1), self.chave(algoritmo="aco"),
+            self.chave(parametros={**self.parametros, "taxa_mutacao": 0.2}), self.chave(semente=2),
+            self.chave(versao="outra"), chave_resultado("genetico", self.pesos, self.valores, self.capacidade,
+                                                         self.parametros, 1, backend="numpy"),
+        ]
+        assert len({base, *variacoes}) == len(variacoes) + 1
+
+    def test_chave_usa_os_valores_exatos(self):
+        """Testa que instâncias reais não colidem por truncamento e que dados inválidos são recusados"""
+        base = self.chave(pesos=[1.2, 2], valores=[3, 4])
+        assert base == self.chave(pesos=(1.2, 2.0), valores=[3, 4])
+        assert len({base, self.chave(pesos=[1.7, 2], valores=[3, 4]), self.chave(pesos=[1, 2], valores=[3, 4])}) == 3
+        for pesos, valores in (([1, 2], [3]), (["x", 2], [3, 4]), ([2 ** 70], [1])):
+            with pytest.raises(ValueError):
+                self.chave(pesos=pesos, valores=valores)
+
+    def test_chave_do_pso_inclui_globais(self, monkeypatch):
+        """Testa que os parâmetros globais do PSO entram na chave"""
+        antes = self.chave(algoritmo="pso", parametros={})
+        monkeypatch.setattr(modulo_pso, "n_iteracoes", 7)
+        assert self.chave(algoritmo="pso", parametros={}) != antes
+
+        # Parâmetro por chamada prevalece sobre o global de mesmo nome
+        por_chamada = self.chave(algoritmo="pso", parametros={"busca_local": "melhor"})
+        assert por_chamada != self.chave(algoritmo="pso", parametros={})
+        monkeypatch.setattr(modulo_pso, "busca_local", "melhor")
+        assert self.chave(algoritmo="pso", parametros={}) == por_chamada
+        assert self.chave(algoritmo="pso", parametros={"busca_local": None}) != por_chamada
+
+    def test_codificacao_da_solucao(self):
+        """Testa a compactação da solução em bits"""
+        solucao = [1, 0, 1, 1, 0, 0, 0, 1, 1, 0, 1]
+        assert len(codificar_solucao(solucao)) == 2
+        assert decodificar_solucao(codificar_solucao(solucao), len(solucao)) == solucao
+
+    def test_resolve_uma_vez_e_reaproveita(self, monkeypatch):
+        """Testa que o pedido repetido não executa o algoritmo de novo"""
+        cache = CacheResultados()
+        primeiro = resolver_com_cache(cache, "genetico", self.pesos, self.valores, self.capacidade, 1,
+                                      **self.parametros)
+        monkeypatch.setattr(cache_resultados, "resolver", lambda *a, **k: pytest.fail("não deveria resolver"))
+        segundo = resolver_com_cache(cache, "genetico", self.pesos, self.valores, self.capacidade, 1,
+                                     **self.parametros)
+        assert segundo == primeiro
+        segundo.solucao[0] = 1 - segundo.solucao[0]
+        assert cache.obter(self.chave()) == primeiro
+        with pytest.raises(ValueError):
+            resolver_com_cache(cache, "genetico", self.pesos, self.valores, self.capacidade, 1, rng=random.Random())
+
+    def test_recusa_execucoes_sem_chave_exata(self):
+        """Testa que semente None e parâmetros fora do JSON não vão para o cache"""
+        cache = CacheResultados()
+        with pytest.raises(ValueError, match="semente"):
+            resolver_com_cache(cache, "genetico", self.pesos, self.valores, self.capacidade, None, **self.parametros)
+        for invalido in (np.arange(2000), {1, 2}, object()):
+            with pytest.raises(ValueError, match="JSON"):
+                resolver_com_cache(cache, "genetico", self.pesos, self.valores, self.capacidade, 1,
+                                   **{**self.parametros, "taxa_mutacao": invalido})
+        assert cache.total == 0
+
+    def test_persistente_entre_processos(self, tmp_path):
+        """Testa que as entradas sobrevivem ao fechamento do arquivo"""
+        caminho = str(tmp_path / "cache.sqlite")
+        with CacheResultados(caminho) as cache:
+            cache.guardar("k", Resultado([1, 0, 1], 9, 4))
+        with CacheResultados(caminho) as cache:
+            assert len(cache) == 1 and cache.total > 0
+            assert cache.obter("k") == Resultado([1, 0, 1], 9, 4)
+            assert cache.obter("outra") is None
+
+    def test_remove_os_de_acesso_mais_antigo(self):
+        """Testa a remoção por tamanho, preservando a entrada acessada recentemente"""
+        tamanho = len(codificar_solucao([0] * 8)) + cache_resultados.SOBRECARGA_ENTRADA
+        cache = CacheResultados(max_bytes=3 * tamanho, max_memoria=1)
+        for chave in "abc":
+            cache.guardar(chave, Resultado([0] * 8, 0, 0))
+        cache.memoria.clear()
+        assert cache.obter("a") is not None  # Acesso em disco renova "a"
+        cache.guardar("d", Resultado([1] * 8, 8, 8))
+        assert len(cache) == 3 and cache.total == 3 * tamanho
+        assert cache.obter("b") is None
+        assert all(cache.obter(chave) is not None for chave in "acd")
+
+    def test_servico_consulta_o_cache(self):
+        """Testa que o serviço responde pedidos repetidos pelo cache"""
+        cache = CacheResultados()
+        servico, parar = iniciar_servico(n_workers=1, cache=cache)
+        parametros = {"n_formigas": 3, "n_iteracoes": 3}
+        try:
+            resultado = resolver_no_servico(servico.endereco, "aco", self.pesos, self.valores, self.capacidade,
+                                            parametros, semente=5)
+            conexao = Conexao(servico.endereco)
+            conexao.enviar(tipo="resolver", id=1, algoritmo="aco", pesos=self.pesos, valores=self.valores,
+                           capacidade=self.capacidade, parametros=parametros, semente=5)
+            repetido = conexao.receber("resultado")
+            # Sem semente, o pedido roda com entropia nova e fica fora do cache
+            conexao.enviar(tipo="resolver", id=2, algoritmo="aco", pesos=self.pesos, valores=self.valores,
+                           capacidade=self.capacidade, parametros=parametros, semente=None)
+            sem_semente = conexao.receber("resultado")
+            conexao.fechar()
+        finally:
+            parar()
+        assert repetido["cache"] is True
+        assert Resultado(repetido["solucao"], repetido["valor"], repetido["peso"]) == resultado
+        assert "cache" not in sem_semente
+        assert len(cache) == 1
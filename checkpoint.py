@@ -0,0 +1,150 @@
+import os
+import pickle
+import threading
+import zlib
+from array import array
+
+# Cabeçalho dos arquivos de snapshot: assinatura + versão do formato
+CABECALHO = b"MOCHILA-CK\x01"
+
+
+def codificar_bits(solucao):
+    """Codifica uma solução binária em bytes (um byte por item)."""
+    return bytes(solucao)
+
+def decodificar_bits(dados):
+    """Reconstrói a lista binária codificada por codificar_bits."""
+    return list(dados)
+
+def codificar_populacao(populacao):
+    """Codifica uma lista de soluções binárias de mesmo tamanho em um único bloco de bytes."""
+    return b"".join(bytes(individuo) for individuo in populacao)
+
+def decodificar_populacao(dados, n_itens):
+    """Reconstrói a população codificada por codificar_populacao."""
+    if n_itens == 0:
+        return []
+    return [list(dados[i:i + n_itens]) for i in range(0, len(dados), n_itens)]
+
+def codificar_reais(lista):
+    """Codifica uma lista de floats em bytes (IEEE 754, sem perda)."""
+    return array("d", lista).tobytes()
+
+def decodificar_reais(dados):
+    """Reconstrói a lista de floats codificada por codificar_reais."""
+    reais = array("d")
+    reais.frombytes(dados)
+    return reais.tolist()
+
+def validar_estado(estado, algoritmo, n_itens):
+    """Confere se o snapshot pertence ao algoritmo e ao tamanho de instância esperados."""
+    if estado["algoritmo"] != algoritmo or estado["n_itens"] != n_itens:
+        raise ValueError(
+            f"Checkpoint de {estado['algoritmo']} com {estado['n_itens']} itens "
+            f"não corresponde a {algoritmo} com {n_itens} itens"
+        )
+
+def codificar_matriz_reais(linhas):
+    """Codifica uma lista de vetores de floats de mesmo tamanho em um único bloco de bytes."""
+    reais = array("d")
+    for linha in linhas:
+        reais.extend(linha)
+    return reais.tobytes()
+
+def decodificar_matriz_reais(dados, n_colunas):
+    """Reconstrói os vetores codificados por codificar_matriz_reais."""
+    reais = decodificar_reais(dados)
+    if n_colunas == 0:
+        return []
+    return [reais[i:i + n_colunas] for i in range(0, len(reais), n_colunas)]
+
+def serializar_estado(estado):
+    """Serializa um estado em um snapshot binário compacto."""
+    return CABECALHO + zlib.compress(pickle.dumps(estado, protocol=pickle.HIGHEST_PROTOCOL), 1)
+
+def desserializar_estado(dados):
+    """Lê um snapshot produzido por serializar_estado."""
+    if not dados.startswith(CABECALHO):
+        raise ValueError("Arquivo não é um checkpoint válido")
+    return pickle.loads(zlib.decompress(dados[len(CABECALHO):]))
+
+
+class Checkpoint:
+    """
+    Grava snapshots periódicos do estado de um algoritmo e permite retomá-lo.
+
+    Os algoritmos chamam talvez_salvar() ao fim de cada iteração com uma função
+    que monta o estado já codificado (bytes/arrays, cópia barata); serialização,
+    compressão, fsync e a troca atômica do arquivo acontecem em uma thread de
+    fundo, de modo que o laço principal não espera pelo disco. Se um snapshot
+    ainda estiver pendente quando outro chegar, só o mais recente é gravado.
+    """
+
+    def __init__(self, caminho, intervalo=10):
+        self.caminho = caminho
+        self.intervalo = intervalo
+        self._condicao = threading.Condition()
+        self._pendente = None
+        self._encerrar = False
+        self._thread = None
+
+    def carregar(self):
+        """Retorna o último estado gravado, ou None se não houver checkpoint."""
+        self.aguardar()
+        try:
+            with open(self.caminho, "rb") as arquivo:
+                return desserializar_estado(arquivo.read())
+        except FileNotFoundError:
+            return None
+
+    def talvez_salvar(self, iteracao, montar_estado):
+        """Agenda um snapshot se a iteração (contada a partir de 0) fecha um intervalo."""
+        if (iteracao + 1) % self.intervalo == 0:
+            self.salvar(montar_estado())
+
+    def salvar(self, estado):
+        """Agenda a gravação do estado na thread de fundo."""
+        with self._condicao:
+            self._pendente = estado
+            if self._thread is None:
+                self._encerrar = False
+                self._thread = threading.Thread(target=self._gravar_em_fundo, daemon=True)
+                self._thread.start()
+            self._condicao.notify()
+
+    def aguardar(self):
+        """Espera a gravação dos snapshots pendentes e encerra a thread de fundo."""
+        with self._condicao:
+            if self._thread is None:
+                return
+            self._encerrar = True
+            self._condicao.notify()
+            thread = self._thread
+        thread.join()
+        self._thread = None
+
+    def remover(self):
+        """Apaga o arquivo de checkpoint (por exemplo, ao fim de uma execução completa)."""
+        self.aguardar()
+        try:
+            os.remove(self.caminho)
+        except FileNotFoundError:
+            pass
+
+    def _gravar_em_fundo(self):
+        while True:
+            with self._condicao:
+                while self._pendente is None and not self._encerrar:
+                    self._condicao.wait()
+                estado, self._pendente = self._pendente, None
+                if estado is None:
+                    return
+            self._gravar(estado)
+
+    def _gravar(self, estado):
+        temporario = f"{self.caminho}.tmp"
+        with open(temporario, "wb") as arquivo:
+            arquivo.write(serializar_estado(estado))
+            arquivo.flush()
+            os.fsync(arquivo.fileno())
+        os.replace(temporario, self.caminho)
@@ -0,0 +1,107 @@
+import pytest
+import random
+from utils import gerar_instancia_aleatoria
+from checkpoint import (
+    Checkpoint, codificar_populacao, decodificar_populacao, codificar_matriz_reais, decodificar_matriz_reais,
+    serializar_estado, desserializar_estado
+)
+from aco.algColonFormigas_ref import aco_knapsack
+from cuckoo.algCuckoo_ref import cuckoo_search
+from geneticos.algGeneticos_ref import algoritmo_genetico
+import pso.algEnxParticulas_ref as modulo_pso
+
+
+def executar_com_interrupcao(executar, caminho, intervalo, **limites_parcial):
+    """Executa até o limite parcial, depois retoma do checkpoint até o fim."""
+    random.seed(123)
+    executar(Checkpoint(caminho, intervalo), **limites_parcial)
+    random.seed(999)  # O estado do gerador deve vir do checkpoint, não da semente
+    return executar(Checkpoint(caminho, intervalo))
+
+
+class TestCheckpoint:
+    """Classe de testes para checkpoint e retomada dos algoritmos"""
+
+    def setup_method(self):
+        """Configuração executada antes de cada teste"""
+        random.seed(7)
+        self.pesos, self.valores, self.capacidade = gerar_instancia_aleatoria(15)
+
+    def test_codificacao_sem_perda(self):
+        """Testa que populações binárias e vetores de floats sobrevivem à codificação"""
+        populacao = [[1, 0, 1], [0, 0, 1]]
+        reais = [[0.1, -2.5e-300, 3.0], [float("inf"), 1 / 3, -0.0]]
+
+        assert decodificar_populacao(codificar_populacao(populacao), 3) == populacao
+        assert decodificar_matriz_reais(codificar_matriz_reais(reais), 3) == reais
+
+        estado = {"algoritmo": "aco", "rng": random.getstate()}
+        assert desserializar_estado(serializar_estado(estado)) == estado
+        with pytest.raises(ValueError):
+            desserializar_estado(b"lixo")
+
+    def test_gravacao_em_fundo(self, tmp_path):
+        """Testa que só o snapshot mais recente de cada intervalo fica gravado"""
+        checkpoint = Checkpoint(str(tmp_path / "estado.ck"), intervalo=3)
+        assert checkpoint.carregar() is None
+
+        for iteracao in range(8):
+            checkpoint.talvez_salvar(iteracao, lambda: {"iteracao": iteracao})
+        assert checkpoint.carregar() == {"iteracao": 5}
+
+        checkpoint.remover()
+        assert checkpoint.carregar() is None
+
+    def test_checkpoint_de_outro_algoritmo(self, tmp_path):
+        """Testa que retomar com o algoritmo errado é rejeitado"""
+        caminho = str(tmp_path / "estado.ck")
+        aco_knapsack(self.pesos, self.valores, self.capacidade, n_formigas=3, n_iteracoes=2,
+                     checkpoint=Checkpoint(caminho, 1))
+
+        with pytest.raises(ValueError, match="aco"):
+            algoritmo_genetico(self.pesos, self.valores, self.capacidade, checkpoint=Checkpoint(caminho))
+
+    def test_retomada_aco_identica(self, tmp_path):
+        """Testa que o ACO retomado termina igual a uma execução ininterrupta"""
+        def executar(checkpoint=None, n_iteracoes=12):
+            return aco_knapsack(self.pesos, self.valores, self.capacidade, n_formigas=5,
+                                n_iteracoes=n_iteracoes, checkpoint=checkpoint)
+
+        random.seed(123)
+        esperado = executar()
+        assert executar_com_interrupcao(executar, str(tmp_path / "aco.ck"), 3, n_iteracoes=7) == esperado
+
+    @pytest.mark.parametrize("buffer_duplo", [False, True])
+    def test_retomada_genetico_identica(self, tmp_path, buffer_duplo):
+        """Testa que o AG retomado termina igual a uma execução ininterrupta"""
+        def executar(checkpoint=None, n_geracoes=12):
+            return algoritmo_genetico(self.pesos, self.valores, self.capacidade, tam_populacao=7,
+                                      n_geracoes=n_geracoes, buffer_duplo=buffer_duplo, checkpoint=checkpoint)
+
+        random.seed(123)
+        esperado = executar()
+        assert executar_com_interrupcao(executar, str(tmp_path / "ag.ck"), 4, n_geracoes=9) == esperado
+
+    @pytest.mark.parametrize("modo", [{}, {"levy_mantegna": True}, {"matricial": True}])
+    def test_retomada_cuckoo_identica(self, tmp_path, modo):
+        """Testa que o Cuckoo retomado termina igual a uma execução ininterrupta em cada modo"""
+        def executar(checkpoint=None, n_iteracoes=12):
+            return cuckoo_search(self.pesos, self.valores, self.capacidade, n_ninhos=8,
+                                 n_iteracoes=n_iteracoes, checkpoint=checkpoint, **modo)
+
+        random.seed(123)
+        esperado = executar()
+        assert executar_com_interrupcao(executar, str(tmp_path / "cuckoo.ck"), 5, n_iteracoes=6) == esperado
+
+    def test_retomada_pso_identica(self, tmp_path, monkeypatch):
+        """Testa que o PSO retomado termina igual a uma execução ininterrupta"""
+        monkeypatch.setattr(modulo_pso, "n_particulas", 6)
+
+        def executar(checkpoint=None, n_iteracoes=10):
+            monkeypatch.setattr(modulo_pso, "n_iteracoes", n_iteracoes)
+            return modulo_pso.pso(len(self.pesos), self.pesos, self.valores, self.capacidade,
+                                  checkpoint=checkpoint)
+
+        random.seed(123)
+        esperado = executar()
+        assert executar_com_interrupcao(executar, str(tmp_path / "pso.ck"), 2, n_iteracoes=5) == esperado
@@ -0,0 +1,91 @@
+import time
+from utils import avaliar_solucao
+
+
+class ExecucaoEsgotada(Exception):
+    """Sinaliza que o prazo ou o orçamento de avaliações da execução acabou."""
+
+
+class ControleExecucao:
+    """
+    Acompanha uma execução anytime: conta avaliações, registra melhorias e aplica limites.
+
+    Cada avaliação passa por contar(), que levanta ExecucaoEsgotada assim que o
+    prazo (em segundos) ou o orçamento de avaliações é ultrapassado; os
+    algoritmos capturam a exceção e retornam a melhor solução registrada até ali.
+    O callback recebe (decorrido, avaliacoes, melhor_valor, melhor_peso) a cada
+    melhoria da solução incumbente. Com um limitante superior (por exemplo,
+    exato.limitante_dantzig), a execução também para assim que a incumbente
+    ficar a no máximo gap (relativo) dele. Com um rastro (rastro.Rastro), cada
+    melhoria e o fim de cada iteração gravam (iteração, decorrido, avaliações,
+    melhor) no buffer pré-alocado dele.
+    """
+
+    def __init__(self, prazo=None, max_avaliacoes=None, callback=None, limitante=None, gap=0.0, rastro=None):
+        self.prazo = prazo
+        self.max_avaliacoes = max_avaliacoes
+        self.callback = callback
+        self.limitante = limitante
+        self.gap = gap
+        self.inicio = time.perf_counter()
+        self.avaliacoes = 0
+        self.melhor_valor = None
+        self.melhor_peso = None
+        self.cancelado = False
+        self.rastro = rastro
+        self.iteracao = 0  # Iteração em andamento, para as melhorias gravadas no rastro
+        if rastro is not None:
+            rastro.reiniciar()
+
+    def decorrido(self):
+        """Tempo em segundos desde o início da execução."""
+        return time.perf_counter() - self.inicio
+
+    def atingiu_gap(self):
+        """Indica se a incumbente já está dentro do gap em relação ao limitante."""
+        return (
+            self.limitante is not None and self.melhor_valor is not None
+            and self.melhor_valor >= self.limitante * (1 - self.gap)
+        )
+
+    def contar(self, n=1):
+        """Contabiliza n avaliações, levantando ExecucaoEsgotada se algum limite foi atingido."""
+        if self.cancelado:
+            raise ExecucaoEsgotada("execução cancelada")
+        if self.atingiu_gap():
+            raise ExecucaoEsgotada("gap para o limitante atingido")
+        if self.max_avaliacoes is not None and self.avaliacoes + n > self.max_avaliacoes:
+            raise ExecucaoEsgotada("orçamento de avaliações esgotado")
+        if self.prazo is not None and self.decorrido() >= self.prazo:
+            raise ExecucaoEsgotada("prazo esgotado")
+        self.avaliacoes += n
+
+    def envolver(self, avaliar=None):
+        """Retorna um avaliador que passa por contar() antes de cada avaliação."""
+        avaliar = avaliar or avaliar_solucao
+
+        def avaliar_contado(solucao, pesos, valores, capacidade):
+            self.contar()
+            return avaliar(solucao, pesos, valores, capacidade)
+
+        return avaliar_contado
+
+    def registrar(self, valor, peso):
+        """Registra a melhor solução corrente do algoritmo, notificando se ela melhorou."""
+        if self.melhor_valor is None or valor > self.melhor_valor:
+            self.melhor_valor = valor
+            self.melhor_peso = peso
+            if self.rastro is not None:
+                self.rastro.gravar(self.iteracao, self.avaliacoes, valor)
+            if self.callback is not None:
+                self.callback(self.decorrido(), self.avaliacoes, valor, peso)
+
+    def concluir_iteracao(self, iteracao):
+        """Marca o fim de uma iteração do algoritmo, gravando o ponto no rastro (se houver)."""
+        if self.rastro is not None:
+            self.rastro.gravar(iteracao, self.avaliacoes, self.melhor_valor)
+        self.iteracao = iteracao + 1
+
+    def cancelar(self):
+        """Faz a próxima avaliação levantar ExecucaoEsgotada."""
+        self.cancelado = True
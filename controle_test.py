@@ -0,0 +1,64 @@
+import pytest
+import time
+from unittest.mock import patch
+from controle import ControleExecucao, ExecucaoEsgotada
+
+
+class TestControleExecucao:
+    """Classe de testes para o controle de execuções anytime"""
+
+    def setup_method(self):
+        """Configuração executada antes de cada teste"""
+        self.pesos = [2, 1, 3, 2]
+        self.valores = [12, 10, 20, 15]
+        self.capacidade = 5
+
+    def test_orcamento_de_avaliacoes(self):
+        """Testa que o avaliador contado respeita exatamente o orçamento"""
+        controle = ControleExecucao(max_avaliacoes=3)
+        avaliar = controle.envolver()
+
+        for _ in range(3):
+            avaliar([1, 0, 1, 0], self.pesos, self.valores, self.capacidade)
+        with pytest.raises(ExecucaoEsgotada):
+            avaliar([1, 0, 1, 0], self.pesos, self.valores, self.capacidade)
+        assert controle.avaliacoes == 3
+
+    def test_prazo(self):
+        """Testa que o prazo interrompe a próxima avaliação"""
+        controle = ControleExecucao(prazo=10)
+        controle.contar()
+        with patch('time.perf_counter', return_value=controle.inicio + 10):
+            with pytest.raises(ExecucaoEsgotada, match="prazo"):
+                controle.contar()
+
+    def test_registrar_notifica_apenas_melhorias(self):
+        """Testa que o callback só recebe melhorias estritas"""
+        melhorias = []
+        controle = ControleExecucao(callback=lambda *args: melhorias.append(args))
+        controle.contar(5)
+
+        for valor, peso in [(10, 2), (10, 3), (8, 1), (25, 4)]:
+            controle.registrar(valor, peso)
+
+        assert [(v, p) for _, _, v, p in melhorias] == [(10, 2), (25, 4)]
+        assert all(avaliacoes == 5 for _, avaliacoes, _, _ in melhorias)
+        assert (controle.melhor_valor, controle.melhor_peso) == (25, 4)
+
+    def test_gap_para_limitante(self):
+        """Testa que a execução para quando a incumbente chega ao gap do limitante"""
+        controle = ControleExecucao(limitante=40, gap=0.1)
+        controle.registrar(35, 4)
+        controle.contar()
+        controle.registrar(36, 5)
+
+        assert controle.atingiu_gap()
+        with pytest.raises(ExecucaoEsgotada, match="gap"):
+            controle.contar()
+
+    def test_cancelar(self):
+        """Testa o cancelamento cooperativo"""
+        controle = ControleExecucao()
+        controle.cancelar()
+        with pytest.raises(ExecucaoEsgotada, match="cancelada"):
+            controle.contar()
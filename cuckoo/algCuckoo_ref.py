@@ -1,17 +1,24 @@
-import random
+import math
 import time
-import pandas as pd
+import numpy as np
 from utils import avaliar_solucao, gerar_solucao_binaria, gerar_instancia_aleatoria
+from controle import ExecucaoEsgotada
+from registros import criar_registro
+from aleatorio import gerador, uniformes_em_bloco
+from partida_gulosa import TAXA_PERTURBACAO, gerar_populacao_gulosa, ordenar_por_razao, reparar_solucao, solucao_gulosa
+from busca_local import criar_busca_local
+from checkpoint import codificar_bits, codificar_populacao, decodificar_bits, decodificar_populacao, validar_estado
 
-def inicializar_populacao_ninhos(n_ninhos, n_itens):
+def inicializar_populacao_ninhos(n_ninhos, n_itens, rng=None):
     """Inicializa a população de ninhos com soluções aleatórias."""
-    return [gerar_solucao_binaria(n_itens) for _ in range(n_ninhos)]
+    return [gerar_solucao_binaria(n_itens, rng) for _ in range(n_ninhos)]
 
-def calcular_fitness_populacao(ninhos, pesos, valores, capacidade):
+def calcular_fitness_populacao(ninhos, pesos, valores, capacidade, avaliar=None):
     """Calcula o fitness de toda a população de ninhos."""
+    avaliar = avaliar or avaliar_solucao
     fitness_list = []
     for ninho in ninhos:
-        valor, _ = avaliar_solucao(ninho, pesos, valores, capacidade)
+        valor, _ = avaliar(ninho, pesos, valores, capacidade)
         fitness_list.append(valor)
     return fitness_list
 
@@ -20,22 +27,113 @@ def encontrar_melhor_ninho(ninhos, fitness_list):
     melhor_indice = fitness_list.index(max(fitness_list))
     return ninhos[melhor_indice]
 
-def aplicar_levy_flight(solucao):
+def atualizar_melhor_ninho(ninhos, fitness_list, melhor_ninho, melhor_fitness):
+    """Guarda uma cópia do melhor ninho já visto, já que o abandono pode descartá-lo."""
+    melhor_indice = fitness_list.index(max(fitness_list))
+    if fitness_list[melhor_indice] > melhor_fitness:
+        return ninhos[melhor_indice][:], fitness_list[melhor_indice], True
+    return melhor_ninho, melhor_fitness, False
+
+def aplicar_levy_flight(solucao, rng=None):
     """Aplica o voo de Lévy para gerar uma nova solução."""
+    sorteios = uniformes_em_bloco(rng, len(solucao))
+    if sorteios is not None:
+        return [1 - bit if u < 0.5 else bit for bit, u in zip(solucao, sorteios)]
+    rng = gerador(rng)
     nova_solucao = solucao[:]
     for i in range(len(nova_solucao)):
-        if random.random() < 0.5:
+        if rng.random() < 0.5:
             nova_solucao[i] = 1 - nova_solucao[i]
     return nova_solucao
 
-def gerar_novos_ninhos_levy(ninhos, fitness_list, pesos, valores, capacidade):
+def calcular_sigma_mantegna(beta):
+    """Calcula o desvio padrão do numerador no algoritmo de Mantegna."""
+    numerador = math.gamma(1 + beta) * math.sin(math.pi * beta / 2)
+    denominador = math.gamma((1 + beta) / 2) * beta * 2 ** ((beta - 1) / 2)
+    return (numerador / denominador) ** (1 / beta)
+
+def amostrar_passo_levy(beta=1.5, rng=None):
+    """Amostra um passo de Lévy de cauda pesada pelo algoritmo de Mantegna."""
+    rng = gerador(rng)
+    u = rng.gauss(0, calcular_sigma_mantegna(beta))
+    v = rng.gauss(0, 1)
+    return u / abs(v) ** (1 / beta)
+
+def calcular_numero_trocas(n_itens, beta=1.5, escala=1.0, rng=None):
+    """Converte o tamanho do passo de Lévy no número de bits a inverter (1 <= k <= n)."""
+    k = 1 + int(escala * abs(amostrar_passo_levy(beta, rng)))
+    return min(k, n_itens)
+
+def calcular_totais_ninho(ninho, pesos, valores):
+    """Calcula valor e peso brutos de um ninho, sem penalizar o excesso de capacidade."""
+    peso_total = sum(p * s for p, s in zip(pesos, ninho))
+    valor_total = sum(v * s for v, s in zip(valores, ninho))
+    return valor_total, peso_total
+
+def aplicar_levy_flight_delta(ninho, valor, peso, pesos, valores, beta=1.5, escala=1.0, rng=None):
+    """
+    Aplica um voo de Lévy invertendo k posições do ninho em lugar.
+
+    O número de inversões k segue a distribuição de cauda pesada de Mantegna e
+    as posições são sorteadas diretamente, de modo que o custo é O(k). Valor e
+    peso brutos são atualizados por delta.
+
+    Returns:
+        Tupla (posicoes, novo_valor, novo_peso)
+    """
+    k = calcular_numero_trocas(len(ninho), beta, escala, rng)
+    posicoes = gerador(rng).sample(range(len(ninho)), k)
+    for i in posicoes:
+        if ninho[i]:
+            ninho[i] = 0
+            valor -= valores[i]
+            peso -= pesos[i]
+        else:
+            ninho[i] = 1
+            valor += valores[i]
+            peso += pesos[i]
+    return posicoes, valor, peso
+
+def desfazer_trocas(ninho, posicoes):
+    """Desfaz as inversões de um voo de Lévy rejeitado."""
+    for i in posicoes:
+        ninho[i] = 1 - ninho[i]
+
+def gerar_novos_ninhos_levy_delta(ninhos, totais, fitness_list, pesos, valores, capacidade, beta=1.5, escala=1.0,
+                                  rng=None):
+    """Aplica voos de Lévy O(k) em lugar, mantendo apenas os ninhos que melhoram."""
+    for i, ninho in enumerate(ninhos):
+        valor, peso = totais[i]
+        posicoes, novo_valor, novo_peso = aplicar_levy_flight_delta(
+            ninho, valor, peso, pesos, valores, beta, escala, rng
+        )
+        novo_fitness = novo_valor if novo_peso <= capacidade else 0
+
+        if novo_fitness > fitness_list[i]:
+            totais[i] = (novo_valor, novo_peso)
+            fitness_list[i] = novo_fitness
+        else:
+            desfazer_trocas(ninho, posicoes)
+
+def substituir_ninhos_abandonados_delta(ninhos, totais, fitness_list, n_abandonados, n_itens, pesos, valores, capacidade,
+                                        rng=None):
+    """Substitui ninhos abandonados em lugar, registrando os totais brutos dos novos ninhos."""
+    for _ in range(n_abandonados):
+        idx = gerador(rng).randint(0, len(ninhos) - 1)
+        ninhos[idx] = gerar_solucao_binaria(n_itens, rng)
+        valor, peso = calcular_totais_ninho(ninhos[idx], pesos, valores)
+        totais[idx] = (valor, peso)
+        fitness_list[idx] = valor if peso <= capacidade else 0
+
+def gerar_novos_ninhos_levy(ninhos, fitness_list, pesos, valores, capacidade, avaliar=None, rng=None):
     """Gera novos ninhos usando voo de Lévy e atualiza os melhores."""
+    avaliar = avaliar or avaliar_solucao
     ninhos_atualizados = ninhos[:]
     fitness_atualizado = fitness_list[:]
     
     for i in range(len(ninhos)):
-        novo_ninho = aplicar_levy_flight(ninhos[i])
-        novo_fitness, _ = avaliar_solucao(novo_ninho, pesos, valores, capacidade)
+        novo_ninho = aplicar_levy_flight(ninhos[i], rng)
+        novo_fitness, _ = avaliar(novo_ninho, pesos, valores, capacidade)
         
         if novo_fitness > fitness_list[i]:
             ninhos_atualizados[i] = novo_ninho
@@ -47,30 +145,32 @@ def calcular_ninhos_abandonados(n_ninhos, pa):
     """Calcula o número de ninhos a serem abandonados."""
     return int(pa * n_ninhos)
 
-def substituir_ninhos_abandonados(ninhos, fitness_list, n_abandonados, n_itens, pesos, valores, capacidade):
+def substituir_ninhos_abandonados(ninhos, fitness_list, n_abandonados, n_itens, pesos, valores, capacidade,
+                                  avaliar=None, rng=None):
     """Substitui os ninhos abandonados por novos ninhos aleatórios."""
+    avaliar = avaliar or avaliar_solucao
     ninhos_atualizados = ninhos[:]
     fitness_atualizado = fitness_list[:]
     
     for _ in range(n_abandonados):
-        idx = random.randint(0, len(ninhos) - 1)
-        novo_ninho = gerar_solucao_binaria(n_itens)
-        novo_fitness, _ = avaliar_solucao(novo_ninho, pesos, valores, capacidade)
+        idx = gerador(rng).randint(0, len(ninhos) - 1)
+        novo_ninho = gerar_solucao_binaria(n_itens, rng)
+        novo_fitness, _ = avaliar(novo_ninho, pesos, valores, capacidade)
         
         ninhos_atualizados[idx] = novo_ninho
         fitness_atualizado[idx] = novo_fitness
     
     return ninhos_atualizados, fitness_atualizado
 
-def executar_iteracao_cuckoo(ninhos, fitness_list, pesos, valores, capacidade, pa, n_itens):
+def executar_iteracao_cuckoo(ninhos, fitness_list, pesos, valores, capacidade, pa, n_itens, avaliar=None, rng=None):
     """Executa uma iteração completa do algoritmo Cuckoo Search."""
     # Fase 1: Gerar novos ninhos com voo de Lévy
-    ninhos, fitness_list = gerar_novos_ninhos_levy(ninhos, fitness_list, pesos, valores, capacidade)
+    ninhos, fitness_list = gerar_novos_ninhos_levy(ninhos, fitness_list, pesos, valores, capacidade, avaliar, rng)
     
     # Fase 2: Abandonar ninhos com baixa qualidade
     n_abandonados = calcular_ninhos_abandonados(len(ninhos), pa)
     ninhos, fitness_list = substituir_ninhos_abandonados(
-        ninhos, fitness_list, n_abandonados, n_itens, pesos, valores, capacidade
+        ninhos, fitness_list, n_abandonados, n_itens, pesos, valores, capacidade, avaliar, rng
     )
     
     # Fase 3: Encontrar o melhor ninho atual
@@ -78,11 +178,198 @@ def executar_iteracao_cuckoo(ninhos, fitness_list, pesos, valores, capacidade, p
     
     return ninhos, fitness_list, melhor_ninho
 
-def avaliar_melhor_solucao_final(melhor_ninho, pesos, valores, capacidade):
+def executar_iteracao_cuckoo_delta(ninhos, totais, fitness_list, pesos, valores, capacidade, pa, n_itens,
+                                   beta=1.5, escala=1.0, rng=None):
+    """Executa uma iteração do Cuckoo Search com voos de Lévy O(k) em lugar."""
+    # Fase 1: Gerar novos ninhos com voo de Lévy (heavy-tailed)
+    gerar_novos_ninhos_levy_delta(ninhos, totais, fitness_list, pesos, valores, capacidade, beta, escala, rng)
+
+    # Fase 2: Abandonar ninhos com baixa qualidade
+    n_abandonados = calcular_ninhos_abandonados(len(ninhos), pa)
+    substituir_ninhos_abandonados_delta(
+        ninhos, totais, fitness_list, n_abandonados, n_itens, pesos, valores, capacidade, rng
+    )
+
+def melhorar_ninhos(ninhos, fitness_list, melhorar, totais=None):
+    """Passo memético em lugar: busca local em cada ninho, atualizando fitness e totais em cache."""
+    for i, ninho in enumerate(ninhos):
+        _, valor, peso = melhorar(ninho, None if totais is None else totais[i])
+        fitness_list[i] = valor
+        if totais is not None:
+            totais[i] = (valor, peso)
+
+def inicializar_matriz_ninhos(n_ninhos, n_itens, rng):
+    """Gera todos os ninhos de uma vez como matriz binária (n_ninhos x n_itens)."""
+    return rng.integers(0, 2, size=(n_ninhos, n_itens), dtype=np.int8)
+
+def inicializar_matriz_ninhos_gulosa(n_ninhos, pesos, valores, capacidade, rng, taxa=TAXA_PERTURBACAO):
+    """Matriz de ninhos com a solução gulosa e perturbações reparadas dela, sorteadas pelo rng numpy."""
+    pesos, valores = pesos.tolist(), valores.tolist()
+    ordem = ordenar_por_razao(pesos, valores)
+    gulosa = np.array(solucao_gulosa(pesos, valores, capacidade, ordem), dtype=np.int8)
+    ninhos = np.tile(gulosa, (n_ninhos, 1))
+    ninhos[1:] ^= (rng.random((max(n_ninhos - 1, 0), len(pesos))) < taxa).astype(np.int8)
+    for ninho in ninhos[1:]:
+        ninho[:] = reparar_solucao(ninho.tolist(), pesos, valores, capacidade, ordem)
+    return ninhos
+
+def avaliar_matriz_ninhos(ninhos, pesos, valores, capacidade):
+    """Avalia todos os ninhos com produtos matriz-vetor; retorna (fitness, pesos_totais)."""
+    pesos_totais = ninhos @ pesos
+    fitness = np.where(pesos_totais <= capacidade, ninhos @ valores, 0)
+    return fitness, pesos_totais
+
+def aplicar_levy_flight_matricial(ninhos, rng, beta=1.5, escala=1.0):
+    """Gera um candidato por ninho invertendo k_i bits, com k_i amostrado por Mantegna."""
+    n_ninhos, n_itens = ninhos.shape
+    u = rng.normal(0, calcular_sigma_mantegna(beta), n_ninhos)
+    v = rng.normal(0, 1, n_ninhos)
+    passos = np.abs(u / np.abs(v) ** (1 / beta))
+    k = 1 + np.minimum(escala * passos, n_itens - 1).astype(np.int64)
+
+    # k_i colunas distintas por linha (com reposição, colunas repetidas se cancelariam),
+    # sorteadas sem permutar a linha inteira: O(k_i) por ninho
+    candidatos = ninhos.copy()
+    for i, k_i in enumerate(k):
+        candidatos[i, rng.choice(n_itens, k_i, replace=False)] ^= 1
+    return candidatos
+
+def substituir_ninhos_melhorados(ninhos, fitness, pesos_totais, candidatos, fitness_cand, pesos_cand):
+    """Substituição gulosa vetorizada: cada ninho é trocado pelo candidato se este for melhor."""
+    melhorou = fitness_cand > fitness
+    ninhos[melhorou] = candidatos[melhorou]
+    fitness[melhorou] = fitness_cand[melhorou]
+    pesos_totais[melhorou] = pesos_cand[melhorou]
+
+def abandonar_piores_ninhos(ninhos, fitness, pesos_totais, pa, pesos, valores, capacidade, rng):
+    """Substitui a fração pa de piores ninhos por novos ninhos aleatórios, em bloco."""
+    n_abandonados = calcular_ninhos_abandonados(len(ninhos), pa)
+    if n_abandonados == 0:
+        return
+    piores = np.argpartition(fitness, n_abandonados - 1)[:n_abandonados]
+    ninhos[piores] = inicializar_matriz_ninhos(n_abandonados, ninhos.shape[1], rng)
+    fitness[piores], pesos_totais[piores] = avaliar_matriz_ninhos(ninhos[piores], pesos, valores, capacidade)
+
+def criar_estado_cuckoo_matricial(iteracao, ninhos, fitness, pesos_totais, rng):
+    """Monta o snapshot do Cuckoo matricial: cópias das matrizes e estado do gerador numpy."""
+    return {
+        "algoritmo": "cuckoo_matricial",
+        "n_itens": ninhos.shape[1],
+        "iteracao": iteracao,
+        "ninhos": ninhos.copy(),
+        "fitness": fitness.copy(),
+        "pesos_totais": pesos_totais.copy(),
+        "rng": rng.bit_generator.state,
+    }
+
+def restaurar_estado_cuckoo_matricial(estado, n_itens, rng):
+    """Restaura um snapshot do Cuckoo matricial; retorna (proxima_iteracao, ninhos, fitness, pesos_totais)."""
+    validar_estado(estado, "cuckoo_matricial", n_itens)
+    rng.bit_generator.state = estado["rng"]
+    return estado["iteracao"] + 1, estado["ninhos"], estado["fitness"], estado["pesos_totais"]
+
+def cuckoo_search_matricial(pesos, valores, capacidade, n_ninhos=25, n_iteracoes=50, pa=0.25,
+                            beta_levy=1.5, escala_levy=1.0, semente=None, controle=None, checkpoint=None,
+                            partida_gulosa=False, rng=None):
+    """
+    Cuckoo Search com a população de ninhos em uma matriz (n_ninhos x n_itens).
+
+    Voos de Lévy, substituição gulosa e abandono da fração pa de piores ninhos
+    são operações vetorizadas sobre a matriz inteira. Sem semente, o gerador
+    numpy é semeado a partir de rng (padrão: o módulo random, preservando
+    random.seed()).
+    Com controle, cada iteração contabiliza n_ninhos + abandonados avaliações.
+    Com checkpoint, a execução continua do último snapshot gravado.
+    Com partida_gulosa, os ninhos iniciais partem da solução gulosa.
+
+    Returns:
+        Tupla contendo (melhor_solucao, melhor_valor, melhor_peso)
+    """
+    if semente is None:
+        semente = gerador(rng).getrandbits(64)
+    rng = np.random.default_rng(semente)  # Daqui em diante, todos os sorteios vêm do gerador numpy
+    pesos = np.asarray(pesos, dtype=np.int64)
+    valores = np.asarray(valores, dtype=np.int64)
+
+    # Fase 1: Inicialização (ou retomada do último checkpoint)
+    estado = checkpoint.carregar() if checkpoint is not None else None
+    if estado is not None:
+        inicio, ninhos, fitness, pesos_totais = restaurar_estado_cuckoo_matricial(estado, len(pesos), rng)
+    else:
+        inicio = 0
+        if partida_gulosa:
+            ninhos = inicializar_matriz_ninhos_gulosa(n_ninhos, pesos, valores, capacidade, rng)
+        else:
+            ninhos = inicializar_matriz_ninhos(n_ninhos, len(pesos), rng)
+        fitness, pesos_totais = avaliar_matriz_ninhos(ninhos, pesos, valores, capacidade)
+    avaliacoes_iteracao = n_ninhos + calcular_ninhos_abandonados(n_ninhos, pa)
+    if controle is not None:
+        melhor = int(np.argmax(fitness))
+        controle.registrar(int(fitness[melhor]), int(pesos_totais[melhor]))
+
+    # Fase 2: Loop principal das iterações
+    try:
+        for iteracao in range(inicio, n_iteracoes):
+            if controle is not None:
+                controle.contar(avaliacoes_iteracao)
+            candidatos = aplicar_levy_flight_matricial(ninhos, rng, beta_levy, escala_levy)
+            fitness_cand, pesos_cand = avaliar_matriz_ninhos(candidatos, pesos, valores, capacidade)
+            substituir_ninhos_melhorados(ninhos, fitness, pesos_totais, candidatos, fitness_cand, pesos_cand)
+            abandonar_piores_ninhos(ninhos, fitness, pesos_totais, pa, pesos, valores, capacidade, rng)
+            if controle is not None:
+                melhor = int(np.argmax(fitness))
+                controle.registrar(int(fitness[melhor]), int(pesos_totais[melhor]))
+                controle.concluir_iteracao(iteracao)
+            if checkpoint is not None:
+                checkpoint.talvez_salvar(iteracao, lambda: criar_estado_cuckoo_matricial(
+                    iteracao, ninhos, fitness, pesos_totais, rng
+                ))
+    except ExecucaoEsgotada:
+        pass
+    finally:
+        if checkpoint is not None:
+            checkpoint.aguardar()
+
+    # Fase 3: Melhor ninho final (o abandono só atinge os piores, então ele nunca é perdido)
+    melhor = int(np.argmax(fitness))
+    if controle is not None:
+        controle.registrar(int(fitness[melhor]), int(pesos_totais[melhor]))
+    return ninhos[melhor].tolist(), int(fitness[melhor]), int(pesos_totais[melhor])
+
+def avaliar_melhor_solucao_final(melhor_ninho, pesos, valores, capacidade, avaliar=None):
     """Avalia a melhor solução final encontrada."""
-    return avaliar_solucao(melhor_ninho, pesos, valores, capacidade)
+    return (avaliar or avaliar_solucao)(melhor_ninho, pesos, valores, capacidade)
+
+def criar_estado_cuckoo(iteracao, ninhos, fitness_list, totais, melhor_ninho, melhor_fitness, rng=None):
+    """Monta o snapshot do Cuckoo: ninhos, fitness, melhor ninho e estado do gerador aleatório."""
+    return {
+        "algoritmo": "cuckoo",
+        "n_itens": len(melhor_ninho),
+        "iteracao": iteracao,
+        "ninhos": codificar_populacao(ninhos),
+        "fitness": list(fitness_list),
+        "totais": None if totais is None else list(totais),
+        "melhor_ninho": codificar_bits(melhor_ninho),
+        "melhor_fitness": melhor_fitness,
+        "rng": gerador(rng).getstate(),
+    }
 
-def cuckoo_search(pesos, valores, capacidade, n_ninhos=25, n_iteracoes=50, pa=0.25):
+def restaurar_estado_cuckoo(estado, n_itens, rng=None):
+    """Restaura um snapshot do Cuckoo; retorna (proxima_iteracao, ninhos, fitness, totais, melhor, fitness_melhor)."""
+    validar_estado(estado, "cuckoo", n_itens)
+    gerador(rng).setstate(estado["rng"])
+    return (
+        estado["iteracao"] + 1,
+        decodificar_populacao(estado["ninhos"], n_itens),
+        estado["fitness"],
+        estado["totais"],
+        decodificar_bits(estado["melhor_ninho"]),
+        estado["melhor_fitness"],
+    )
+
+def cuckoo_search(pesos, valores, capacidade, n_ninhos=25, n_iteracoes=50, pa=0.25,
+                  levy_mantegna=False, beta_levy=1.5, escala_levy=1.0, matricial=False, avaliar=None,
+                  controle=None, checkpoint=None, partida_gulosa=False, rng=None, busca_local=None):
     """
     Implementa o algoritmo Cuckoo Search para o Problema da Mochila 0/1.
     
@@ -93,43 +380,108 @@ def cuckoo_search(pesos, valores, capacidade, n_ninhos=25, n_iteracoes=50, pa=0.
         n_ninhos: Número de ninhos (soluções) na população
         n_iteracoes: Número de iterações do algoritmo
         pa: Probabilidade de abandono (discovery rate of alien eggs)
+        levy_mantegna: Usa voos de Lévy de cauda pesada com custo O(k) por movimento
+        beta_levy: Expoente de estabilidade da distribuição de Lévy (0 < beta <= 2)
+        escala_levy: Fator que converte o tamanho do passo em número de inversões
+        matricial: Usa a população em matriz numpy (ver cuckoo_search_matricial)
+        avaliar: Backend de avaliação com a assinatura de utils.avaliar_solucao
+            (não usado nos modos levy_mantegna e matricial, que avaliam por delta/matriz)
+        controle: ControleExecucao opcional (prazo, orçamento de avaliações e
+            notificação de melhorias); ao esgotar, retorna o melhor ninho até ali
+        checkpoint: Checkpoint opcional; se houver snapshot gravado, a execução
+            continua dele (com o mesmo resultado de uma execução ininterrupta)
+        partida_gulosa: Ninhos iniciais com a solução gulosa por razão valor/peso
+            e perturbações reparadas dela (ver partida_gulosa.py)
+        rng: Gerador aleatório de todos os sorteios (padrão: o módulo random;
+            ver aleatorio.py); no modo matricial, só semeia o gerador numpy
+        busca_local: "primeira" ou "melhor" aplica a busca local 1-flip/troca
+            (ver busca_local.py) a todos os ninhos ao fim de cada iteração
+            (não disponível no modo matricial)
     
     Returns:
         Tupla contendo (melhor_solucao, melhor_valor, melhor_peso)
     """
+    if matricial:
+        if busca_local is not None:
+            raise ValueError("busca_local não está disponível no modo matricial")
+        return cuckoo_search_matricial(
+            pesos, valores, capacidade, n_ninhos, n_iteracoes, pa, beta_levy, escala_levy,
+            controle=controle, checkpoint=checkpoint, partida_gulosa=partida_gulosa, rng=rng
+        )
+
     n_itens = len(pesos)
+    melhorar = criar_busca_local(busca_local, pesos, valores, capacidade)
+    avaliar_final = avaliar
+    if controle is not None:
+        avaliar = controle.envolver(avaliar)
     
-    # Fase 1: Inicialização
-    ninhos = inicializar_populacao_ninhos(n_ninhos, n_itens)
-    fitness_list = calcular_fitness_populacao(ninhos, pesos, valores, capacidade)
-    melhor_ninho = encontrar_melhor_ninho(ninhos, fitness_list)
+    # Fase 1: Inicialização (ou retomada do último checkpoint)
+    estado = checkpoint.carregar() if checkpoint is not None else None
+    if estado is not None:
+        inicio, ninhos, fitness_list, totais, melhor_ninho, melhor_fitness = restaurar_estado_cuckoo(estado, n_itens, rng)
+    else:
+        inicio = 0
+        if partida_gulosa:
+            ninhos = gerar_populacao_gulosa(n_ninhos, pesos, valores, capacidade, rng=rng)
+        else:
+            ninhos = inicializar_populacao_ninhos(n_ninhos, n_itens, rng)
+        fitness_list = calcular_fitness_populacao(ninhos, pesos, valores, capacidade, avaliar)
+        melhor_ninho, melhor_fitness, _ = atualizar_melhor_ninho(ninhos, fitness_list, None, float("-inf"))
+        totais = [calcular_totais_ninho(ninho, pesos, valores) for ninho in ninhos] if levy_mantegna else None
+    avaliacoes_iteracao = n_ninhos + calcular_ninhos_abandonados(n_ninhos, pa)
+    if controle is not None:
+        controle.registrar(*avaliar_melhor_solucao_final(melhor_ninho, pesos, valores, capacidade, avaliar_final))
 
     # Fase 2: Loop principal das iterações
-    for iteracao in range(n_iteracoes):
-        ninhos, fitness_list, melhor_ninho = executar_iteracao_cuckoo(
-            ninhos, fitness_list, pesos, valores, capacidade, pa, n_itens
-        )
+    try:
+        for iteracao in range(inicio, n_iteracoes):
+            if levy_mantegna:
+                if controle is not None:
+                    controle.contar(avaliacoes_iteracao)
+                executar_iteracao_cuckoo_delta(
+                    ninhos, totais, fitness_list, pesos, valores, capacidade, pa, n_itens,
+                    beta_levy, escala_levy, rng
+                )
+            else:
+                ninhos, fitness_list, _ = executar_iteracao_cuckoo(
+                    ninhos, fitness_list, pesos, valores, capacidade, pa, n_itens, avaliar, rng
+                )
+            if melhorar is not None:
+                melhorar_ninhos(ninhos, fitness_list, melhorar, totais)
+            melhor_ninho, melhor_fitness, melhorou = atualizar_melhor_ninho(
+                ninhos, fitness_list, melhor_ninho, melhor_fitness
+            )
+            if controle is not None:
+                if melhorou:
+                    controle.registrar(
+                        *avaliar_melhor_solucao_final(melhor_ninho, pesos, valores, capacidade, avaliar_final)
+                    )
+                controle.concluir_iteracao(iteracao)
+            if checkpoint is not None:
+                checkpoint.talvez_salvar(iteracao, lambda: criar_estado_cuckoo(
+                    iteracao, ninhos, fitness_list, totais, melhor_ninho, melhor_fitness, rng
+                ))
+    except ExecucaoEsgotada:
+        pass
+    finally:
+        if checkpoint is not None:
+            checkpoint.aguardar()
 
     # Fase 3: Avaliação final
-    melhor_valor, melhor_peso = avaliar_melhor_solucao_final(melhor_ninho, pesos, valores, capacidade)
+    melhor_valor, melhor_peso = avaliar_melhor_solucao_final(melhor_ninho, pesos, valores, capacidade, avaliar_final)
+    if controle is not None:
+        controle.registrar(melhor_valor, melhor_peso)
     
     return melhor_ninho, melhor_valor, melhor_peso
 
-def criar_resultado_teste_cuckoo(n_itens, capacidade, valor, peso, tempo_execucao, pesos, valores, solucao):
-    """Cria um dicionário com os resultados de um teste Cuckoo Search."""
-    return {
-        "algoritmo": "Cuckoo Search",
-        "n_itens": n_itens,
-        "capacidade": capacidade,
-        "valor_total": valor,
-        "peso_total": peso,
-        "tempo_execucao": round(tempo_execucao, 5),
-        "pesos": pesos,
-        "valores": valores,
-        "melhor_solucao": solucao
-    }
+def criar_resultado_teste_cuckoo(n_itens, capacidade, valor, peso, tempo_execucao, pesos, valores, solucao,
+                                 catalogo=None):
+    """Cria o registro com os resultados de um teste Cuckoo Search."""
+    return criar_registro(
+        "Cuckoo Search", n_itens, capacidade, valor, peso, tempo_execucao, pesos, valores, solucao, catalogo=catalogo
+    )
 
-def executar_teste_cuckoo_para_instancia(n_itens):
+def executar_teste_cuckoo_para_instancia(n_itens, catalogo=None):
     """Executa um teste completo do Cuckoo Search para uma instância com n_itens."""
     pesos, valores, capacidade = gerar_instancia_aleatoria(n_itens)
     
@@ -141,16 +493,25 @@ def executar_teste_cuckoo_para_instancia(n_itens):
     
     return criar_resultado_teste_cuckoo(
         n_itens, capacidade, valor, peso,
-        tempo_execucao, pesos, valores, solucao
+        tempo_execucao, pesos, valores, solucao, catalogo
     )
 
-def main():
-    """Função principal que executa os testes Cuckoo Search para diferentes tamanhos de instância."""
+def main(ao_concluir=None, catalogo=None, concluidos=()):
+    """
+    Função principal que executa os testes Cuckoo Search para diferentes tamanhos de instância.
+    ao_concluir(resultado) é chamado com cada registro assim que ele termina, e os
+    tamanhos em concluidos (varredura retomada) não são executados. Com um
+    CatalogoInstancias (registros.py), os registros guardam as instâncias nele.
+    """
     tamanhos_instancia = [5, 1000, 10000]
     resultados_testes = []
     
     for n_itens in tamanhos_instancia:
-        resultado = executar_teste_cuckoo_para_instancia(n_itens)
+        if n_itens in concluidos:
+            continue
+        resultado = executar_teste_cuckoo_para_instancia(n_itens, catalogo)
         resultados_testes.append(resultado)
+        if ao_concluir is not None:
+            ao_concluir(resultado)
 
-    return pd.DataFrame(resultados_testes)
\ No newline at end of file
+    return resultados_testes
\ No newline at end of file
@@ -1,5 +1,6 @@
 import pytest
 import random
+import numpy as np
 from unittest.mock import patch, MagicMock
 from algCuckoo_ref import (
     inicializar_populacao_ninhos,
@@ -11,7 +12,16 @@ from algCuckoo_ref import (
     substituir_ninhos_abandonados,
     executar_iteracao_cuckoo,
     avaliar_melhor_solucao_final,
-    cuckoo_search
+    cuckoo_search,
+    calcular_numero_trocas,
+    calcular_totais_ninho,
+    aplicar_levy_flight_delta,
+    gerar_novos_ninhos_levy_delta,
+    avaliar_matriz_ninhos,
+    aplicar_levy_flight_matricial,
+    substituir_ninhos_melhorados,
+    abandonar_piores_ninhos,
+    cuckoo_search_matricial
 )
 
 
@@ -137,4 +147,99 @@ class TestCuckooSearch:
         valor, peso = avaliar_melhor_solucao_final(melhor_ninho, self.pesos, self.valores, self.capacidade)
         assert valor == 30
         assert peso == 5
-        mock_avaliar.assert_called_once_with(melhor_ninho, self.pesos, self.valores, self.capacidade)
\ No newline at end of file
+        mock_avaliar.assert_called_once_with(melhor_ninho, self.pesos, self.valores, self.capacidade)
+
+    def test_calcular_numero_trocas_cauda_pesada(self):
+        trocas = [calcular_numero_trocas(1000) for _ in range(2000)]
+        assert all(1 <= k <= 1000 for k in trocas)
+        # A maioria dos passos é curta, mas a cauda produz saltos longos
+        assert sorted(trocas)[len(trocas) // 2] <= 3
+        assert max(trocas) >= 20
+        assert calcular_numero_trocas(3, escala=1e9) == 3
+
+    def test_aplicar_levy_flight_delta(self):
+        ninho = [1, 0, 1, 0]
+        valor, peso = calcular_totais_ninho(ninho, self.pesos, self.valores)
+        with patch('algCuckoo_ref.calcular_numero_trocas', return_value=2):
+            with patch('random.sample', return_value=[0, 3]):
+                posicoes, novo_valor, novo_peso = aplicar_levy_flight_delta(
+                    ninho, valor, peso, self.pesos, self.valores
+                )
+        assert posicoes == [0, 3]
+        assert ninho == [0, 0, 1, 1]
+        assert (novo_valor, novo_peso) == calcular_totais_ninho(ninho, self.pesos, self.valores)
+        assert (novo_valor, novo_peso) == (35, 5)
+
+    def test_gerar_novos_ninhos_levy_delta_desfaz_rejeitados(self):
+        ninhos = [[1, 0, 1, 0], [0, 0, 0, 0]]
+        totais = [calcular_totais_ninho(n, self.pesos, self.valores) for n in ninhos]
+        fitness_list = [32, 0]
+        with patch('algCuckoo_ref.calcular_numero_trocas', return_value=1):
+            with patch('random.sample') as mock_sample:
+                mock_sample.side_effect = [[1], [3]]  # 1º excede a capacidade, 2º melhora
+                gerar_novos_ninhos_levy_delta(
+                    ninhos, totais, fitness_list, self.pesos, self.valores, self.capacidade
+                )
+        assert ninhos == [[1, 0, 1, 0], [0, 0, 0, 1]]
+        assert totais == [(32, 5), (15, 2)]
+        assert fitness_list == [32, 15]
+
+    def test_cuckoo_search_levy_mantegna(self):
+        n_itens = 200
+        pesos = [random.randint(1, 10) for _ in range(n_itens)]
+        valores = [random.randint(1, 20) for _ in range(n_itens)]
+        capacidade = sum(pesos) // 2
+        solucao, valor, peso = cuckoo_search(
+            pesos, valores, capacidade, n_ninhos=10, n_iteracoes=30, levy_mantegna=True
+        )
+        assert len(solucao) == n_itens
+        assert (valor, peso) == (
+            sum(v * s for v, s in zip(valores, solucao)) if peso <= capacidade else 0,
+            sum(p * s for p, s in zip(pesos, solucao))
+        )
+
+    def test_avaliar_matriz_ninhos(self):
+        ninhos = np.array([[1, 0, 1, 0], [1, 1, 1, 1]], dtype=np.int8)
+        fitness, pesos_totais = avaliar_matriz_ninhos(
+            ninhos, np.array(self.pesos), np.array(self.valores), self.capacidade
+        )
+        assert fitness.tolist() == [32, 0]
+        assert pesos_totais.tolist() == [5, 8]
+
+    def test_aplicar_levy_flight_matricial(self):
+        rng = np.random.default_rng(0)
+        ninhos = np.zeros((50, 100), dtype=np.int8)
+        candidatos = aplicar_levy_flight_matricial(ninhos, rng)
+        assert candidatos.shape == ninhos.shape
+        assert not ninhos.any()  # a matriz original não é alterada
+        assert set(np.unique(candidatos)) <= {0, 1}
+        assert candidatos.any(axis=1).all()  # colunas distintas: nenhuma inversão se cancela
+
+    def test_substituir_e_abandonar_ninhos(self):
+        pesos, valores = np.array(self.pesos), np.array(self.valores)
+        ninhos = np.array([[1, 0, 0, 0], [0, 1, 0, 0], [0, 0, 0, 0], [1, 0, 1, 0]], dtype=np.int8)
+        fitness, pesos_totais = avaliar_matriz_ninhos(ninhos, pesos, valores, self.capacidade)
+        candidatos = np.array([[1, 1, 0, 0], [1, 1, 1, 1], [0, 0, 0, 1], [0, 0, 0, 0]], dtype=np.int8)
+        fitness_cand, pesos_cand = avaliar_matriz_ninhos(candidatos, pesos, valores, self.capacidade)
+
+        substituir_ninhos_melhorados(ninhos, fitness, pesos_totais, candidatos, fitness_cand, pesos_cand)
+        assert ninhos.tolist() == [[1, 1, 0, 0], [0, 1, 0, 0], [0, 0, 0, 1], [1, 0, 1, 0]]
+        assert fitness.tolist() == [22, 10, 15, 32]
+
+        abandonar_piores_ninhos(ninhos, fitness, pesos_totais, 0.25, pesos, valores, self.capacidade,
+                                np.random.default_rng(1))
+        # Apenas o pior ninho (fitness 10) pode ter sido substituído
+        assert ninhos[[0, 2, 3]].tolist() == [[1, 1, 0, 0], [0, 0, 0, 1], [1, 0, 1, 0]]
+        esperado, _ = avaliar_matriz_ninhos(ninhos, pesos, valores, self.capacidade)
+        assert fitness.tolist() == esperado.tolist()
+
+    def test_cuckoo_search_matricial(self):
+        solucao, valor, peso = cuckoo_search(
+            self.pesos, self.valores, self.capacidade, n_ninhos=10, n_iteracoes=20, matricial=True
+        )
+        assert valor == 37  # ótimo da instância pequena
+        assert peso <= self.capacidade
+        assert isinstance(solucao, list) and len(solucao) == self.n_itens
+
+        repetido = cuckoo_search_matricial(self.pesos, self.valores, self.capacidade, semente=3)
+        assert repetido == cuckoo_search_matricial(self.pesos, self.valores, self.capacidade, semente=3)
@@ -0,0 +1,228 @@
+import math
+import random
+import time
+import tracemalloc
+from collections import namedtuple
+from contextlib import contextmanager
+from utils import avaliar_solucao, gerar_instancia_aleatoria, gerar_solucao_binaria
+
+# Com população e iterações fixas, o custo de todos os algoritmos deveria crescer linearmente em n
+EXPOENTE_ESPERADO = 1.0
+# Folga acima do expoente esperado antes de marcar a escalabilidade como suspeita
+TOLERANCIA_EXPOENTE = 0.25
+
+# Parâmetros reduzidos do estudo: interessa o crescimento do custo com n, não a qualidade
+PARAMETROS_ESTUDO = {
+    "aco": {"n_formigas": 5, "n_iteracoes": 3},
+    "bee": {"n_abelhas": 6, "n_melhores": 2, "n_vizinhos": 1, "n_iter": 3},
+    "cuckoo": {"n_ninhos": 5, "n_iteracoes": 3},
+    "genetico": {"tam_populacao": 6, "n_geracoes": 3},
+    "pso": {"n_particulas": 5, "n_iteracoes": 3},  # globais do módulo, ajustados só durante a medição
+}
+
+# Ajuste custo = coeficiente * n ** expoente
+AjustePotencia = namedtuple("AjustePotencia", ["expoente", "coeficiente"])
+
+# Resultado do estudo de um algoritmo ou fase ao longo da escada de tamanhos
+EstudoEscalabilidade = namedtuple("EstudoEscalabilidade", [
+    "nome", "tamanhos", "tempos", "memorias", "ajuste_tempo", "ajuste_memoria", "esperado", "suspeito",
+])
+
+
+def escada_tamanhos(minimo=10, maximo=10**6, por_decada=3):
+    """Tamanhos espaçados em escala logarítmica entre minimo e maximo (inclusive)."""
+    inicio = math.log10(minimo)
+    passos = round((math.log10(maximo) - inicio) * por_decada)
+    return sorted({round(10 ** (inicio + k / por_decada)) for k in range(passos + 1)})
+
+def medir(funcao, medir_memoria=True):
+    """
+    Executa funcao() e retorna (segundos, pico_de_memoria_em_bytes).
+
+    O tempo vem de uma execução sem tracemalloc (que deixa o Python mais lento);
+    a memória, de uma segunda execução rastreada.
+    """
+    inicio = time.perf_counter()
+    funcao()
+    segundos = time.perf_counter() - inicio
+    if not medir_memoria:
+        return segundos, None
+    tracemalloc.start()
+    try:
+        funcao()
+        _, pico = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return segundos, pico
+
+def ajustar_lei_potencia(tamanhos, medidas):
+    """Mínimos quadrados em log-log; pontos com medida não positiva são ignorados."""
+    pontos = [(math.log(n), math.log(m)) for n, m in zip(tamanhos, medidas) if n > 0 and m and m > 0]
+    if len(pontos) < 2:
+        return None
+    media_x = sum(x for x, _ in pontos) / len(pontos)
+    media_y = sum(y for _, y in pontos) / len(pontos)
+    variancia = sum((x - media_x) ** 2 for x, _ in pontos)
+    if variancia == 0:
+        return None
+    expoente = sum((x - media_x) * (y - media_y) for x, y in pontos) / variancia
+    return AjustePotencia(expoente, math.exp(media_y - expoente * media_x))
+
+def prever(ajuste, n):
+    """Custo previsto pelo ajuste para uma instância com n itens."""
+    return ajuste.coeficiente * n ** ajuste.expoente
+
+@contextmanager
+def _globais_pso(**valores):
+    """Ajusta temporariamente os parâmetros globais do PSO."""
+    import pso.algEnxParticulas_ref as modulo_pso
+
+    antigos = {nome: getattr(modulo_pso, nome) for nome in valores}
+    for nome, valor in valores.items():
+        setattr(modulo_pso, nome, valor)
+    try:
+        yield
+    finally:
+        for nome, valor in antigos.items():
+            setattr(modulo_pso, nome, valor)
+
+def preparar_algoritmo(algoritmo, parametros=None):
+    """Retorna preparar(pesos, valores, capacidade) -> função sem argumentos que resolve a instância."""
+    from resolvedores import resolver
+
+    parametros = PARAMETROS_ESTUDO[algoritmo] if parametros is None else parametros
+
+    def preparar(pesos, valores, capacidade):
+        if algoritmo == "pso":
+            def executar():
+                with _globais_pso(**parametros):
+                    resolver("pso", pesos, valores, capacidade)
+            return executar
+        return lambda: resolver(algoritmo, pesos, valores, capacidade, **parametros)
+    return preparar
+
+
+def _fase_aco_construcao(pesos, valores, capacidade):
+    from aco.algColonFormigas_ref import construir_solucao_formiga
+    feromonios = [1.0] * len(pesos)
+    return lambda: construir_solucao_formiga(pesos, valores, capacidade, feromonios, 1.0, 2.0)
+
+def _fase_aco_feromonios(pesos, valores, capacidade):
+    from aco.algColonFormigas_ref import atualizar_feromonios
+    feromonios = [1.0] * len(pesos)
+    solucao = gerar_solucao_binaria(len(pesos))
+    return lambda: atualizar_feromonios(feromonios, solucao, capacidade, 0.1, 100)
+
+def _fase_avaliacao(pesos, valores, capacidade):
+    solucao = gerar_solucao_binaria(len(pesos))
+    return lambda: avaliar_solucao(solucao, pesos, valores, capacidade)
+
+def _fase_bee_vizinhanca(pesos, valores, capacidade):
+    from bee_algorithm.beeAlgorithm_ref import explorar_vizinhanca
+    solucao = gerar_solucao_binaria(len(pesos))
+    return lambda: explorar_vizinhanca(solucao, 2, pesos, valores, capacidade)
+
+def _fase_cuckoo_levy_delta(pesos, valores, capacidade):
+    from cuckoo.algCuckoo_ref import aplicar_levy_flight_delta, calcular_totais_ninho
+    ninho = gerar_solucao_binaria(len(pesos))
+    valor, peso = calcular_totais_ninho(ninho, pesos, valores)
+    return lambda: aplicar_levy_flight_delta(ninho, valor, peso, pesos, valores)
+
+def _fase_genetico_geracao(pesos, valores, capacidade):
+    from geneticos.algGeneticos_ref import criar_nova_geracao
+    populacao = [gerar_solucao_binaria(len(pesos)) for _ in range(6)]
+    return lambda: criar_nova_geracao(populacao, pesos, valores, capacidade, 0.1)
+
+def _fase_pso_velocidade(pesos, valores, capacidade):
+    from pso.algEnxParticulas_ref import atualizar_velocidade, inicializar_particula
+    posicao, velocidade = inicializar_particula(len(pesos))
+    melhor_global = [random.uniform(-4, 4) for _ in pesos]
+    return lambda: atualizar_velocidade(velocidade, posicao, posicao, melhor_global)
+
+
+# Fases isoladas: nome -> (preparar(pesos, valores, capacidade), expoente esperado)
+FASES = {
+    "aco.construcao": (_fase_aco_construcao, 1.0),
+    "aco.feromonios": (_fase_aco_feromonios, 1.0),
+    "avaliacao": (_fase_avaliacao, 1.0),
+    "bee.vizinhanca": (_fase_bee_vizinhanca, 1.0),
+    "cuckoo.levy_delta": (_fase_cuckoo_levy_delta, 0.0),  # k trocas por voo, independente de n
+    "genetico.geracao": (_fase_genetico_geracao, 1.0),
+    "pso.velocidade": (_fase_pso_velocidade, 1.0),
+}
+
+
+def estudar(nome, preparar, tamanhos=None, orcamento=5.0, esperado=EXPOENTE_ESPERADO, medir_memoria=True,
+            pontos_ajuste=4, semente=0):
+    """
+    Mede tempo e pico de memória de preparar(...)() ao longo da escada de tamanhos.
+
+    A escada é interrompida quando uma execução passa de orcamento segundos ou
+    quando o ajuste até ali prevê que o próximo tamanho passaria. Os expoentes
+    são ajustados nos pontos_ajuste maiores tamanhos medidos (o regime
+    assintótico); suspeito indica expoente de tempo ou de memória acima de
+    esperado + TOLERANCIA_EXPOENTE.
+    """
+    tamanhos = escada_tamanhos() if tamanhos is None else tamanhos
+    random.seed(semente)
+    medidos, tempos, memorias = [], [], []
+    for n in tamanhos:
+        ajuste = ajustar_lei_potencia(medidos[-pontos_ajuste:], tempos[-pontos_ajuste:])
+        if ajuste is not None and prever(ajuste, n) > orcamento:
+            break
+        funcao = preparar(*gerar_instancia_aleatoria(n))
+        segundos, pico = medir(funcao, medir_memoria)
+        medidos.append(n)
+        tempos.append(segundos)
+        memorias.append(pico)
+        if segundos > orcamento:
+            break
+
+    ajuste_tempo = ajustar_lei_potencia(medidos[-pontos_ajuste:], tempos[-pontos_ajuste:])
+    ajuste_memoria = ajustar_lei_potencia(medidos[-pontos_ajuste:], memorias[-pontos_ajuste:]) \
+        if medir_memoria else None
+    suspeito = any(
+        ajuste is not None and ajuste.expoente > esperado + TOLERANCIA_EXPOENTE
+        for ajuste in (ajuste_tempo, ajuste_memoria)
+    )
+    return EstudoEscalabilidade(nome, medidos, tempos, memorias, ajuste_tempo, ajuste_memoria, esperado, suspeito)
+
+def estudar_algoritmos(algoritmos=None, **opcoes):
+    """Estudo de escalabilidade dos algoritmos completos (parâmetros de PARAMETROS_ESTUDO)."""
+    return [
+        estudar(algoritmo, preparar_algoritmo(algoritmo), **opcoes)
+        for algoritmo in (algoritmos or PARAMETROS_ESTUDO)
+    ]
+
+def estudar_fases(fases=None, **opcoes):
+    """Estudo de escalabilidade das fases isoladas de FASES."""
+    estudos = []
+    for fase in (fases or FASES):
+        preparar, esperado = FASES[fase]
+        estudos.append(estudar(fase, preparar, esperado=esperado, **opcoes))
+    return estudos
+
+def prever_tempo(estudo, n):
+    """Tempo previsto (segundos) para resolver uma instância de n itens; None sem ajuste."""
+    return None if estudo.ajuste_tempo is None else prever(estudo.ajuste_tempo, n)
+
+def formatar_relatorio(estudos, n_previsao=10**6):
+    """Tabela em texto com expoentes ajustados, previsão de tempo e marcação dos suspeitos."""
+    linhas = [f"{'nome':<20} {'n max':>8} {'exp tempo':>9} {'exp mem':>8} {'prev. n=' + str(n_previsao):>14}"]
+    for estudo in estudos:
+        exp_tempo = f"{estudo.ajuste_tempo.expoente:.2f}" if estudo.ajuste_tempo else "-"
+        exp_memoria = f"{estudo.ajuste_memoria.expoente:.2f}" if estudo.ajuste_memoria else "-"
+        previsao = prever_tempo(estudo, n_previsao)
+        previsao = f"{previsao:.3g}s" if previsao is not None else "-"
+        n_max = estudo.tamanhos[-1] if estudo.tamanhos else 0
+        marca = f"  <- acima de n^{estudo.esperado:g}" if estudo.suspeito else ""
+        linhas.append(f"{estudo.nome:<20} {n_max:>8} {exp_tempo:>9} {exp_memoria:>8} {previsao:>14}{marca}")
+    return "\n".join(linhas)
+
+def main():
+    print(formatar_relatorio(estudar_algoritmos()))
+    print()
+    print(formatar_relatorio(estudar_fases()))
+
+if __name__ == "__main__":
+    main()
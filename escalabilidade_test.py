@@ -0,0 +1,82 @@
+import pytest
+import escalabilidade
+from escalabilidade import (
+    ajustar_lei_potencia, escada_tamanhos, estudar, estudar_algoritmos, estudar_fases, formatar_relatorio, medir,
+    prever, prever_tempo
+)
+import pso.algEnxParticulas_ref as modulo_pso
+
+
+def custo_simulado(expoente_tempo, expoente_memoria=1.0, escala=1e-6):
+    """Fase fictícia cujo custo é exato: executar() devolve (segundos, bytes) para a instância."""
+    def preparar(pesos, valores, capacidade):
+        n = len(pesos)
+        return lambda: (escala * n ** expoente_tempo, 100 * n ** expoente_memoria)
+    return preparar
+
+
+class TestEscalabilidade:
+    """Classe de testes para o estudo empírico de escalabilidade"""
+
+    def test_escada_tamanhos(self):
+        """Testa a escada logarítmica de tamanhos"""
+        assert escada_tamanhos(10, 1000, 1) == [10, 100, 1000]
+        assert escada_tamanhos(10, 1000, 2) == [10, 32, 100, 316, 1000]
+
+    def test_ajuste_lei_potencia(self):
+        """Testa o ajuste log-log em dados exatos e a previsão"""
+        tamanhos = [10, 100, 1000]
+        ajuste = ajustar_lei_potencia(tamanhos, [3 * n ** 2 for n in tamanhos])
+
+        assert ajuste.expoente == pytest.approx(2.0)
+        assert ajuste.coeficiente == pytest.approx(3.0)
+        assert prever(ajuste, 10**4) == pytest.approx(3e8)
+        assert ajustar_lei_potencia([10], [1.0]) is None
+        assert ajustar_lei_potencia([10, 10], [1.0, 2.0]) is None
+
+    @pytest.fixture
+    def medir_simulado(self, monkeypatch):
+        """Troca a medição de relógio pelo custo exato das fases fictícias"""
+        def medir_custo(funcao, medir_memoria=True):
+            segundos, pico = funcao()
+            return segundos, pico if medir_memoria else None
+        monkeypatch.setattr(escalabilidade, "medir", medir_custo)
+
+    def test_quadratico_marcado_como_suspeito(self, medir_simulado):
+        """Testa que tempo ou memória quadráticos são marcados e os lineares não"""
+        tamanhos = [200, 400, 800]
+        quadratico = estudar("quadratica", custo_simulado(2.0), tamanhos, medir_memoria=False)
+        assert quadratico.suspeito and quadratico.ajuste_tempo.expoente == pytest.approx(2.0)
+        linear = estudar("linear", custo_simulado(1.0), tamanhos)
+        assert not linear.suspeito
+        assert linear.memorias == [20000, 40000, 80000]
+        assert linear.ajuste_memoria.expoente == pytest.approx(1.0)
+        assert estudar("memoria", custo_simulado(1.0, expoente_memoria=2.0), tamanhos).suspeito
+        assert not estudar("constante", custo_simulado(0.0), tamanhos, esperado=0.0, medir_memoria=False).suspeito
+
+    def test_orcamento_interrompe_escada(self, medir_simulado):
+        """Testa que a escada para quando a execução ou a previsão passa do orçamento"""
+        lenta = custo_simulado(1.0, escala=0.001)
+        estudo = estudar("lenta", lenta, [1, 2, 4, 8, 16, 1000], orcamento=0.05, medir_memoria=False)
+        assert estudo.tamanhos == [1, 2, 4, 8, 16]
+        assert prever_tempo(estudo, 1000) == pytest.approx(1.0)
+
+        # Sem ajuste possível, a execução que passa do orçamento é a última medida
+        estudo = estudar("lenta", lenta, [100, 10, 1000], orcamento=0.05, medir_memoria=False)
+        assert estudo.tamanhos == [100]
+
+    def test_medir(self):
+        """Testa a medição real de tempo e de pico de memória"""
+        segundos, pico = medir(lambda: [0] * 100_000)
+        assert segundos >= 0 and pico >= 800_000
+        assert medir(lambda: None, medir_memoria=False)[1] is None
+
+    def test_algoritmos_e_fases(self):
+        """Testa o estudo dos algoritmos (PSO com globais restaurados) e das fases, e o relatório"""
+        estudos = estudar_algoritmos(["aco", "pso"], tamanhos=[20, 40], medir_memoria=False)
+        estudos += estudar_fases(["aco.construcao", "cuckoo.levy_delta"], tamanhos=[20, 40])
+
+        assert [estudo.tamanhos for estudo in estudos] == [[20, 40]] * 4
+        assert modulo_pso.n_particulas == 30 and modulo_pso.n_iteracoes == 100
+        relatorio = formatar_relatorio(estudos)
+        assert all(nome in relatorio for nome in ["aco", "pso", "aco.construcao", "cuckoo.levy_delta"])
@@ -0,0 +1,134 @@
+import numpy as np
+
+# Memória máxima (bytes) da tabela de decisões da reconstrução por bitset
+LIMITE_MEMORIA_BITSET = 256 * 2**20
+
+
+def _preparar_instancia(pesos, valores):
+    return np.asarray(pesos, dtype=np.int64), np.asarray(valores, dtype=np.int64)
+
+def calcular_tabela_dp(pesos, valores, capacidade, decisoes=None):
+    """
+    Calcula a DP da mochila 0/1 em um único vetor sobre a capacidade.
+
+    Retorna dp, em que dp[c] é o melhor valor com capacidade c. O vetor é
+    atualizado item a item sem alocações por item, e só até a soma dos pesos já
+    processados. Se decisoes for uma lista, recebe para cada item um bitset
+    compactado (np.packbits) marcando as capacidades em que o item é escolhido,
+    junto com o alcance em que o bitset termina (None para itens descartados).
+    """
+    pesos, valores = _preparar_instancia(pesos, valores)
+    # int32 basta quando a soma dos valores cabe nele, e corta pela metade o tráfego de memória
+    tipo = np.int32 if int(valores[valores > 0].sum()) < 2**31 else np.int64
+    dp = np.zeros(capacidade + 1, dtype=tipo)
+    candidato = np.empty(capacidade + 1, dtype=tipo)
+    escolhe = np.empty(capacidade + 1, dtype=bool)
+    alcance = 0
+
+    for peso, valor in zip(pesos.tolist(), valores.tolist()):
+        if peso > capacidade or valor <= 0:  # Item nunca escolhido
+            if decisoes is not None:
+                decisoes.append(None)
+            continue
+
+        # Estende a região válida: acima do alcance anterior, dp é constante
+        novo_alcance = min(capacidade, alcance + peso)
+        dp[alcance + 1:novo_alcance + 1] = dp[alcance]
+        alcance = novo_alcance
+
+        n = alcance - peso + 1
+        np.add(dp[:n], valor, out=candidato[:n])
+        if decisoes is not None:
+            escolhe[:peso] = False
+            np.greater(candidato[:n], dp[peso:alcance + 1], out=escolhe[peso:alcance + 1])
+            decisoes.append((alcance, np.packbits(escolhe[:alcance + 1])))
+        np.maximum(dp[peso:alcance + 1], candidato[:n], out=dp[peso:alcance + 1])
+
+    # Capacidades acima do alcance têm o mesmo valor do alcance
+    dp[alcance + 1:] = dp[alcance]
+    return dp
+
+def valor_otimo(pesos, valores, capacidade):
+    """Retorna apenas o valor ótimo, com memória O(capacidade)."""
+    return int(calcular_tabela_dp(pesos, valores, capacidade)[capacidade])
+
+def _reconstruir_bitset(pesos, valores, capacidade, indices, solucao):
+    decisoes = []
+    calcular_tabela_dp(pesos[indices], valores[indices], capacidade, decisoes)
+
+    c = capacidade
+    for i in range(len(indices) - 1, -1, -1):
+        if decisoes[i] is None:
+            continue
+        alcance, bits = decisoes[i]
+        c = min(c, alcance)
+        if (bits[c >> 3] >> (7 - (c & 7))) & 1:
+            solucao[indices[i]] = 1
+            c -= int(pesos[indices[i]])
+
+def _reconstruir_hirschberg(pesos, valores, capacidade, indices, solucao, limite_memoria):
+    if len(indices) * (capacidade // 8 + 1) <= limite_memoria or len(indices) == 1:
+        _reconstruir_bitset(pesos, valores, capacidade, indices, solucao)
+        return
+
+    # Divide os itens ao meio e escolhe a partição da capacidade que maximiza a soma das metades
+    meio = len(indices) // 2
+    esquerda, direita = indices[:meio], indices[meio:]
+    dp_esquerda = calcular_tabela_dp(pesos[esquerda], valores[esquerda], capacidade)
+    dp_direita = calcular_tabela_dp(pesos[direita], valores[direita], capacidade)
+    corte = int(np.argmax(dp_esquerda.astype(np.int64) + dp_direita[::-1]))
+
+    _reconstruir_hirschberg(pesos, valores, corte, esquerda, solucao, limite_memoria)
+    _reconstruir_hirschberg(pesos, valores, capacidade - corte, direita, solucao, limite_memoria)
+
+def resolver_exato(pesos, valores, capacidade, limite_memoria=LIMITE_MEMORIA_BITSET):
+    """
+    Resolve a mochila 0/1 de forma exata por programação dinâmica.
+
+    A solução é reconstruída por bitsets de decisão (n·C/8 bytes) enquanto
+    couberem em limite_memoria; acima disso, os itens são divididos ao meio no
+    estilo de Hirschberg, com memória O(C) por nível e cerca do dobro do tempo.
+
+    Returns:
+        Tupla contendo (solucao, valor, peso)
+    """
+    pesos, valores = _preparar_instancia(pesos, valores)
+    solucao = [0] * len(pesos)
+    if len(pesos) > 0:
+        indices = np.arange(len(pesos))
+        _reconstruir_hirschberg(pesos, valores, capacidade, indices, solucao, limite_memoria)
+
+    vetor = np.asarray(solucao, dtype=np.int64)
+    return solucao, int(vetor @ valores), int(vetor @ pesos)
+
+def limitante_dantzig(pesos, valores, capacidade):
+    """
+    Limitante superior de Dantzig (relaxação linear) para a mochila 0/1.
+
+    Ordena os itens por razão valor/peso, coloca-os inteiros enquanto couberem e
+    o primeiro que não cabe entra fracionado. Itens mais pesados que a
+    capacidade são descartados e, como os valores são inteiros, o limitante é
+    arredondado para baixo. Custo O(n log n).
+    """
+    pesos, valores = _preparar_instancia(pesos, valores)
+    positivos = valores > 0
+    valor_gratis = int(valores[positivos & (pesos == 0)].sum())
+    uteis = positivos & (pesos > 0) & (pesos <= capacidade)
+    pesos, valores = pesos[uteis], valores[uteis]
+
+    ordem = np.argsort(-(valores / pesos), kind="stable")
+    pesos, valores = pesos[ordem], valores[ordem]
+    acumulado = np.cumsum(pesos)
+    k = int(np.searchsorted(acumulado, capacidade, side="right"))  # Itens que cabem inteiros
+
+    limitante = valor_gratis + int(valores[:k].sum())
+    if k < len(pesos):
+        resto = capacidade - (int(acumulado[k - 1]) if k > 0 else 0)
+        limitante += int(valores[k]) * resto // int(pesos[k])
+    return limitante
+
+def calcular_gap(valor, referencia):
+    """Distância relativa de um valor até o ótimo (ou limitante) de referência."""
+    if referencia <= 0:
+        return 0.0
+    return (referencia - valor) / referencia
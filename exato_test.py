@@ -0,0 +1,72 @@
+import pytest
+import itertools
+import random
+from exato import calcular_tabela_dp, valor_otimo, resolver_exato, limitante_dantzig, calcular_gap
+
+
+def otimo_forca_bruta(pesos, valores, capacidade):
+    """Enumera todas as soluções de uma instância pequena."""
+    melhor = 0
+    for solucao in itertools.product([0, 1], repeat=len(pesos)):
+        if sum(p * s for p, s in zip(pesos, solucao)) <= capacidade:
+            melhor = max(melhor, sum(v * s for v, s in zip(valores, solucao)))
+    return melhor
+
+
+class TestExato:
+    """Classe de testes para o resolvedor exato por programação dinâmica"""
+
+    def setup_method(self):
+        """Configuração executada antes de cada teste"""
+        random.seed(42)
+        self.pesos = [2, 1, 3, 2]
+        self.valores = [12, 10, 20, 15]
+        self.capacidade = 5
+
+    def test_tabela_dp(self):
+        """Testa o melhor valor para cada capacidade"""
+        dp = calcular_tabela_dp(self.pesos, self.valores, self.capacidade)
+        assert dp.tolist() == [0, 10, 15, 25, 30, 37]
+
+    def test_solucao_exemplo(self):
+        """Testa a solução ótima da instância de exemplo"""
+        assert resolver_exato(self.pesos, self.valores, self.capacidade) == ([1, 1, 0, 1], 37, 5)
+
+    @pytest.mark.parametrize("limite_memoria", [2**30, 0])
+    def test_igual_forca_bruta(self, limite_memoria):
+        """Testa o ótimo em instâncias aleatórias, com bitset e com divisão de Hirschberg"""
+        for _ in range(100):
+            n = random.randint(0, 10)
+            pesos = [random.randint(0, 12) for _ in range(n)]
+            valores = [random.randint(-2, 20) for _ in range(n)]
+            capacidade = random.randint(0, 40)
+
+            otimo = otimo_forca_bruta(pesos, valores, capacidade)
+            solucao, valor, peso = resolver_exato(pesos, valores, capacidade, limite_memoria)
+            assert valor_otimo(pesos, valores, capacidade) == otimo
+            assert valor == otimo
+            assert peso == sum(p * s for p, s in zip(pesos, solucao)) <= capacidade
+
+    def test_valores_grandes(self):
+        """Testa que somas de valores acima de int32 não estouram"""
+        assert valor_otimo([1, 1, 1], [2**31 - 1, 2**31 - 1, 5], 2) == 2**32 - 2
+
+    def test_calcular_gap(self):
+        """Testa o gap relativo para a referência"""
+        assert calcular_gap(30, 40) == 0.25
+        assert calcular_gap(40, 40) == 0.0
+        assert calcular_gap(0, 0) == 0.0
+
+    def test_limitante_dantzig_exemplo(self):
+        """Testa o limitante fracionário da instância de exemplo"""
+        # Razões: 10, 7.5, 6.67, 6 -> itens 1 e 3 inteiros (peso 3) + 2/3 do item 2
+        assert limitante_dantzig(self.pesos, self.valores, self.capacidade) == 38
+
+    def test_limitante_dantzig_domina_otimo(self):
+        """Testa que o limitante nunca fica abaixo do ótimo"""
+        for _ in range(200):
+            n = random.randint(0, 10)
+            pesos = [random.randint(0, 12) for _ in range(n)]
+            valores = [random.randint(-2, 20) for _ in range(n)]
+            capacidade = random.randint(0, 40)
+            assert limitante_dantzig(pesos, valores, capacidade) >= valor_otimo(pesos, valores, capacidade)
@@ -1,91 +1,248 @@
-import random
 import time
-import pandas as pd
 from utils import gerar_instancia_aleatoria, avaliar_solucao, gerar_solucao_binaria
+from controle import ExecucaoEsgotada
+from registros import criar_registro, para_dataframe
+from aleatorio import gerador, uniformes_em_bloco
+from partida_gulosa import gerar_populacao_gulosa
+from busca_local import criar_busca_local
+from checkpoint import codificar_bits, codificar_populacao, decodificar_bits, decodificar_populacao, validar_estado
 
-def avaliar_individuo(individuo, pesos, valores, capacidade):
+def avaliar_individuo(individuo, pesos, valores, capacidade, avaliar=None):
     """Avalia fitness de um indivíduo com penalização."""
-    valor, peso_total = avaliar_solucao(individuo, pesos, valores, capacidade)
+    valor, peso_total = (avaliar or avaliar_solucao)(individuo, pesos, valores, capacidade)
     if peso_total > capacidade:
         excesso = peso_total - capacidade
         return valor - excesso * 2  # Penalização
     return valor
 
-def criar_populacao_inicial(tam_populacao, n_itens):
+def criar_populacao_inicial(tam_populacao, n_itens, rng=None):
     """Cria população inicial aleatória."""
-    return [gerar_solucao_binaria(n_itens) for _ in range(tam_populacao)]
+    return [gerar_solucao_binaria(n_itens, rng) for _ in range(tam_populacao)]
 
-def selecionar_pais(populacao, pesos, valores, capacidade, tamanho_torneio=3):
+def selecionar_pais(populacao, pesos, valores, capacidade, tamanho_torneio=3, avaliar=None, rng=None):
     """Seleciona dois pais por torneio."""
+    rng = gerador(rng)
+
     def torneio():
-        competidores = random.sample(populacao, tamanho_torneio)
-        return max(competidores, key=lambda ind: avaliar_individuo(ind, pesos, valores, capacidade))
+        competidores = rng.sample(populacao, tamanho_torneio)
+        return max(competidores, key=lambda ind: avaliar_individuo(ind, pesos, valores, capacidade, avaliar))
 
     return torneio(), torneio()
 
-def fazer_crossover(pai1, pai2):
+def fazer_crossover(pai1, pai2, rng=None):
     """Realiza crossover de um ponto."""
-    ponto = random.randint(1, len(pai1) - 1)
+    ponto = gerador(rng).randint(1, len(pai1) - 1)
     filho1 = pai1[:ponto] + pai2[ponto:]
     filho2 = pai2[:ponto] + pai1[ponto:]
     return filho1, filho2
 
-def aplicar_mutacao(individuo, taxa_mutacao):
+def aplicar_mutacao(individuo, taxa_mutacao, rng=None):
     """Aplica mutação bit a bit."""
+    sorteios = uniformes_em_bloco(rng, len(individuo))
+    if sorteios is not None:
+        return [1 - bit if u < taxa_mutacao else bit for bit, u in zip(individuo, sorteios)]
+    rng = gerador(rng)
     individuo_mutado = individuo[:]
     for i in range(len(individuo_mutado)):
-        if random.random() < taxa_mutacao:
+        if rng.random() < taxa_mutacao:
             individuo_mutado[i] = 1 - individuo_mutado[i]
     return individuo_mutado
 
-def criar_nova_geracao(populacao, pesos, valores, capacidade, taxa_mutacao):
-    """Cria nova geração através de seleção, crossover e mutação."""
+def criar_nova_geracao(populacao, pesos, valores, capacidade, taxa_mutacao, avaliar=None, rng=None, melhorar=None):
+    """Cria nova geração através de seleção, crossover, mutação e, com melhorar, busca local nos filhos."""
     nova_populacao = []
     tam_populacao = len(populacao)
 
     while len(nova_populacao) < tam_populacao:
         # Seleção
-        pai1, pai2 = selecionar_pais(populacao, pesos, valores, capacidade)
+        pai1, pai2 = selecionar_pais(populacao, pesos, valores, capacidade, avaliar=avaliar, rng=rng)
 
         # Crossover
-        filho1, filho2 = fazer_crossover(pai1, pai2)
+        filho1, filho2 = fazer_crossover(pai1, pai2, rng)
 
         # Mutação
-        filho1 = aplicar_mutacao(filho1, taxa_mutacao)
-        filho2 = aplicar_mutacao(filho2, taxa_mutacao)
+        filho1 = aplicar_mutacao(filho1, taxa_mutacao, rng)
+        filho2 = aplicar_mutacao(filho2, taxa_mutacao, rng)
+
+        # Passo memético (ver busca_local.py)
+        if melhorar is not None:
+            melhorar(filho1)
+            melhorar(filho2)
 
         nova_populacao.extend([filho1, filho2])
 
     return nova_populacao[:tam_populacao]
 
-def encontrar_melhor_individuo(populacao, pesos, valores, capacidade):
+def criar_buffer_inativo(populacao):
+    """Pré-aloca o segundo buffer com a mesma forma da população."""
+    return [individuo[:] for individuo in populacao]
+
+def fazer_crossover_em_lugar(pai1, pai2, filho1, filho2=None, rng=None):
+    """Realiza crossover de um ponto escrevendo os filhos em listas pré-alocadas."""
+    ponto = gerador(rng).randint(1, len(pai1) - 1)
+    filho1[:ponto] = pai1[:ponto]
+    filho1[ponto:] = pai2[ponto:]
+    if filho2 is not None:
+        filho2[:ponto] = pai2[:ponto]
+        filho2[ponto:] = pai1[ponto:]
+
+def aplicar_mutacao_em_lugar(individuo, taxa_mutacao, rng=None):
+    """Aplica mutação bit a bit diretamente sobre o indivíduo."""
+    sorteios = uniformes_em_bloco(rng, len(individuo))
+    if sorteios is not None:
+        for i, u in enumerate(sorteios):
+            if u < taxa_mutacao:
+                individuo[i] = 1 - individuo[i]
+        return
+    rng = gerador(rng)
+    for i in range(len(individuo)):
+        if rng.random() < taxa_mutacao:
+            individuo[i] = 1 - individuo[i]
+
+def criar_nova_geracao_em_buffer(populacao, destino, pesos, valores, capacidade, taxa_mutacao, avaliar=None,
+                                 rng=None, melhorar=None):
+    """Escreve a nova geração no buffer inativo, sem alocar novos indivíduos."""
+    tam_populacao = len(populacao)
+
+    for i in range(0, tam_populacao, 2):
+        # Seleção
+        pai1, pai2 = selecionar_pais(populacao, pesos, valores, capacidade, avaliar=avaliar, rng=rng)
+
+        # Crossover direto no buffer (último filho descartado se tamanho ímpar)
+        filho1 = destino[i]
+        filho2 = destino[i + 1] if i + 1 < tam_populacao else None
+        fazer_crossover_em_lugar(pai1, pai2, filho1, filho2, rng)
+
+        # Mutação
+        aplicar_mutacao_em_lugar(filho1, taxa_mutacao, rng)
+        if filho2 is not None:
+            aplicar_mutacao_em_lugar(filho2, taxa_mutacao, rng)
+
+        # Passo memético (ver busca_local.py)
+        if melhorar is not None:
+            melhorar(filho1)
+            if filho2 is not None:
+                melhorar(filho2)
+
+    return destino
+
+def encontrar_melhor_individuo(populacao, pesos, valores, capacidade, avaliar=None):
     """Encontra o melhor indivíduo da população."""
-    melhor = max(populacao, key=lambda ind: avaliar_individuo(ind, pesos, valores, capacidade))
-    melhor_valor = avaliar_individuo(melhor, pesos, valores, capacidade)
+    melhor = max(populacao, key=lambda ind: avaliar_individuo(ind, pesos, valores, capacidade, avaliar))
+    melhor_valor = avaliar_individuo(melhor, pesos, valores, capacidade, avaliar)
     return melhor, melhor_valor
 
-def algoritmo_genetico(pesos, valores, capacidade, tam_populacao=20, taxa_mutacao=0.1, n_geracoes=50):
-    """Executa o algoritmo genético."""
+def registrar_melhor_individuo(controle, individuo, pesos, valores, capacidade):
+    """Informa ao controle de execução o melhor indivíduo, se for viável (o fitness penalizado não é notificado)."""
+    valor, peso = avaliar_solucao(individuo, pesos, valores, capacidade)
+    if peso <= capacidade:
+        controle.registrar(valor, peso)
+
+def criar_estado_genetico(geracao, populacao, melhor_solucao, melhor_valor, rng=None):
+    """Monta o snapshot do AG: população, melhor indivíduo e estado do gerador aleatório."""
+    return {
+        "algoritmo": "genetico",
+        "n_itens": len(melhor_solucao),
+        "iteracao": geracao,
+        "populacao": codificar_populacao(populacao),
+        "melhor_solucao": codificar_bits(melhor_solucao),
+        "melhor_valor": melhor_valor,
+        "rng": gerador(rng).getstate(),
+    }
+
+def restaurar_estado_genetico(estado, n_itens, rng=None):
+    """Restaura um snapshot do AG; retorna (proxima_geracao, populacao, melhor_solucao, melhor_valor)."""
+    validar_estado(estado, "genetico", n_itens)
+    gerador(rng).setstate(estado["rng"])
+    return (
+        estado["iteracao"] + 1,
+        decodificar_populacao(estado["populacao"], n_itens),
+        decodificar_bits(estado["melhor_solucao"]),
+        estado["melhor_valor"],
+    )
+
+def algoritmo_genetico(pesos, valores, capacidade, tam_populacao=20, taxa_mutacao=0.1, n_geracoes=50,
+                       buffer_duplo=False, avaliar=None, controle=None, checkpoint=None, partida_gulosa=False,
+                       rng=None, busca_local=None):
+    """
+    Executa o algoritmo genético.
+
+    Com buffer_duplo=True a população vive em dois buffers pré-alocados: cada
+    geração é escrita no buffer inativo e os buffers são trocados, de modo que
+    nenhum indivíduo novo é alocado durante a evolução.
+
+    avaliar é o backend de avaliação, com a assinatura de utils.avaliar_solucao.
+    controle é um ControleExecucao opcional (prazo, orçamento de avaliações e
+    notificação de melhorias); ao esgotar, retorna o melhor indivíduo até ali.
+    checkpoint é um Checkpoint opcional; se houver snapshot gravado, a evolução
+    continua dele com o mesmo resultado de uma execução ininterrupta.
+    Com partida_gulosa=True a população inicial é a solução gulosa por razão
+    valor/peso e perturbações reparadas dela (ver partida_gulosa.py).
+    rng é o gerador aleatório de todos os sorteios (padrão: o módulo random;
+    ver aleatorio.py).
+    busca_local ("primeira" ou "melhor") aplica a busca local 1-flip/troca de
+    busca_local.py a cada filho, antes da avaliação.
+    """
     n_itens = len(pesos)
+    melhorar = criar_busca_local(busca_local, pesos, valores, capacidade)
+    if controle is not None:
+        avaliar = controle.envolver(avaliar)
+
+    # Inicialização (ou retomada do último checkpoint)
+    estado = checkpoint.carregar() if checkpoint is not None else None
+    if estado is not None:
+        inicio, populacao, melhor_solucao, melhor_valor = restaurar_estado_genetico(estado, n_itens, rng)
+    else:
+        inicio = 0
+        if partida_gulosa:
+            populacao = gerar_populacao_gulosa(tam_populacao, pesos, valores, capacidade, rng=rng)
+        else:
+            populacao = criar_populacao_inicial(tam_populacao, n_itens, rng)
+        melhor_solucao, melhor_valor = encontrar_melhor_individuo(populacao, pesos, valores, capacidade, avaliar)
+    if buffer_duplo:
+        inativa = criar_buffer_inativo(populacao)
+        melhor_solucao = melhor_solucao[:]
 
-    # Inicialização
-    populacao = criar_populacao_inicial(tam_populacao, n_itens)
-    melhor_solucao, melhor_valor = encontrar_melhor_individuo(populacao, pesos, valores, capacidade)
+    if controle is not None:
+        registrar_melhor_individuo(controle, melhor_solucao, pesos, valores, capacidade)
 
     # Evolução
-    for _ in range(n_geracoes):
-        # Criar nova geração
-        populacao = criar_nova_geracao(populacao, pesos, valores, capacidade, taxa_mutacao)
+    try:
+        for geracao in range(inicio, n_geracoes):
+            # Criar nova geração
+            if buffer_duplo:
+                criar_nova_geracao_em_buffer(
+                    populacao, inativa, pesos, valores, capacidade, taxa_mutacao, avaliar, rng, melhorar
+                )
+                populacao, inativa = inativa, populacao
+            else:
+                populacao = criar_nova_geracao(
+                    populacao, pesos, valores, capacidade, taxa_mutacao, avaliar, rng, melhorar
+                )
 
-        # Atualizar melhor solução se necessário
-        melhor_atual, valor_atual = encontrar_melhor_individuo(populacao, pesos, valores, capacidade)
-        if valor_atual > melhor_valor:
-            melhor_solucao = melhor_atual
-            melhor_valor = valor_atual
+            # Atualizar melhor solução se necessário (cópia, pois os buffers são reutilizados)
+            melhor_atual, valor_atual = encontrar_melhor_individuo(populacao, pesos, valores, capacidade, avaliar)
+            if valor_atual > melhor_valor:
+                melhor_solucao = melhor_atual[:] if buffer_duplo else melhor_atual
+                melhor_valor = valor_atual
+                if controle is not None:
+                    registrar_melhor_individuo(controle, melhor_solucao, pesos, valores, capacidade)
+            if controle is not None:
+                controle.concluir_iteracao(geracao)
+
+            if checkpoint is not None:
+                checkpoint.talvez_salvar(geracao, lambda: criar_estado_genetico(
+                    geracao, populacao, melhor_solucao, melhor_valor, rng
+                ))
+    except ExecucaoEsgotada:
+        pass
+    finally:
+        if checkpoint is not None:
+            checkpoint.aguardar()
 
     return melhor_solucao, melhor_valor
 
-def executar_teste(n_itens):
+def executar_teste(n_itens, catalogo=None):
     """Executa um teste com n_itens."""
     pesos, valores, capacidade = gerar_instancia_aleatoria(n_itens)
 
@@ -95,30 +252,26 @@ def executar_teste(n_itens):
 
     peso_total = sum(p * i for p, i in zip(pesos, solucao))
 
-    return {
-        "algoritmo": "Algoritmo Genético",
-        "n_itens": n_itens,
-        "capacidade": capacidade,
-        "valor_total": valor,
-        "peso_total": peso_total,
-        "tempo_execucao": round(fim - inicio, 5),
-        "pesos": pesos,
-        "valores": valores,
-        "melhor_solucao": solucao
-    }
+    return criar_registro(
+        "Algoritmo Genético", n_itens, capacidade, valor, peso_total, fim - inicio, pesos, valores, solucao,
+        catalogo=catalogo
+    )
 
-def main():
+def main(ao_concluir=None, catalogo=None, concluidos=()):
     testes = []
     tamanhos = [5, 1000, 10000]
 
     for n in tamanhos:
-        teste = executar_teste(n)
+        if n in concluidos:
+            continue
+        teste = executar_teste(n, catalogo)
         testes.append(teste)
+        if ao_concluir is not None:
+            ao_concluir(teste)
 
-    df = pd.DataFrame(testes)
-    return df
+    return testes
 
 if __name__ == "__main__":
-    df = main()
+    df = para_dataframe(main())
     print("\nResumo dos resultados de todos os testes:")
     print(df)
\ No newline at end of file
@@ -10,8 +10,13 @@ from algGeneticos_ref import (
     criar_nova_geracao,
     encontrar_melhor_individuo,
     algoritmo_genetico,
-    executar_teste
+    executar_teste,
+    criar_buffer_inativo,
+    fazer_crossover_em_lugar,
+    aplicar_mutacao_em_lugar,
+    criar_nova_geracao_em_buffer
 )
+from registros import CatalogoInstancias
 
 
 class TestAlgoritmoGenetico:
@@ -144,7 +149,7 @@ class TestAlgoritmoGenetico:
                     mock_crossover.return_value = ([1, 1, 0, 0], [0, 0, 0, 0])
                     
                     # Configura mutação (sem mudanças)
-                    mock_mutacao.side_effect = lambda ind, taxa: ind
+                    mock_mutacao.side_effect = lambda ind, taxa, rng=None: ind
                     
                     nova_geracao = criar_nova_geracao(
                         populacao, self.pesos, self.valores, 
@@ -231,7 +236,7 @@ class TestAlgoritmoGenetico:
         with patch('time.time') as mock_time:
             mock_time.side_effect = [0.0, 0.5]  # Tempo de execução = 0.5s
             
-            resultado = executar_teste(n_itens)
+            resultado = executar_teste(n_itens, CatalogoInstancias())
             
             assert resultado["algoritmo"] == "Algoritmo Genético"
             assert resultado["n_itens"] == n_itens
@@ -275,4 +280,67 @@ class TestAlgoritmoGenetico:
             valores.append(valor)
         
         # Com gerações suficientes, deve encontrar soluções razoáveis
-        assert max(valores) >= 20  # Pelo menos o valor de um item bom
\ No newline at end of file
+        assert max(valores) >= 20  # Pelo menos o valor de um item bom
+
+    def test_fazer_crossover_em_lugar(self):
+        """Testa o crossover escrito em listas pré-alocadas"""
+        pai1 = [1, 1, 1, 1]
+        pai2 = [0, 0, 0, 0]
+        filho1 = [9, 9, 9, 9]
+        filho2 = [9, 9, 9, 9]
+        ids = (id(filho1), id(filho2))
+
+        with patch('random.randint') as mock_random:
+            mock_random.return_value = 2
+
+            fazer_crossover_em_lugar(pai1, pai2, filho1, filho2)
+
+        assert filho1 == [1, 1, 0, 0]
+        assert filho2 == [0, 0, 1, 1]
+        assert (id(filho1), id(filho2)) == ids
+
+    def test_aplicar_mutacao_em_lugar(self):
+        """Testa a mutação aplicada diretamente no indivíduo"""
+        individuo = [1, 0, 1, 0]
+
+        with patch('random.random') as mock_random:
+            mock_random.side_effect = [0.1, 0.6, 0.3, 0.8]
+
+            aplicar_mutacao_em_lugar(individuo, 0.5)
+
+        assert individuo == [0, 0, 0, 0]
+
+    def test_criar_nova_geracao_em_buffer_tamanho_impar(self):
+        """Testa que a nova geração é escrita no buffer inativo, inclusive com tamanho ímpar"""
+        populacao = [[1, 0, 0, 0], [0, 1, 0, 0], [0, 0, 1, 0]]
+        destino = criar_buffer_inativo(populacao)
+        ids = [id(ind) for ind in destino]
+
+        nova = criar_nova_geracao_em_buffer(
+            populacao, destino, self.pesos, self.valores, self.capacidade, 0.0
+        )
+
+        assert nova is destino
+        assert [id(ind) for ind in nova] == ids
+        assert all(len(ind) == self.n_itens for ind in nova)
+        assert populacao == [[1, 0, 0, 0], [0, 1, 0, 0], [0, 0, 1, 0]]
+
+    def test_algoritmo_genetico_buffer_duplo_reutiliza_buffers(self):
+        """Testa que o modo de buffer duplo não aloca novos indivíduos entre gerações"""
+        ids_vistos = set()
+        original = criar_nova_geracao_em_buffer
+
+        def espiao(populacao, destino, *args):
+            ids_vistos.update(id(ind) for ind in populacao)
+            ids_vistos.update(id(ind) for ind in destino)
+            return original(populacao, destino, *args)
+
+        with patch('algGeneticos_ref.criar_nova_geracao_em_buffer', side_effect=espiao):
+            solucao, valor = algoritmo_genetico(
+                self.pesos, self.valores, self.capacidade,
+                tam_populacao=6, taxa_mutacao=0.1, n_geracoes=10, buffer_duplo=True
+            )
+
+        assert len(ids_vistos) == 12  # dois buffers de 6 indivíduos
+        assert len(solucao) == self.n_itens
+        assert id(solucao) not in ids_vistos  # melhor solução é cópia, não alias do buffer
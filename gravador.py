@@ -0,0 +1,169 @@
+import csv
+import io
+import json
+import os
+import time
+
+# Colunas das linhas gravadas por main.py: uma linha por execução
+COLUNAS_RESULTADO = ["n_itens", "tempo_execucao", "gap_otimo", "gap_limitante", "algoritmo", "versao"]
+
+# Ordem das colunas na tabela pivotada
+ORDEM_ALGORITMOS = ["Bee Algorithm", "Algoritmo ACO", "Cuckoo Search", "PSO", "Algoritmo Genético"]
+
+
+def _formato(caminho, formato):
+    formato = formato or os.path.splitext(caminho)[1].lstrip(".").lower()
+    if formato not in ("jsonl", "csv"):
+        raise ValueError(f"Formato de resultados desconhecido: {formato!r} (use jsonl ou csv)")
+    return formato
+
+def _descartar_linha_incompleta(caminho):
+    """Corta a última linha se ela não termina em quebra de linha (gravação interrompida)."""
+    with open(caminho, "rb+") as arquivo:
+        tamanho = arquivo.seek(0, os.SEEK_END)
+        if tamanho == 0:
+            return
+        arquivo.seek(tamanho - 1)
+        if arquivo.read(1) == b"\n":
+            return
+        arquivo.seek(0)
+        dados = arquivo.read()
+        arquivo.truncate(dados.rfind(b"\n") + 1)
+
+def _converter_celula(texto):
+    """Valor de uma célula CSV: int, float ou texto."""
+    for tipo in (int, float):
+        try:
+            return tipo(texto)
+        except ValueError:
+            pass
+    return texto
+
+
+class GravadorResultados:
+    """
+    Gravador incremental de resultados, uma linha por execução (JSONL ou CSV).
+
+    Cada linha é escrita e enviada ao sistema operacional assim que a execução
+    termina; o fsync é feito em lotes (a cada lote_fsync linhas ou intervalo_fsync
+    segundos, e ao fechar), de modo que uma queda perde no máximo o último lote.
+    O arquivo é aberto em modo de acréscimo: uma varredura interrompida continua
+    no mesmo arquivo, e uma linha cortada pela queda é descartada ao reabrir.
+    """
+
+    def __init__(self, caminho, formato=None, colunas=None, lote_fsync=32, intervalo_fsync=1.0):
+        self.caminho = caminho
+        self.formato = _formato(caminho, formato)
+        self.lote_fsync = lote_fsync
+        self.intervalo_fsync = intervalo_fsync
+        self._pendentes = 0
+        self._ultimo_fsync = time.monotonic()
+
+        if os.path.exists(caminho):
+            _descartar_linha_incompleta(caminho)
+        self._arquivo = open(caminho, "a", encoding="utf-8", newline="")
+        self._colunas = colunas
+        if self.formato == "csv":
+            if self._arquivo.tell() > 0:
+                with open(caminho, encoding="utf-8", newline="") as existente:
+                    self._colunas = next(csv.reader(existente))
+            elif colunas is not None:
+                self._escrever_csv(colunas)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.fechar()
+
+    def _escrever_csv(self, valores):
+        buffer = io.StringIO()
+        csv.writer(buffer, lineterminator="\n").writerow(valores)
+        self._arquivo.write(buffer.getvalue())
+
+    def gravar(self, linha):
+        """Acrescenta uma linha (dicionário coluna -> valor) ao arquivo."""
+        if self.formato == "jsonl":
+            self._arquivo.write(json.dumps(linha, ensure_ascii=False) + "\n")
+        else:
+            if self._colunas is None:
+                self._colunas = list(linha)
+                self._escrever_csv(self._colunas)
+            self._escrever_csv([linha.get(coluna, "") for coluna in self._colunas])
+        self._arquivo.flush()
+
+        self._pendentes += 1
+        if self._pendentes >= self.lote_fsync or time.monotonic() - self._ultimo_fsync >= self.intervalo_fsync:
+            self.sincronizar()
+
+    def sincronizar(self):
+        """Força as linhas pendentes para o disco."""
+        self._arquivo.flush()
+        os.fsync(self._arquivo.fileno())
+        self._pendentes = 0
+        self._ultimo_fsync = time.monotonic()
+
+    def fechar(self):
+        if not self._arquivo.closed:
+            self.sincronizar()
+            self._arquivo.close()
+
+
+def ler_resultados(caminho, formato=None):
+    """
+    Lê as linhas gravadas por GravadorResultados (lista de dicionários).
+
+    Uma última linha incompleta, deixada por uma varredura interrompida, é ignorada.
+    """
+    formato = _formato(caminho, formato)
+    if not os.path.exists(caminho):
+        return []
+    with open(caminho, encoding="utf-8", newline="") as arquivo:
+        texto = arquivo.read()
+    completo = texto[:texto.rfind("\n") + 1]
+
+    if formato == "jsonl":
+        return [json.loads(linha) for linha in completo.splitlines() if linha.strip()]
+    linhas = list(csv.reader(io.StringIO(completo)))
+    if not linhas:
+        return []
+    colunas = linhas[0]
+    return [
+        {coluna: _converter_celula(celula) for coluna, celula in zip(colunas, linha)}
+        for linha in linhas[1:] if len(linha) == len(colunas)
+    ]
+
+def chaves_gravadas(linhas, campos=("algoritmo", "versao")):
+    """Conjunto das combinações de campos já presentes, para retomar uma varredura."""
+    return {tuple(linha[campo] for campo in campos) for linha in linhas}
+
+def pivotar_por_algoritmo(df_all, coluna):
+    """Monta a tabela n_itens x "Algoritmo (versao)" para uma coluna de métrica."""
+    df_cmp = df_all.pivot_table(
+        index='n_itens',
+        columns=['algoritmo', 'versao'],
+        values=coluna
+    ).reset_index()
+
+    # 1) Achata o MultiIndex das colunas em strings "Algoritmo (versao)"
+    new_cols = ['n_itens'] + [
+        f"{alg} ({versao})"
+        for alg, versao in df_cmp.columns[1:].tolist()
+    ]
+    df_cmp.columns = new_cols
+
+    # 2) Reordena para ficar: n_itens, [Bee orig, Bee ref, ACO orig, ACO ref, ...]
+    desired_order = ['n_itens']
+    for alg in ORDEM_ALGORITMOS:
+        for ver in ['orig', 'ref']:
+            colname = f"{alg} ({ver})"
+            if colname in df_cmp.columns:
+                desired_order.append(colname)
+
+    return df_cmp[desired_order]
+
+def tabela_do_arquivo(caminho, coluna='tempo_execucao', formato=None):
+    """Reconstrói a tabela pivotada de main.py a partir de um arquivo de resultados (parcial ou completo)."""
+    import pandas as pd
+    df_all = pd.DataFrame(ler_resultados(caminho, formato), columns=COLUNAS_RESULTADO)
+    return pivotar_por_algoritmo(df_all, coluna)
@@ -0,0 +1,85 @@
+import pytest
+import os
+from unittest.mock import patch
+from gravador import GravadorResultados, chaves_gravadas, ler_resultados, tabela_do_arquivo
+from registros import CatalogoInstancias, criar_registro
+
+
+class TestGravadorResultados:
+    """Classe de testes para a gravação incremental de resultados"""
+
+    def setup_method(self):
+        """Configuração executada antes de cada teste"""
+        self.linhas = [
+            {"n_itens": n, "tempo_execucao": 0.5 * n, "gap_otimo": 0.0, "gap_limitante": 0.1,
+             "algoritmo": algoritmo, "versao": versao}
+            for algoritmo in ["Algoritmo ACO", "Bee Algorithm"]
+            for versao in ["orig", "ref"]
+            for n in [5, 10]
+        ]
+
+    @pytest.mark.parametrize("extensao", ["jsonl", "csv"])
+    def test_ida_e_volta(self, tmp_path, extensao):
+        """Testa que as linhas gravadas são lidas de volta, inclusive após reabrir o arquivo"""
+        caminho = str(tmp_path / f"resultados.{extensao}")
+        with GravadorResultados(caminho) as gravador:
+            for linha in self.linhas[:3]:
+                gravador.gravar(linha)
+        with GravadorResultados(caminho) as gravador:
+            for linha in self.linhas[3:]:
+                gravador.gravar(linha)
+
+        assert ler_resultados(caminho) == self.linhas
+
+    @pytest.mark.parametrize("extensao", ["jsonl", "csv"])
+    def test_linha_incompleta_descartada(self, tmp_path, extensao):
+        """Testa a retomada após uma queda no meio de uma linha"""
+        caminho = str(tmp_path / f"resultados.{extensao}")
+        with GravadorResultados(caminho) as gravador:
+            for linha in self.linhas[:2]:
+                gravador.gravar(linha)
+        with open(caminho, "a", encoding="utf-8") as arquivo:
+            arquivo.write('{"n_itens": 5, "tempo' if extensao == "jsonl" else "5,0.1")
+
+        assert ler_resultados(caminho) == self.linhas[:2]
+        with GravadorResultados(caminho) as gravador:
+            gravador.gravar(self.linhas[2])
+        assert ler_resultados(caminho) == self.linhas[:3]
+
+    def test_fsync_em_lotes(self, tmp_path):
+        """Testa que o fsync é feito a cada lote de linhas e ao fechar, não a cada linha"""
+        caminho = str(tmp_path / "resultados.jsonl")
+        with patch("gravador.os.fsync") as fsync:
+            with GravadorResultados(caminho, lote_fsync=3, intervalo_fsync=float("inf")) as gravador:
+                for linha in self.linhas[:7]:
+                    gravador.gravar(linha)
+                assert fsync.call_count == 2
+            assert fsync.call_count == 3
+
+    def test_retomada_e_tabela(self, tmp_path):
+        """Testa as chaves já concluídas e a tabela pivotada reconstruída do arquivo"""
+        caminho = str(tmp_path / "resultados.jsonl")
+        with GravadorResultados(caminho) as gravador:
+            for linha in self.linhas[:4]:
+                gravador.gravar(linha)
+
+        assert chaves_gravadas(ler_resultados(caminho)) == {("Algoritmo ACO", "orig"), ("Algoritmo ACO", "ref")}
+        tabela = tabela_do_arquivo(caminho)
+        assert list(tabela.columns) == ["n_itens", "Algoritmo ACO (orig)", "Algoritmo ACO (ref)"]
+        assert tabela["Algoritmo ACO (ref)"].tolist() == [2.5, 5.0]
+
+    def test_registros_e_formato_invalido(self, tmp_path):
+        """Testa a gravação de registros compactos e a rejeição de extensões desconhecidas"""
+        caminho = str(tmp_path / "registros.jsonl")
+        registro = criar_registro(
+            "PSO", 3, 5, 40, 4, 0.1, [1, 2, 3], [10, 20, 30], [1, 0, 1], catalogo=CatalogoInstancias()
+        )
+        with GravadorResultados(caminho) as gravador:
+            gravador.gravar(registro.para_linha())
+
+        linha, = ler_resultados(caminho)
+        assert linha["instancia"] == registro.instancia
+        assert bytes.fromhex(linha["solucao_bits"]) == registro.solucao_bits
+        assert ler_resultados(str(tmp_path / "inexistente.jsonl")) == []
+        with pytest.raises(ValueError):
+            GravadorResultados(str(tmp_path / "resultados.txt"))
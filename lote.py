@@ -0,0 +1,251 @@
+import numpy as np
+from cuckoo.algCuckoo_ref import calcular_ninhos_abandonados, calcular_sigma_mantegna
+from exato import limitante_dantzig
+from resolvedores import Resultado
+
+
+def _tipo_lote(instancias):
+    """Tipo dos arrays do lote: int64 se os números forem inteiros, senão float64 (ValueError se não forem números)."""
+    tipos = set()
+    for pesos, valores, capacidade in instancias:
+        if len(pesos) != len(valores):
+            raise ValueError(f"pesos e valores têm tamanhos diferentes: {len(pesos)} e {len(valores)}")
+        tipos |= {np.asarray(numeros).dtype.kind for numeros in (pesos, valores) if len(numeros)}
+        tipos.add(np.asarray(capacidade).dtype.kind)
+    if not tipos <= set("biuf"):
+        raise ValueError("pesos, valores e capacidades devem ser números (inteiros de 64 bits ou reais)")
+    return np.float64 if "f" in tipos else np.int64
+
+
+class Lote:
+    """
+    Instâncias empilhadas em arrays preenchidos até o maior número de itens.
+
+    Os itens de preenchimento têm peso e valor zero e ficam fora de mascara, de
+    modo que nunca são escolhidos. compactar() remove as instâncias que já
+    terminaram, e indices guarda a posição de cada uma na lista original. Os
+    arrays são int64 ou, se alguma instância tiver números reais, float64 (tipo),
+    para que nada seja truncado.
+    """
+
+    def __init__(self, instancias):
+        self.tipo = _tipo_lote(instancias)
+        self.tamanhos = np.array([len(pesos) for pesos, _, _ in instancias], dtype=np.int64)
+        n_max = int(self.tamanhos.max()) if len(instancias) else 0
+        self.pesos = np.zeros((len(instancias), n_max), dtype=self.tipo)
+        self.valores = np.zeros((len(instancias), n_max), dtype=self.tipo)
+        for b, (pesos, valores, _) in enumerate(instancias):
+            self.pesos[b, :len(pesos)] = pesos
+            self.valores[b, :len(valores)] = valores
+        self.capacidades = np.array([capacidade for _, _, capacidade in instancias], dtype=self.tipo)
+        self.mascara = np.arange(n_max) < self.tamanhos[:, None]
+        # Com dados inteiros o ótimo é inteiro e o limitante pode ser arredondado para baixo
+        self.limitantes = np.array([limitante_dantzig(*instancia) for instancia in instancias], dtype=self.tipo)
+        self.indices = np.arange(len(instancias))
+
+    def __len__(self):
+        return len(self.indices)
+
+    def avaliar(self, solucoes):
+        """Avalia soluções (lote x k x n_max); retorna arrays (valores, pesos) de forma (lote x k)."""
+        pesos_totais = np.einsum("bkn,bn->bk", solucoes, self.pesos)
+        valores_totais = np.einsum("bkn,bn->bk", solucoes, self.valores)
+        return np.where(pesos_totais <= self.capacidades[:, None], valores_totais, 0), pesos_totais
+
+    def terminadas(self, melhor_valor, gap):
+        """Instâncias cuja incumbente já está dentro do gap do limitante de Dantzig."""
+        return melhor_valor >= self.limitantes * (1 - gap)
+
+    def compactar(self, manter, *arrays):
+        """Remove do lote as instâncias fora de manter; retorna os arrays filtrados."""
+        for nome in ("tamanhos", "pesos", "valores", "capacidades", "mascara", "limitantes", "indices"):
+            setattr(self, nome, getattr(self, nome)[manter])
+        return [array[manter] for array in arrays]
+
+
+def _registrar_resultados(resultados, lote, selecao, solucoes, valores, pesos):
+    for b in np.flatnonzero(selecao):
+        n = int(lote.tamanhos[b])
+        if valores[b] <= 0:  # Nada melhor que a mochila vazia (a incumbente pode nem ser viável)
+            resultados[lote.indices[b]] = Resultado([0] * n, 0, 0)
+        else:
+            resultados[lote.indices[b]] = Resultado(solucoes[b, :n].tolist(), valores[b].item(), pesos[b].item())
+
+def _executar_lote(lote, n_iteracoes, gap, estado_inicial, iterar):
+    """
+    Laço comum dos algoritmos em lote.
+
+    iterar(lote, estado) executa uma iteração sobre todas as instâncias ativas e
+    retorna (estado, melhor_solucao, melhor_valor, melhor_peso); as instâncias
+    que chegam ao gap saem do lote e deixam de custar trabalho vetorizado.
+    """
+    resultados = [None] * len(lote)
+    estado = estado_inicial
+    for _ in range(n_iteracoes):
+        if len(lote) == 0:
+            break
+        estado, melhor_solucao, melhor_valor, melhor_peso = iterar(lote, estado)
+        terminadas = lote.terminadas(melhor_valor, gap)
+        if terminadas.any():
+            _registrar_resultados(resultados, lote, terminadas, melhor_solucao, melhor_valor, melhor_peso)
+            n_estado = len(estado)
+            *estado, melhor_solucao, melhor_valor, melhor_peso = lote.compactar(
+                ~terminadas, *estado, melhor_solucao, melhor_valor, melhor_peso
+            )
+            estado = tuple(estado[:n_estado])
+
+    if len(lote) > 0:
+        _registrar_resultados(
+            resultados, lote, np.ones(len(lote), dtype=bool), melhor_solucao, melhor_valor, melhor_peso
+        )
+    return resultados
+
+def _resultados_vazios(instancias):
+    return [Resultado([0] * len(pesos), 0, 0) for pesos, _, _ in instancias]
+
+def cuckoo_lote(instancias, n_ninhos=25, n_iteracoes=50, pa=0.25, beta_levy=1.5, escala_levy=1.0, gap=0.0,
+                semente=None):
+    """
+    Cuckoo Search matricial sobre várias instâncias de uma vez.
+
+    Os ninhos de todas as instâncias formam um array (lote x n_ninhos x n_max);
+    voos de Lévy, substituição gulosa e abandono dos piores são vetorizados no
+    lote inteiro. Uma instância sai do lote quando a incumbente chega ao gap do
+    limitante de Dantzig (gap=0: ótimo provado).
+
+    Returns:
+        Lista de Resultado(solucao, valor, peso), na ordem das instâncias
+    """
+    if n_iteracoes <= 0 or not instancias:
+        return _resultados_vazios(instancias)
+    rng = np.random.default_rng(semente)
+    lote = Lote(instancias)
+    n_abandonados = calcular_ninhos_abandonados(n_ninhos, pa)
+    sigma = calcular_sigma_mantegna(beta_levy)
+
+    def novos_ninhos(mascara, k):
+        return (rng.integers(0, 2, size=(len(mascara), k, mascara.shape[1]), dtype=np.int8) & mascara[:, None, :])
+
+    def iterar(lote, estado):
+        ninhos, fitness, pesos_totais = estado
+        n_lote = len(lote)
+
+        # Voos de Lévy: k bits invertidos por ninho, só entre os itens reais da instância
+        u = rng.normal(0, sigma, (n_lote, n_ninhos))
+        v = rng.normal(0, 1, (n_lote, n_ninhos))
+        limite = np.maximum(lote.tamanhos[:, None] - 1, 0)
+        k = 1 + np.minimum(escala_levy * np.abs(u / np.abs(v) ** (1 / beta_levy)), limite).astype(np.int64)
+        k[lote.tamanhos == 0] = 0
+        # k colunas distintas por ninho: as primeiras de uma permutação aleatória dos itens reais
+        ordem = np.argsort(np.where(lote.mascara[:, None, :], rng.random(ninhos.shape), np.inf), axis=2)
+        trocas = np.zeros(ninhos.shape, dtype=np.int8)
+        np.put_along_axis(trocas, ordem, np.arange(ninhos.shape[2]) < k[..., None], axis=2)
+        candidatos = ninhos ^ trocas
+
+        # Substituição gulosa
+        fitness_cand, pesos_cand = lote.avaliar(candidatos)
+        melhorou = fitness_cand > fitness
+        ninhos[melhorou] = candidatos[melhorou]
+        fitness[melhorou] = fitness_cand[melhorou]
+        pesos_totais[melhorou] = pesos_cand[melhorou]
+
+        # Abandono da fração pa de piores ninhos de cada instância
+        if n_abandonados > 0:
+            piores = np.argpartition(fitness, n_abandonados - 1, axis=1)[:, :n_abandonados]
+            linhas_lote = np.arange(n_lote)[:, None]
+            ninhos[linhas_lote, piores] = novos_ninhos(lote.mascara, n_abandonados)
+            fitness[linhas_lote, piores], pesos_totais[linhas_lote, piores] = lote.avaliar(ninhos[linhas_lote, piores])
+
+        melhor = np.argmax(fitness, axis=1)
+        linhas_lote = np.arange(n_lote)
+        estado = (ninhos, fitness, pesos_totais)
+        return estado, ninhos[linhas_lote, melhor], fitness[linhas_lote, melhor], pesos_totais[linhas_lote, melhor]
+
+    ninhos = novos_ninhos(lote.mascara, n_ninhos)
+    fitness, pesos_totais = lote.avaliar(ninhos)
+    return _executar_lote(lote, n_iteracoes, gap, (ninhos, fitness, pesos_totais), iterar)
+
+def aco_lote(instancias, n_formigas=50, n_iteracoes=50, alfa=1.0, beta=2.0, rho=0.1, Q=100, gap=0.0,
+             semente=None):
+    """
+    Colônia de formigas sobre várias instâncias de uma vez.
+
+    A construção percorre os itens em ordem, como em aco_knapsack, mas cada
+    passo decide o item para todas as formigas de todas as instâncias ativas em
+    uma única operação vetorizada (lote x n_formigas). Uma instância sai do lote
+    quando a incumbente chega ao gap do limitante de Dantzig (gap=0: ótimo provado).
+
+    Returns:
+        Lista de Resultado(solucao, valor, peso), na ordem das instâncias
+    """
+    if n_iteracoes <= 0 or not instancias:
+        return _resultados_vazios(instancias)
+    rng = np.random.default_rng(semente)
+    lote = Lote(instancias)
+
+    def iterar(lote, estado):
+        feromonios, heuristica, melhor_solucao, melhor_valor, melhor_peso = estado
+        n_lote, n_max = lote.pesos.shape
+
+        # Construção: a probabilidade de cada item é a mesma para todas as formigas da instância
+        prob = (feromonios ** alfa) * heuristica
+        prob = prob / (1 + prob)
+        solucoes = np.zeros((n_lote, n_formigas, n_max), dtype=np.int8)
+        peso_total = np.zeros((n_lote, n_formigas), dtype=lote.tipo)
+        sorteios = rng.random((n_max, n_lote, n_formigas))
+        for i in range(n_max):
+            peso_item = lote.pesos[:, i, None]
+            escolhe = (peso_total + peso_item <= lote.capacidades[:, None]) & (sorteios[i] < prob[:, i, None])
+            escolhe &= lote.mascara[:, i, None]
+            solucoes[:, :, i] = escolhe
+            peso_total += escolhe * peso_item
+
+        # Melhor formiga de cada instância e atualização da incumbente
+        valores_formigas, _ = lote.avaliar(solucoes)
+        melhor_formiga = np.argmax(valores_formigas, axis=1)
+        linhas = np.arange(n_lote)
+        valor_iteracao = valores_formigas[linhas, melhor_formiga]
+        melhorou = valor_iteracao > melhor_valor
+        melhor_solucao[melhorou] = solucoes[linhas, melhor_formiga][melhorou]
+        melhor_valor[melhorou] = valor_iteracao[melhorou]
+        melhor_peso[melhorou] = peso_total[linhas, melhor_formiga][melhorou]
+
+        # Evaporação e depósito na incumbente (instâncias sem solução não recebem depósito)
+        feromonios *= (1 - rho)
+        deposito = np.where(melhor_valor > 0, Q / (1 + melhor_peso), 0.0)
+        feromonios += melhor_solucao * deposito[:, None]
+
+        estado = (feromonios, heuristica, melhor_solucao, melhor_valor, melhor_peso)
+        return estado, melhor_solucao, melhor_valor, melhor_peso
+
+    n_lote, n_max = lote.pesos.shape
+    atratividade = np.divide(lote.valores, lote.pesos, out=np.zeros((n_lote, n_max)), where=lote.pesos > 0)
+    estado = (
+        np.ones((n_lote, n_max)),
+        atratividade ** beta,
+        np.zeros((n_lote, n_max), dtype=np.int8),
+        np.zeros(n_lote, dtype=lote.tipo),
+        np.zeros(n_lote, dtype=lote.tipo),
+    )
+    return _executar_lote(lote, n_iteracoes, gap, estado, iterar)
+
+
+# Algoritmos com versão em lote: nome -> função(instancias, **parametros)
+ALGORITMOS_LOTE = {
+    "aco": aco_lote,
+    "cuckoo": cuckoo_lote,
+}
+
+
+def resolver_lote(algoritmo, instancias, **parametros):
+    """
+    Resolve uma lista de instâncias (pesos, valores, capacidade) em um único lote vetorizado.
+
+    Returns:
+        Lista de Resultado(solucao, valor, peso), na ordem das instâncias
+    """
+    try:
+        funcao = ALGORITMOS_LOTE[algoritmo]
+    except KeyError:
+        raise ValueError(f"Algoritmo sem versão em lote: {algoritmo!r}") from None
+    return funcao(instancias, **parametros)
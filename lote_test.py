@@ -0,0 +1,80 @@
+import pytest
+import random
+import numpy as np
+from unittest.mock import patch
+from utils import avaliar_solucao, gerar_instancia_aleatoria
+from exato import valor_otimo
+from lote import Lote, resolver_lote
+
+
+class TestLote:
+    """Classe de testes para a resolução de várias instâncias em lote"""
+
+    def setup_method(self):
+        """Configuração executada antes de cada teste"""
+        random.seed(42)
+        self.instancias = [gerar_instancia_aleatoria(random.randint(1, 30)) for _ in range(40)]
+        self.instancias += [([], [], 0), ([5], [3], 2), ([2, 1, 3, 2], [12, 10, 20, 15], 5)]
+
+    def test_empilhar_instancias(self):
+        """Testa o preenchimento e a avaliação vetorizada do lote"""
+        lote = Lote([([2, 1], [3, 4], 2), ([5], [7], 5)])
+
+        assert lote.pesos.tolist() == [[2, 1], [5, 0]]
+        assert lote.mascara.tolist() == [[True, True], [True, False]]
+        valores, pesos = lote.avaliar(np.array([[[1, 1]], [[1, 0]]], dtype=np.int8))
+        assert valores.tolist() == [[0], [7]]
+        assert pesos.tolist() == [[3], [5]]
+
+    @pytest.mark.parametrize("algoritmo", ["aco", "cuckoo"])
+    def test_resultados_validos_e_em_ordem(self, algoritmo):
+        """Testa que cada resultado corresponde à sua instância e é viável"""
+        resultados = resolver_lote(algoritmo, self.instancias, n_iteracoes=10, semente=1)
+
+        assert len(resultados) == len(self.instancias)
+        for resultado, (pesos, valores, capacidade) in zip(resultados, self.instancias):
+            assert len(resultado.solucao) == len(pesos)
+            assert (resultado.valor, resultado.peso) == avaliar_solucao(resultado.solucao, pesos, valores, capacidade)
+            assert resultado.peso <= capacidade
+        assert resultados[-1].valor == valor_otimo(*self.instancias[-1])
+
+    @pytest.mark.parametrize("algoritmo", ["aco", "cuckoo"])
+    def test_reprodutivel_com_semente(self, algoritmo):
+        """Testa que a mesma semente reproduz o lote"""
+        assert resolver_lote(algoritmo, self.instancias, n_iteracoes=5, semente=3) == \
+            resolver_lote(algoritmo, self.instancias, n_iteracoes=5, semente=3)
+
+    def test_instancias_saem_do_lote(self):
+        """Testa que instâncias no gap deixam o lote antes do fim das iterações"""
+        tamanhos = []
+        compactar = Lote.compactar
+
+        def compactar_registrando(lote, manter, *arrays):
+            tamanhos.append(int(manter.sum()))
+            return compactar(lote, manter, *arrays)
+
+        with patch.object(Lote, "compactar", compactar_registrando):
+            resolver_lote("cuckoo", self.instancias, n_iteracoes=50, gap=1.0, semente=1)
+
+        assert tamanhos == [0]
+
+    def test_algoritmo_sem_lote(self):
+        """Testa o erro para algoritmos sem versão em lote"""
+        with pytest.raises(ValueError):
+            resolver_lote("pso", self.instancias)
+        assert resolver_lote("aco", []) == []
+
+    @pytest.mark.parametrize("algoritmo", ["aco", "cuckoo"])
+    def test_instancias_reais_nao_sao_truncadas(self, algoritmo):
+        """Testa que pesos, valores e capacidades reais não são truncados para inteiros"""
+        instancias = [([1.5, 1.5, 1.5], [3.0, 3.0, 3.0], 3.0), ([2, 1, 3, 2], [12, 10, 20, 15], 5)]
+        assert Lote(instancias).pesos.dtype == np.float64
+
+        resultados = resolver_lote(algoritmo, instancias, n_iteracoes=20, semente=1)
+
+        for resultado, (pesos, valores, capacidade) in zip(resultados, instancias):
+            assert resultado.peso <= capacidade
+            assert (resultado.valor, resultado.peso) == avaliar_solucao(resultado.solucao, pesos, valores, capacidade)
+        assert resultados[0].valor == 6.0
+        with pytest.raises(ValueError):
+            Lote([(["x"], [1], 1)])
@@ -1,6 +1,8 @@
 #!/usr/bin/env python
 # coding: utf-8
 
+import random
+import sys
 import pandas as pd
 
 # importa as funções originais e _ref de cada algoritmo
@@ -9,58 +11,122 @@ from aco import algColonFormigas, algColonFormigas_ref
 from cuckoo import algCuckoo, algCuckoo_ref
 from geneticos import algGeneticos, algGeneticos_ref
 from pso import algEnxParticulas, algEnxParticulas_ref
+from exato import valor_otimo, limitante_dantzig, calcular_gap
+from registros import CatalogoInstancias, para_dataframe
+from gravador import COLUNAS_RESULTADO, GravadorResultados, chaves_gravadas, ler_resultados, pivotar_por_algoritmo
+from rastro import medir_ate_alvo, resumir_ate_alvo
+from utils import gerar_instancia_aleatoria
 
 def run_and_label(obj, nome_alg, versao):
     """
     Se 'obj' for um módulo com main(), chama obj.main().
     Caso contrário, chama obj() diretamente.
+    As versões _ref guardam as instâncias em um catálogo desta execução.
     """
-    if hasattr(obj, 'main'):
-        df = obj.main()
+    catalogo = CatalogoInstancias()
+    if versao == 'ref':
+        resultados = obj.main(catalogo=catalogo)
+    elif hasattr(obj, 'main'):
+        resultados = obj.main()
     else:
-        df = obj()
+        resultados = obj()
+    return rotular(resultados, nome_alg, versao, catalogo)
+
+def rotular(df, nome_alg, versao, catalogo=None):
+    """
+    Tabela com as COLUNAS_RESULTADO (gravador.py) dos resultados de um main().
+    As versões _ref retornam listas de RegistroResultado: os gaps são calculados
+    expandindo uma instância do catálogo por vez, e cada instância é removida
+    do catálogo depois dos gaps.
+    """
+    if isinstance(df, pd.DataFrame):
+        instancias = zip(df['pesos'], df['valores'], df['capacidade'])
+    else:
+        registros = df
+        instancias = (registro.expandir_instancia() for registro in registros)
+        df = para_dataframe(registros)
     df['algoritmo'] = nome_alg
     df['versao'] = versao
-    return df[['n_itens', 'tempo_execucao', 'algoritmo', 'versao']]
+    adicionar_gaps(df, instancias)
+    if catalogo is not None:
+        for instancia in df.get('instancia', []):
+            catalogo.remover(instancia)
+    return df[COLUNAS_RESULTADO]
+
+def adicionar_gaps(df, instancias):
+    """
+    Acrescenta o gap relativo de cada resultado para o ótimo exato e para o limitante de Dantzig.
+    instancias produz (pesos, valores, capacidade) na ordem das linhas de df.
+    """
+    otimos = []
+    limitantes = []
+    for instancia in instancias:
+        otimos.append(valor_otimo(*instancia))
+        limitantes.append(limitante_dantzig(*instancia))
+    df['gap_otimo'] = [calcular_gap(valor, otimo) for valor, otimo in zip(df['valor_total'], otimos)]
+    df['gap_limitante'] = [calcular_gap(valor, limitante) for valor, limitante in zip(df['valor_total'], limitantes)]
 
 # executa todos os orig/ref
-dfs = [
-    run_and_label(beeAlgorithm,         'Bee Algorithm',      'orig'),
-    run_and_label(beeAlgorithm_ref,     'Bee Algorithm',      'ref'),
-    run_and_label(algColonFormigas,     'Algoritmo ACO',      'orig'),
-    run_and_label(algColonFormigas_ref, 'Algoritmo ACO',      'ref'),
-    run_and_label(algCuckoo,            'Cuckoo Search',      'orig'),
-    run_and_label(algCuckoo_ref,        'Cuckoo Search',      'ref'),
-    run_and_label(algEnxParticulas,     'PSO',                'orig'),
-    run_and_label(algEnxParticulas_ref, 'PSO',                'ref'),
-    run_and_label(algGeneticos,         'Algoritmo Genético', 'orig'),
-    run_and_label(algGeneticos_ref,     'Algoritmo Genético', 'ref'),
+execucoes = [
+    (beeAlgorithm,         'Bee Algorithm',      'orig'),
+    (beeAlgorithm_ref,     'Bee Algorithm',      'ref'),
+    (algColonFormigas,     'Algoritmo ACO',      'orig'),
+    (algColonFormigas_ref, 'Algoritmo ACO',      'ref'),
+    (algCuckoo,            'Cuckoo Search',      'orig'),
+    (algCuckoo_ref,        'Cuckoo Search',      'ref'),
+    (algEnxParticulas,     'PSO',                'orig'),
+    (algEnxParticulas_ref, 'PSO',                'ref'),
+    (algGeneticos,         'Algoritmo Genético', 'orig'),
+    (algGeneticos_ref,     'Algoritmo Genético', 'ref'),
 ]
 
-# concatena e pivota
-df_all = pd.concat(dfs, ignore_index=True)
-df_cmp = df_all.pivot_table(
-    index='n_itens',
-    columns=['algoritmo', 'versao'],
-    values='tempo_execucao'
-).reset_index()
+if len(sys.argv) > 1:
+    # Varredura retomável: python main.py resultados.jsonl (ou .csv). Cada (algoritmo, versão, n_itens)
+    # vai para o arquivo assim que termina; uma nova execução pula os já gravados.
+    caminho = sys.argv[1]
+    concluidos = chaves_gravadas(ler_resultados(caminho), ('algoritmo', 'versao', 'n_itens'))
 
-# 1) Achata o MultiIndex das colunas em strings "Algoritmo (versao)"
-new_cols = ['n_itens'] + [
-    f"{alg} ({versao})"
-    for alg, versao in df_cmp.columns[1:].tolist()
-]
-df_cmp.columns = new_cols
+    def gravar(df):
+        for linha in df.to_dict('records'):
+            chave = (linha['algoritmo'], linha['versao'], linha['n_itens'])
+            if chave not in concluidos:
+                gravador.gravar(linha)
+                concluidos.add(chave)
 
-# 2) Reordena para ficar: n_itens, [Bee orig, Bee ref, ACO orig, ACO ref, ...]
-desired_order = ['n_itens']
-for alg in ['Bee Algorithm', 'Algoritmo ACO', 'Cuckoo Search', 'PSO', 'Algoritmo Genético']:
-    for ver in ['orig', 'ref']:
-        colname = f"{alg} ({ver})"
-        if colname in df_cmp.columns:
-            desired_order.append(colname)
+    with GravadorResultados(caminho, colunas=COLUNAS_RESULTADO) as gravador:
+        for obj, nome_alg, versao in execucoes:
+            feitos = {n_itens for alg, ver, n_itens in concluidos if (alg, ver) == (nome_alg, versao)}
+            if versao == 'ref':
+                # Cada tamanho de instância é gravado ao terminar, com seus gaps
+                catalogo = CatalogoInstancias()
+                obj.main(ao_concluir=lambda registro: gravar(rotular([registro], nome_alg, versao, catalogo)),
+                         catalogo=catalogo, concluidos=feitos)
+            elif not feitos:
+                # As versões originais só devolvem a tabela com todos os tamanhos no fim
+                gravar(run_and_label(obj, nome_alg, versao))
+    df_all = pd.DataFrame(ler_resultados(caminho), columns=COLUNAS_RESULTADO)
+else:
+    dfs = [run_and_label(obj, nome_alg, versao) for obj, nome_alg, versao in execucoes]
+    df_all = pd.concat(dfs, ignore_index=True)
 
-df_cmp = df_cmp[desired_order]
+# concatena e pivota
+df_cmp = pivotar_por_algoritmo(df_all, 'tempo_execucao')
 
 # 3) Imprime em Markdown com 5 casas decimais
 print(df_cmp.to_markdown(index=False, floatfmt=".5f"))
+
+# 4) Qualidade: gap relativo para o ótimo exato (programação dinâmica) e para o limitante de Dantzig
+for coluna in ['gap_otimo', 'gap_limitante']:
+    print()
+    print(pivotar_por_algoritmo(df_all, coluna).to_markdown(index=False, floatfmt=".4f"))
+
+# 5) Velocidade de convergência: distribuições de tempo e de avaliações até atingir 80%, 90% e 95% do ótimo,
+# derivadas dos rastros de 10 execuções por algoritmo em uma mesma instância
+pesos, valores, capacidade = gerar_instancia_aleatoria(50, rng=random.Random(0))
+otimo = valor_otimo(pesos, valores, capacidade)
+alvos = [0.8 * otimo, 0.9 * otimo, 0.95 * otimo]
+linhas = []
+for algoritmo in ['aco', 'bee', 'cuckoo', 'genetico', 'pso']:
+    linhas.extend(resumir_ate_alvo(algoritmo, medir_ate_alvo(algoritmo, pesos, valores, capacidade, alvos)))
+print()
+print(pd.DataFrame(linhas).to_markdown(index=False, floatfmt=".4g"))
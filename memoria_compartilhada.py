@@ -0,0 +1,142 @@
+import os
+import sys
+import weakref
+from collections import namedtuple
+from multiprocessing import resource_tracker, shared_memory
+import numpy as np
+
+# Referência pequena (picklável) que os workers recebem no lugar de pesos e valores; tipo é o
+# código de array dos dados: "q" (int64) ou "d" (float64, quando a instância não é inteira)
+ReferenciaInstancia = namedtuple("ReferenciaInstancia", ["nome", "n_itens", "capacidade", "tipo"], defaults=("q",))
+
+# dtype do numpy de cada código de array
+TIPOS_NUMPY = {"q": np.int64, "d": np.float64}
+
+# Segmentos anexados neste processo: nome -> SharedMemory (uma única anexação por worker)
+_anexadas = {}
+# Segmentos criados (e ainda não removidos) por este processo
+_criados = set()
+# Se este processo não herdou o resource tracker do dono (ver _anexar_segmento); None: ainda não verificado
+_rastreador_proprio = None
+
+
+def _liberar_segmento(memoria):
+    """Fecha e remove o segmento; tolera que ele já tenha sido removido."""
+    _criados.discard(memoria.name)
+    memoria.close()
+    try:
+        memoria.unlink()
+    except FileNotFoundError:
+        pass
+
+def _tipo_dados(pesos, valores):
+    """Código de array ("q" ou "d") que guarda pesos e valores sem perda; ValueError se não forem numéricos."""
+    if len(pesos) != len(valores):
+        raise ValueError(f"pesos e valores têm tamanhos diferentes: {len(pesos)} e {len(valores)}")
+    if len(pesos) == 0:
+        return "q"
+    tipos = {np.asarray(pesos).dtype.kind, np.asarray(valores).dtype.kind}
+    if not tipos <= set("biuf"):
+        raise ValueError("pesos e valores devem ser números (inteiros de 64 bits ou reais)")
+    return "d" if "f" in tipos else "q"
+
+def _anexar_segmento(nome):
+    """
+    Anexa o segmento sem deixar registro no resource tracker.
+
+    Antes do Python 3.13 toda anexação é registrada no tracker do processo. Um
+    worker que herdou o tracker do dono só repete um registro que já existe; um
+    que não herdou (pool criado antes do primeiro segmento) inicia um tracker
+    próprio, que na saída acusaria o segmento, já removido pelo dono, como
+    vazado. Nesse caso o registro é desfeito logo após a anexação. Fora do
+    POSIX o tracker não registra segmentos.
+    """
+    if sys.version_info >= (3, 13):
+        return shared_memory.SharedMemory(name=nome, track=False)
+    if os.name != "posix":
+        return shared_memory.SharedMemory(name=nome)
+    global _rastreador_proprio
+    if _rastreador_proprio is None:
+        # Não há API pública que diga se o tracker já existe sem iniciá-lo: até o 3.12 (os únicos
+        # que chegam aqui) o _fd do tracker do processo só é definido quando ele é iniciado ou
+        # herdado. Sem esse atributo, na dúvida, o registro é mantido.
+        rastreador = getattr(resource_tracker, "_resource_tracker", None)
+        _rastreador_proprio = getattr(rastreador, "_fd", False) is None
+    memoria = shared_memory.SharedMemory(name=nome)
+    if _rastreador_proprio and nome not in _criados:
+        # No POSIX o registro usa o nome público com a barra inicial
+        resource_tracker.unregister("/" + memoria.name, "shared_memory")
+    return memoria
+
+class InstanciaCompartilhada:
+    """
+    Instância da mochila copiada uma única vez para multiprocessing.shared_memory.
+
+    O segmento guarda pesos e valores lado a lado como int64 ou, se algum deles
+    não for inteiro, como float64 (tipo "d" da referencia), sem truncar; pesos e
+    valores de tamanhos diferentes ou não numéricos levantam ValueError. Os
+    workers recebem só a referencia (nome, n_itens, capacidade, tipo) e anexam
+    visões sem cópia com anexar_instancia. Quem cria é o dono do segmento e o
+    remove em fechar() (ou ao sair do with). Se o dono esquecer de fechar, o
+    segmento é removido quando o objeto é coletado ou na saída do interpretador
+    (weakref.finalize); se o processo dono morrer sem chance de limpar
+    (SIGKILL), o resource tracker do multiprocessing remove os segmentos que
+    ele criou.
+    """
+
+    def __init__(self, pesos, valores, capacidade):
+        tipo = _tipo_dados(pesos, valores)
+        n_itens = len(pesos)
+        self.memoria = shared_memory.SharedMemory(create=True, size=max(8, 2 * n_itens * 8))
+        _criados.add(self.memoria.name)
+        self._finalizador = weakref.finalize(self, _liberar_segmento, self.memoria)
+        dados = np.ndarray((2 * n_itens,), dtype=TIPOS_NUMPY[tipo], buffer=self.memoria.buf)
+        dados[:n_itens] = pesos
+        dados[n_itens:] = valores
+        del dados  # Sem visões vivas no dono, o segmento pode ser fechado a qualquer momento
+        self.referencia = ReferenciaInstancia(self.memoria.name, n_itens, capacidade, tipo)
+
+    def fechar(self):
+        """Remove o segmento (idempotente)."""
+        self._finalizador()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.fechar()
+
+def anexar_instancia(referencia, numpy=True):
+    """
+    Visões sem cópia (pesos, valores, capacidade) da instância compartilhada.
+
+    Com numpy=True, pesos e valores são arrays do numpy (int64 ou float64,
+    conforme referencia.tipo); com numpy=False, memoryviews do mesmo tipo, cujo
+    acesso item a item nos laços em Python puro custa o mesmo que o de uma
+    lista (o de um array do numpy custa ~3x mais). Os dois
+    tipos são aceitos diretamente pelos solvers _ref. O segmento é anexado uma
+    única vez por processo.
+    """
+    memoria = _anexadas.get(referencia.nome)
+    if memoria is None:
+        memoria = _anexadas[referencia.nome] = _anexar_segmento(referencia.nome)
+    n_itens = referencia.n_itens
+    if numpy:
+        dados = np.ndarray((2 * n_itens,), dtype=TIPOS_NUMPY[referencia.tipo], buffer=memoria.buf)
+    else:
+        dados = memoria.buf.cast(referencia.tipo)
+    return dados[:n_itens], dados[n_itens:2 * n_itens], referencia.capacidade
+
+def desanexar_instancia(referencia):
+    """
+    Esquece a anexação do segmento neste processo.
+
+    O mapeamento é desfeito assim que não restarem visões vivas da instância;
+    workers de longa duração chamam isto ao terminar cada instância.
+    """
+    memoria = _anexadas.pop(referencia.nome, None)
+    if memoria is not None:
+        try:
+            memoria.close()
+        except BufferError:
+            pass  # Ainda há visões vivas: o mapeamento cai junto com a última delas
@@ -0,0 +1,149 @@
+import pytest
+import gc
+import os
+import random
+import subprocess
+import sys
+import time
+from multiprocessing import Pool, shared_memory
+import numpy as np
+from memoria_compartilhada import InstanciaCompartilhada, anexar_instancia, desanexar_instancia
+from resolvedores import resolver
+from utils import gerar_instancia_aleatoria
+
+# Processo dono que morre por SIGKILL sem chance de fechar o segmento
+PROGRAMA_QUEDA = """
+import os, signal
+from memoria_compartilhada import InstanciaCompartilhada
+instancia = InstanciaCompartilhada([1, 2], [3, 4], 3)
+print(instancia.referencia.nome, flush=True)
+os.kill(os.getpid(), signal.SIGKILL)
+"""
+
+# Pool criado antes do primeiro segmento: os workers não herdam o resource tracker do dono
+PROGRAMA_POOL_ANTES = """
+from multiprocessing import Pool
+from memoria_compartilhada import InstanciaCompartilhada
+from memoria_compartilhada_test import somar_instancia
+if __name__ == "__main__":
+    with Pool(2) as pool:
+        with InstanciaCompartilhada([1, 2], [3, 4], 3) as instancia:
+            print(pool.map(somar_instancia, [instancia.referencia] * 4))
+"""
+
+
+def segmento_existe(nome):
+    """Indica se o segmento ainda pode ser anexado."""
+    try:
+        memoria = shared_memory.SharedMemory(name=nome)
+    except FileNotFoundError:
+        return False
+    memoria.close()
+    return True
+
+def somar_instancia(referencia):
+    """Tarefa de worker: soma pesos e valores lidos da memória compartilhada."""
+    pesos, valores, capacidade = anexar_instancia(referencia)
+    return int(pesos.sum()), int(valores.sum()), capacidade
+
+
+class TestMemoriaCompartilhada:
+    """Classe de testes para a passagem da instância por memória compartilhada"""
+
+    def setup_method(self):
+        """Configuração executada antes de cada teste"""
+        self.pesos, self.valores, self.capacidade = gerar_instancia_aleatoria(40, rng=random.Random(5))
+
+    def test_visoes_sem_copia(self):
+        """Testa que as visões numpy e memoryview enxergam os mesmos bytes do segmento"""
+        with InstanciaCompartilhada(self.pesos, self.valores, self.capacidade) as instancia:
+            referencia = instancia.referencia
+            pesos, valores, capacidade = anexar_instancia(referencia)
+            assert isinstance(pesos, np.ndarray) and pesos.dtype == np.int64
+            assert pesos.tolist() == self.pesos and valores.tolist() == self.valores
+            assert capacidade == self.capacidade
+            pesos_mv, valores_mv, _ = anexar_instancia(referencia, numpy=False)
+            assert list(valores_mv) == self.valores
+            pesos[0] = 99
+            assert pesos_mv[0] == 99
+            del pesos, valores, pesos_mv, valores_mv
+            desanexar_instancia(referencia)
+        assert not segmento_existe(referencia.nome)
+
+    def test_fechar_idempotente_e_coleta(self):
+        """Testa que fechar pode ser repetido e que o segmento esquecido some na coleta"""
+        instancia = InstanciaCompartilhada(self.pesos, self.valores, self.capacidade)
+        nome = instancia.referencia.nome
+        instancia.fechar()
+        instancia.fechar()
+        assert not segmento_existe(nome)
+        nome = InstanciaCompartilhada([1], [2], 1).referencia.nome
+        gc.collect()
+        assert not segmento_existe(nome)
+
+    def test_instancia_vazia(self):
+        """Testa a instância sem itens"""
+        with InstanciaCompartilhada([], [], 0) as instancia:
+            pesos, valores, _ = anexar_instancia(instancia.referencia)
+            assert len(pesos) == 0 and len(valores) == 0
+
+    def test_instancia_real_e_validacao(self):
+        """Testa que dados não inteiros são guardados como float64 e que dados inválidos são recusados"""
+        with InstanciaCompartilhada([0.6, 0.6], [1, 1.9], 1.2) as instancia:
+            assert instancia.referencia.tipo == "d"
+            pesos, valores, _ = anexar_instancia(instancia.referencia)
+            assert pesos.dtype == np.float64 and valores.tolist() == [1.0, 1.9]
+            assert list(anexar_instancia(instancia.referencia, numpy=False)[0]) == [0.6, 0.6]
+            del pesos, valores
+            desanexar_instancia(instancia.referencia)
+        for pesos, valores in (([1, 2], [3]), (["x", 2], [3, 4]), ([1, 2], [3, None]), ([2 ** 70], [1])):
+            with pytest.raises(ValueError):
+                InstanciaCompartilhada(pesos, valores, 3)
+
+    def test_bee_paralelo_com_instancia_real(self):
+        """Testa que o Bee paralelo não trunca pesos reais (a solução continua viável)"""
+        solucao, valor, peso = resolver("bee", [0.6, 0.6, 0.6], [1.0, 1.0, 1.9], 1.2, n_abelhas=8, n_melhores=3,
+                                        n_iter=3, n_workers=2, rng=random.Random(0))
+        assert sum(solucao) <= 2 and peso <= 1.2
+        assert valor == pytest.approx(sum(v for v, s in zip([1.0, 1.0, 1.9], solucao) if s))
+
+    def test_workers_sem_registro_orfao(self):
+        """Testa que workers sem o resource tracker do dono não acusam o segmento como vazado"""
+        saida = subprocess.run([sys.executable, "-c", PROGRAMA_POOL_ANTES], capture_output=True, text=True,
+                               cwd=os.path.dirname(os.path.abspath(__file__)), check=True)
+        assert saida.stdout.strip() == "[(3, 7, 3), (3, 7, 3), (3, 7, 3), (3, 7, 3)]"
+        assert "leaked" not in saida.stderr and "No such file" not in saida.stderr
+
+    def test_workers_recebem_so_a_referencia(self):
+        """Testa que os workers anexam a instância a partir da referência"""
+        with InstanciaCompartilhada(self.pesos, self.valores, self.capacidade) as instancia, Pool(2) as pool:
+            resultados = pool.map(somar_instancia, [instancia.referencia] * 4)
+        assert resultados == [(sum(self.pesos), sum(self.valores), self.capacidade)] * 4
+
+    @pytest.mark.parametrize("numpy", [True, False])
+    @pytest.mark.parametrize("algoritmo, parametros", [
+        ("aco", {"n_formigas": 5, "n_iteracoes": 5}),
+        ("bee", {"n_abelhas": 8, "n_melhores": 3, "n_vizinhos": 2, "n_iter": 5}),
+        ("cuckoo", {"n_ninhos": 6, "n_iteracoes": 5, "levy_mantegna": True}),
+        ("cuckoo", {"n_ninhos": 6, "n_iteracoes": 5, "matricial": True}),
+        ("genetico", {"tam_populacao": 6, "n_geracoes": 5, "busca_local": "primeira"}),
+    ])
+    def test_solvers_aceitam_visoes(self, algoritmo, parametros, numpy):
+        """Testa que os solvers _ref dão o mesmo resultado com as visões e com listas"""
+        esperado = resolver(algoritmo, self.pesos, self.valores, self.capacidade, rng=random.Random(1), **parametros)
+        with InstanciaCompartilhada(self.pesos, self.valores, self.capacidade) as instancia:
+            obtido = resolver(algoritmo, *anexar_instancia(instancia.referencia, numpy), rng=random.Random(1),
+                              **parametros)
+        assert obtido == esperado
+
+    @pytest.mark.skipif(not os.path.isdir("/dev/shm"), reason="requer memória compartilhada POSIX")
+    def test_segmento_removido_quando_o_dono_morre(self):
+        """Testa que o segmento de um processo morto por SIGKILL é removido pelo resource tracker"""
+        saida = subprocess.run([sys.executable, "-c", PROGRAMA_QUEDA], capture_output=True, text=True,
+                               cwd=os.path.dirname(os.path.abspath(__file__)))
+        nome = saida.stdout.strip()
+        assert nome
+        limite = time.monotonic() + 10
+        while segmento_existe(nome) and time.monotonic() < limite:
+            time.sleep(0.05)
+        assert not segmento_existe(nome)
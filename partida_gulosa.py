@@ -0,0 +1,66 @@
+from aleatorio import gerador
+
+# Fração de bits invertidos em cada perturbação da solução gulosa
+TAXA_PERTURBACAO = 0.1
+
+
+def ordenar_por_razao(pesos, valores):
+    """Índices dos itens em ordem decrescente de razão valor/peso (peso zero primeiro)."""
+    return sorted(
+        range(len(pesos)),
+        key=lambda i: valores[i] / pesos[i] if pesos[i] > 0 else float("inf"),
+        reverse=True,
+    )
+
+def reparar_solucao(solucao, pesos, valores, capacidade, ordem):
+    """
+    Torna a solução viável e a completa gulosamente, em lugar.
+
+    Remove os itens escolhidos de pior razão até caber na capacidade e depois
+    acrescenta, na ordem de razão, os itens de valor positivo que ainda cabem.
+    """
+    peso_total = sum(p for p, s in zip(pesos, solucao) if s)
+    for i in reversed(ordem):
+        if peso_total <= capacidade:
+            break
+        if solucao[i]:
+            solucao[i] = 0
+            peso_total -= pesos[i]
+
+    for i in ordem:
+        if not solucao[i] and valores[i] > 0 and peso_total + pesos[i] <= capacidade:
+            solucao[i] = 1
+            peso_total += pesos[i]
+    return solucao
+
+def solucao_gulosa(pesos, valores, capacidade, ordem=None):
+    """Solução gulosa por razão valor/peso."""
+    if ordem is None:
+        ordem = ordenar_por_razao(pesos, valores)
+    return reparar_solucao([0] * len(pesos), pesos, valores, capacidade, ordem)
+
+def perturbar_solucao(solucao, pesos, valores, capacidade, ordem, taxa=TAXA_PERTURBACAO, rng=None):
+    """Inverte cada bit com probabilidade taxa e repara o resultado."""
+    rng = gerador(rng)
+    perturbada = [1 - s if rng.random() < taxa else s for s in solucao]
+    return reparar_solucao(perturbada, pesos, valores, capacidade, ordem)
+
+def gerar_populacao_gulosa(tamanho, pesos, valores, capacidade, taxa=TAXA_PERTURBACAO, rng=None):
+    """População com a solução gulosa seguida de perturbações reparadas dela."""
+    if tamanho <= 0:
+        return []
+    ordem = ordenar_por_razao(pesos, valores)
+    gulosa = solucao_gulosa(pesos, valores, capacidade, ordem)
+    return [gulosa] + [
+        perturbar_solucao(gulosa, pesos, valores, capacidade, ordem, taxa, rng) for _ in range(tamanho - 1)
+    ]
+
+def feromonios_de_solucao(solucao, inicial=1.0, reforco=1.0):
+    """Trilhas iniciais de feromônio reforçadas nos itens de uma solução (por exemplo, a gulosa)."""
+    return [inicial + reforco * s for s in solucao]
+
+def posicao_de_solucao(solucao, amplitude=(2, 4), rng=None):
+    """Posição contínua (PSO) cuja binarização pela sigmoide reproduz a solução."""
+    rng = gerador(rng)
+    baixo, alto = amplitude
+    return [rng.uniform(baixo, alto) if s else rng.uniform(-alto, -baixo) for s in solucao]
@@ -0,0 +1,82 @@
+import pytest
+import random
+from utils import avaliar_solucao, gerar_instancia_aleatoria
+from partida_gulosa import (
+    ordenar_por_razao, reparar_solucao, solucao_gulosa, gerar_populacao_gulosa, feromonios_de_solucao,
+    posicao_de_solucao
+)
+from resolvedores import resolver
+import pso.algEnxParticulas_ref as modulo_pso
+
+
+class TestPartidaGulosa:
+    """Classe de testes para a inicialização gulosa das populações"""
+
+    def setup_method(self):
+        """Configuração executada antes de cada teste"""
+        random.seed(42)
+        self.pesos = [2, 1, 3, 2]
+        self.valores = [12, 10, 20, 15]
+        self.capacidade = 5
+
+    def test_solucao_gulosa(self):
+        """Testa a ordem por razão e a solução gulosa da instância de exemplo"""
+        assert ordenar_por_razao(self.pesos, self.valores) == [1, 3, 2, 0]
+        # Itens 1 e 3 (peso 3); o item 2 não cabe e o item 0 completa a capacidade
+        assert solucao_gulosa(self.pesos, self.valores, self.capacidade) == [1, 1, 0, 1]
+
+    def test_reparar_solucao(self):
+        """Testa que a reparação remove os itens de pior razão e completa a mochila"""
+        ordem = ordenar_por_razao(self.pesos, self.valores)
+        # Remove os itens 0 e 2 (peso 8 -> 3) e o item 0 volta ao completar a capacidade
+        assert reparar_solucao([1, 1, 1, 1], self.pesos, self.valores, self.capacidade, ordem) == [1, 1, 0, 1]
+        assert reparar_solucao([0, 0, 1, 0], self.pesos, self.valores, self.capacidade, ordem) == [0, 1, 1, 0]
+
+    def test_populacao_gulosa_viavel(self):
+        """Testa tamanho, diversidade e viabilidade da população gulosa"""
+        pesos, valores, capacidade = gerar_instancia_aleatoria(200)
+        gulosa = solucao_gulosa(pesos, valores, capacidade)
+
+        populacao = gerar_populacao_gulosa(10, pesos, valores, capacidade)
+
+        assert len(populacao) == 10
+        assert populacao[0] == gulosa
+        assert any(individuo != gulosa for individuo in populacao[1:])
+        assert all(avaliar_solucao(individuo, pesos, valores, capacidade)[0] > 0 for individuo in populacao)
+        assert gerar_populacao_gulosa(0, pesos, valores, capacidade) == []
+
+    def test_feromonios_e_posicoes(self):
+        """Testa o viés de feromônio e de posição do PSO a partir de uma solução"""
+        solucao = [1, 0, 1]
+        assert feromonios_de_solucao(solucao) == [2.0, 1.0, 2.0]
+        assert modulo_pso.binarizar(posicao_de_solucao(solucao)) == solucao
+
+    @pytest.mark.parametrize("algoritmo, parametros", [
+        ("aco", {"n_formigas": 3, "n_iteracoes": 2}),
+        ("bee", {"n_abelhas": 6, "n_melhores": 2, "n_vizinhos": 1, "n_iter": 2}),
+        ("bee", {"n_abelhas": 6, "n_melhores": 2, "n_vizinhos": 1, "n_iter": 2, "persistente": True}),
+        ("cuckoo", {"n_ninhos": 5, "n_iteracoes": 2}),
+        ("cuckoo", {"n_ninhos": 5, "n_iteracoes": 2, "levy_mantegna": True}),
+        ("cuckoo", {"n_ninhos": 5, "n_iteracoes": 2, "matricial": True}),
+        ("genetico", {"tam_populacao": 6, "n_geracoes": 2}),
+    ])
+    def test_algoritmos_partem_da_gulosa(self, algoritmo, parametros):
+        """Testa que com partida gulosa nenhum algoritmo termina abaixo da solução gulosa"""
+        pesos, valores, capacidade = gerar_instancia_aleatoria(300)
+        valor_guloso, _ = avaliar_solucao(solucao_gulosa(pesos, valores, capacidade), pesos, valores, capacidade)
+
+        resultado = resolver(algoritmo, pesos, valores, capacidade, partida_gulosa=True, **parametros)
+
+        assert resultado.valor >= valor_guloso
+
+    def test_pso_parte_da_gulosa(self, monkeypatch):
+        """Testa o enxame inicial do PSO com partida gulosa"""
+        pesos, valores, capacidade = gerar_instancia_aleatoria(100)
+        monkeypatch.setattr(modulo_pso, "partida_gulosa", True)
+        monkeypatch.setattr(modulo_pso, "n_particulas", 4)
+
+        enxame = modulo_pso.inicializar_enxame(len(pesos), pesos, valores, capacidade)
+
+        gulosa = solucao_gulosa(pesos, valores, capacidade)
+        assert modulo_pso.binarizar(enxame[0]['posicao']) == gulosa
+        assert enxame[0]['melhor_valor'] == avaliar_solucao(gulosa, pesos, valores, capacidade)[0]
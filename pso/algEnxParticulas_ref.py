@@ -1,8 +1,13 @@
-import random
 import math
+from itertools import islice
 import time
-import pandas as pd
 from utils import gerar_instancia_aleatoria, avaliar_solucao
+from controle import ExecucaoEsgotada
+from registros import criar_registro, para_dataframe
+from aleatorio import gerador, uniformes_em_bloco
+from partida_gulosa import gerar_populacao_gulosa, posicao_de_solucao
+from busca_local import criar_busca_local
+from checkpoint import codificar_matriz_reais, codificar_reais, decodificar_matriz_reais, decodificar_reais, validar_estado
 
 # Parâmetros do PSO
 n_particulas = 30
@@ -11,6 +16,15 @@ c1 = 1.5
 c2 = 1.5
 w = 0.8
 limite_velocidade = 4
+partida_gulosa = False  # Enxame inicial em torno da solução gulosa (ver partida_gulosa.py)
+busca_local = None  # "primeira" ou "melhor": busca local na melhor posição global (ver busca_local.py)
+
+# Padrão dos parâmetros por chamada: não informado, vale o global de mesmo nome
+_DO_MODULO = object()
+
+def _parametro(nome, valor):
+    """Valor do parâmetro por chamada, ou o global do módulo se não foi informado."""
+    return globals()[nome] if valor is _DO_MODULO else valor
 
 def sigmoid(x):
     return 1 / (1 + math.exp(-x))
@@ -19,26 +33,45 @@ def binarizar(posicao):
     """Converte posição contínua em solução binária."""
     return [1 if sigmoid(x) >= 0.5 else 0 for x in posicao]
 
-def inicializar_particula(n_itens):
+def inicializar_particula(n_itens, rng=None):
     """Inicializa posição e velocidade de uma partícula."""
-    posicao = [random.uniform(-4, -2) for _ in range(n_itens)]
-    velocidade = [random.uniform(-1, 1) for _ in range(n_itens)]
+    sorteios = uniformes_em_bloco(rng, 2 * n_itens)
+    if sorteios is not None:  # Mesma fórmula de random.uniform, lendo os sorteios do bloco
+        return [-4 + 2 * u for u in islice(sorteios, n_itens)], [-1 + 2 * u for u in sorteios]
+    rng = gerador(rng)
+    posicao = [rng.uniform(-4, -2) for _ in range(n_itens)]
+    velocidade = [rng.uniform(-1, 1) for _ in range(n_itens)]
     return posicao, velocidade
 
-def calcular_nova_velocidade(vel_atual, pos_atual, melhor_pessoal, melhor_global, indice):
+def inicializar_particula_gulosa(solucao, rng=None):
+    """Inicializa uma partícula cuja posição binariza para a solução dada."""
+    rng = gerador(rng)
+    posicao = posicao_de_solucao(solucao, rng=rng)
+    velocidade = [rng.uniform(-1, 1) for _ in range(len(solucao))]
+    return posicao, velocidade
+
+def calcular_nova_velocidade(vel_atual, pos_atual, melhor_pessoal, melhor_global, indice, rng=None):
     """Calcula nova velocidade para uma dimensão."""
-    r1 = random.random()
-    r2 = random.random()
+    rng = gerador(rng)
+    r1 = rng.random()
+    r2 = rng.random()
     cog = c1 * r1 * (melhor_pessoal[indice] - pos_atual[indice])
     soc = c2 * r2 * (melhor_global[indice] - pos_atual[indice])
     nova_vel = w * vel_atual[indice] + cog + soc
     return max(min(nova_vel, limite_velocidade), -limite_velocidade)
 
-def atualizar_velocidade(velocidade, posicao, melhor_pessoal, melhor_global):
+def atualizar_velocidade(velocidade, posicao, melhor_pessoal, melhor_global, rng=None):
     """Atualiza velocidade de todas as dimensões."""
+    sorteios = uniformes_em_bloco(rng, 2 * len(posicao))
+    if sorteios is not None:
+        # Mesma conta de calcular_nova_velocidade, com r1 e r2 lidos em sequência do bloco
+        return [
+            max(min(w * v + c1 * r1 * (mp - p) + c2 * r2 * (mg - p), limite_velocidade), -limite_velocidade)
+            for v, p, mp, mg, r1, r2 in zip(velocidade, posicao, melhor_pessoal, melhor_global, sorteios, sorteios)
+        ]
     nova_velocidade = []
     for i in range(len(posicao)):
-        nova_vel = calcular_nova_velocidade(velocidade, posicao, melhor_pessoal, melhor_global, i)
+        nova_vel = calcular_nova_velocidade(velocidade, posicao, melhor_pessoal, melhor_global, i, rng)
         nova_velocidade.append(nova_vel)
     return nova_velocidade
 
@@ -46,18 +79,23 @@ def atualizar_posicao(posicao, velocidade):
     """Atualiza posição baseada na velocidade."""
     return [pos + vel for pos, vel in zip(posicao, velocidade)]
 
-def avaliar_particula(posicao, pesos, valores, capacidade):
+def avaliar_particula(posicao, pesos, valores, capacidade, avaliar=None):
     """Avalia fitness de uma partícula."""
     solucao_binaria = binarizar(posicao)
-    valor, _ = avaliar_solucao(solucao_binaria, pesos, valores, capacidade)
+    valor, _ = (avaliar or avaliar_solucao)(solucao_binaria, pesos, valores, capacidade)
     return valor
 
-def inicializar_enxame(n_itens, pesos, valores, capacidade):
-    """Inicializa o enxame completo."""
+def inicializar_enxame(n_itens, pesos, valores, capacidade, avaliar=None, rng=None, partida_gulosa=_DO_MODULO):
+    """Inicializa o enxame completo (com partida_gulosa, em torno da solução gulosa)."""
+    partida_gulosa = _parametro("partida_gulosa", partida_gulosa)
+    solucoes = gerar_populacao_gulosa(n_particulas, pesos, valores, capacidade, rng=rng) if partida_gulosa else None
     particulas = []
-    for _ in range(n_particulas):
-        posicao, velocidade = inicializar_particula(n_itens)
-        valor = avaliar_particula(posicao, pesos, valores, capacidade)
+    for k in range(n_particulas):
+        if solucoes is not None:
+            posicao, velocidade = inicializar_particula_gulosa(solucoes[k], rng)
+        else:
+            posicao, velocidade = inicializar_particula(n_itens, rng)
+        valor = avaliar_particula(posicao, pesos, valores, capacidade, avaliar)
         particulas.append({
             'posicao': posicao,
             'velocidade': velocidade,
@@ -71,47 +109,152 @@ def encontrar_melhor_global(particulas):
     melhor = max(particulas, key=lambda p: p['melhor_valor'])
     return melhor['melhor_posicao'][:], melhor['melhor_valor']
 
-def atualizar_melhor_pessoal(particula, pesos, valores, capacidade):
+def atualizar_melhor_pessoal(particula, pesos, valores, capacidade, avaliar=None):
     """Atualiza melhor posição pessoal se necessário."""
-    valor_atual = avaliar_particula(particula['posicao'], pesos, valores, capacidade)
+    valor_atual = avaliar_particula(particula['posicao'], pesos, valores, capacidade, avaliar)
     if valor_atual > particula['melhor_valor']:
         particula['melhor_valor'] = valor_atual
         particula['melhor_posicao'] = particula['posicao'][:]
 
-def pso(n_itens, pesos, valores, capacidade):
-    """Executa o algoritmo PSO."""
-    # Inicialização
-    particulas = inicializar_enxame(n_itens, pesos, valores, capacidade)
-    melhor_global, melhor_valor_global = encontrar_melhor_global(particulas)
+def melhorar_melhor_global(melhor_global, melhor_valor_global, melhorar):
+    """
+    Busca local na binarização da melhor posição global.
+
+    Se a solução melhora, os bits alterados recebem posição +3 ou -3 (o meio da
+    amplitude de posicao_de_solucao) e o resto da posição é preservado.
+    """
+    solucao = binarizar(melhor_global)
+    melhorada, valor, _ = melhorar(solucao[:])
+    if valor <= melhor_valor_global:
+        return melhor_global, melhor_valor_global
+    nova_posicao = melhor_global[:]
+    for i, (antes, depois) in enumerate(zip(solucao, melhorada)):
+        if antes != depois:
+            nova_posicao[i] = 3.0 if depois else -3.0
+    return nova_posicao, valor
+
+def registrar_melhor_global(controle, melhor_global, melhor_valor_global, pesos):
+    """Informa ao controle de execução o valor e o peso da melhor posição global."""
+    solucao = binarizar(melhor_global)
+    controle.registrar(melhor_valor_global, sum(p * s for p, s in zip(pesos, solucao)))
+
+def criar_estado_pso(iteracao, particulas, melhor_global, melhor_valor_global, rng=None):
+    """Monta o snapshot do PSO: enxame, melhor global e estado do gerador aleatório."""
+    return {
+        "algoritmo": "pso",
+        "n_itens": len(melhor_global),
+        "iteracao": iteracao,
+        "posicoes": codificar_matriz_reais(p['posicao'] for p in particulas),
+        "velocidades": codificar_matriz_reais(p['velocidade'] for p in particulas),
+        "melhores_posicoes": codificar_matriz_reais(p['melhor_posicao'] for p in particulas),
+        "melhores_valores": [p['melhor_valor'] for p in particulas],
+        "melhor_global": codificar_reais(melhor_global),
+        "melhor_valor_global": melhor_valor_global,
+        "rng": gerador(rng).getstate(),
+    }
+
+def restaurar_estado_pso(estado, n_itens, rng=None):
+    """Restaura um snapshot do PSO; retorna (proxima_iteracao, particulas, melhor_global, melhor_valor_global)."""
+    validar_estado(estado, "pso", n_itens)
+    gerador(rng).setstate(estado["rng"])
+    particulas = [
+        {'posicao': posicao, 'velocidade': velocidade, 'melhor_posicao': melhor_posicao, 'melhor_valor': melhor_valor}
+        for posicao, velocidade, melhor_posicao, melhor_valor in zip(
+            decodificar_matriz_reais(estado["posicoes"], n_itens),
+            decodificar_matriz_reais(estado["velocidades"], n_itens),
+            decodificar_matriz_reais(estado["melhores_posicoes"], n_itens),
+            estado["melhores_valores"],
+        )
+    ]
+    return estado["iteracao"] + 1, particulas, decodificar_reais(estado["melhor_global"]), estado["melhor_valor_global"]
+
+def pso(n_itens, pesos, valores, capacidade, avaliar=None, controle=None, checkpoint=None, rng=None,
+        partida_gulosa=_DO_MODULO, busca_local=_DO_MODULO):
+    """
+    Executa o algoritmo PSO.
+
+    avaliar é o backend de avaliação, com a assinatura de utils.avaliar_solucao.
+    controle é um ControleExecucao opcional (prazo, orçamento de avaliações e
+    notificação de melhorias); ao esgotar, retorna a melhor posição até ali.
+    checkpoint é um Checkpoint opcional; se houver snapshot gravado, o enxame
+    continua dele com o mesmo resultado de uma execução ininterrupta.
+    rng é o gerador aleatório de todos os sorteios (padrão: o módulo random;
+    ver aleatorio.py).
+    partida_gulosa e busca_local valem para esta chamada e, se omitidos, seguem
+    os globais de mesmo nome. Com busca_local, a melhor posição global passa
+    pela busca local de busca_local.py sempre que muda (no máximo uma vez por
+    iteração).
+    """
+    melhorar = criar_busca_local(_parametro("busca_local", busca_local), pesos, valores, capacidade)
+    if controle is not None:
+        avaliar = controle.envolver(avaliar)
+
+    # Inicialização (ou retomada do último checkpoint)
+    estado = checkpoint.carregar() if checkpoint is not None else None
+    if estado is not None:
+        inicio, particulas, melhor_global, melhor_valor_global = restaurar_estado_pso(estado, n_itens, rng)
+    else:
+        inicio = 0
+        particulas = inicializar_enxame(n_itens, pesos, valores, capacidade, avaliar, rng, partida_gulosa)
+        melhor_global, melhor_valor_global = encontrar_melhor_global(particulas)
+        if melhorar is not None:
+            melhor_global, melhor_valor_global = melhorar_melhor_global(melhor_global, melhor_valor_global, melhorar)
+    if controle is not None:
+        registrar_melhor_global(controle, melhor_global, melhor_valor_global, pesos)
 
     # Loop principal
-    for _ in range(n_iteracoes):
-        for particula in particulas:
-            # Atualizar velocidade e posição
-            particula['velocidade'] = atualizar_velocidade(
-                particula['velocidade'],
-                particula['posicao'],
-                particula['melhor_posicao'],
-                melhor_global
-            )
-            particula['posicao'] = atualizar_posicao(
-                particula['posicao'],
-                particula['velocidade']
-            )
-
-            # Atualizar melhor pessoal
-            atualizar_melhor_pessoal(particula, pesos, valores, capacidade)
-
-            # Verificar se é nova melhor global
-            if particula['melhor_valor'] > melhor_valor_global:
-                melhor_global = particula['melhor_posicao'][:]
-                melhor_valor_global = particula['melhor_valor']
+    try:
+        for iteracao in range(inicio, n_iteracoes):
+            global_mudou = False
+            for particula in particulas:
+                # Atualizar velocidade e posição
+                particula['velocidade'] = atualizar_velocidade(
+                    particula['velocidade'],
+                    particula['posicao'],
+                    particula['melhor_posicao'],
+                    melhor_global,
+                    rng
+                )
+                particula['posicao'] = atualizar_posicao(
+                    particula['posicao'],
+                    particula['velocidade']
+                )
+
+                # Atualizar melhor pessoal
+                atualizar_melhor_pessoal(particula, pesos, valores, capacidade, avaliar)
+
+                # Verificar se é nova melhor global
+                if particula['melhor_valor'] > melhor_valor_global:
+                    melhor_global = particula['melhor_posicao'][:]
+                    melhor_valor_global = particula['melhor_valor']
+                    global_mudou = True
+                    if controle is not None:
+                        registrar_melhor_global(controle, melhor_global, melhor_valor_global, pesos)
+
+            if melhorar is not None and global_mudou:
+                melhor_global, valor_melhorado = melhorar_melhor_global(melhor_global, melhor_valor_global, melhorar)
+                if valor_melhorado > melhor_valor_global:
+                    melhor_valor_global = valor_melhorado
+                    if controle is not None:
+                        registrar_melhor_global(controle, melhor_global, melhor_valor_global, pesos)
+            if controle is not None:
+                controle.concluir_iteracao(iteracao)
+
+            if checkpoint is not None:
+                checkpoint.talvez_salvar(iteracao, lambda: criar_estado_pso(
+                    iteracao, particulas, melhor_global, melhor_valor_global, rng
+                ))
+    except ExecucaoEsgotada:
+        pass
+    finally:
+        if checkpoint is not None:
+            checkpoint.aguardar()
 
     # Retornar melhor solução
     melhor_solucao = binarizar(melhor_global)
     return melhor_solucao, melhor_valor_global
 
-def executar_teste(n_itens):
+def executar_teste(n_itens, catalogo=None):
     """Executa um teste com n_itens."""
     pesos, valores, capacidade = gerar_instancia_aleatoria(n_itens, max_peso=10, max_valor=10)
 
@@ -121,30 +264,26 @@ def executar_teste(n_itens):
 
     peso_total = sum(p * i for p, i in zip(pesos, solucao))
 
-    return {
-        "algoritmo": "PSO",
-        "n_itens": n_itens,
-        "capacidade": capacidade,
-        "valor_total": valor,
-        "peso_total": peso_total,
-        "tempo_execucao": fim - inicio,
-        "pesos": pesos,
-        "valores": valores,
-        "melhor_solucao": solucao
-    }
+    return criar_registro(
+        "PSO", n_itens, capacidade, valor, peso_total, fim - inicio, pesos, valores, solucao, casas_tempo=None,
+        catalogo=catalogo
+    )
 
-def main():
+def main(ao_concluir=None, catalogo=None, concluidos=()):
     tamanhos = [5, 1000, 10000]
     resultados = []
 
     for n_itens in tamanhos:
-        resultado = executar_teste(n_itens)
+        if n_itens in concluidos:
+            continue
+        resultado = executar_teste(n_itens, catalogo)
         resultados.append(resultado)
+        if ao_concluir is not None:
+            ao_concluir(resultado)
 
-    df_resultados = pd.DataFrame(resultados)
-    return df_resultados
+    return resultados
 
 if __name__ == "__main__":
-    df_resultados = main()
+    df_resultados = para_dataframe(main())
     print("\nResumo dos resultados de todos os testes:")
     print(df_resultados)
\ No newline at end of file
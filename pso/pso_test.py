@@ -56,7 +56,7 @@ class TestPSO:
     def test_atualizar_velocidade(self):
         # monkeypatch calcular_nova_velocidade
         calls = []
-        def fake_calc(v, p, bp, bg, i):
+        def fake_calc(v, p, bp, bg, i, rng=None):
             calls.append(i)
             return i * 0.1
         vel = [0, 0]
@@ -90,8 +90,8 @@ class TestPSO:
 
     def test_inicializar_enxame(self, monkeypatch):
         # monkeypatch inicializar_particula e avaliar_particula
-        monkeypatch.setattr('pso.algEnxParticulas_ref.inicializar_particula', lambda n: ([0], [0]))
-        monkeypatch.setattr('pso.algEnxParticulas_ref.avaliar_particula', lambda p, w, v, c: 42)
+        monkeypatch.setattr('pso.algEnxParticulas_ref.inicializar_particula', lambda n, rng=None: ([0], [0]))
+        monkeypatch.setattr('pso.algEnxParticulas_ref.avaliar_particula', lambda p, w, v, c, avaliar=None: 42)
         enxame = inicializar_enxame(1, [1], [1], 1)
         assert len(enxame) == 30
         for particula in enxame:
@@ -113,11 +113,11 @@ class TestPSO:
     def test_atualizar_melhor_pessoal(self, monkeypatch):
         particula = {'posicao': [0], 'melhor_posicao': [1], 'melhor_valor': 1}
         # sem melhoria
-        monkeypatch.setattr('pso.algEnxParticulas_ref.avaliar_particula', lambda p, w, v, c: 0)
+        monkeypatch.setattr('pso.algEnxParticulas_ref.avaliar_particula', lambda p, w, v, c, avaliar=None: 0)
         atualizar_melhor_pessoal(particula, [], [], 0)
         assert particula['melhor_valor'] == 1
         # com melhoria
-        monkeypatch.setattr('pso.algEnxParticulas_ref.avaliar_particula', lambda p, w, v, c: 10)
+        monkeypatch.setattr('pso.algEnxParticulas_ref.avaliar_particula', lambda p, w, v, c, avaliar=None: 10)
         atualizar_melhor_pessoal(particula, [], [], 0)
         assert particula['melhor_valor'] == 10
         assert particula['melhor_posicao'] == particula['posicao']
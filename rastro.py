@@ -0,0 +1,133 @@
+import math
+import time
+from array import array
+from aleatorio import SequenciaSementes
+from controle import ControleExecucao
+
+# Pontos pré-alocados por rastro (o buffer só cresce se não houver patamares para compactar)
+CAPACIDADE_PADRAO = 4096
+# Quantis resumidos das distribuições até o alvo
+QUANTIS = (0.5, 0.9)
+
+
+class Rastro:
+    """
+    Rastro de convergência: pontos (iteração, decorrido_ns, avaliações, melhor) em arrays pré-alocados.
+
+    Alimentado por um ControleExecucao(rastro=...): cada melhoria da incumbente e
+    o fim de cada iteração gravam um ponto, escrevendo em lugar nos arrays, sem
+    alocar nada por iteração. O melhor valor é uma função escada; quando o
+    buffer enche, os pontos que só repetem o melhor valor do ponto anterior são
+    descartados (compactar), e só se isso não liberar metade do buffer ele dobra
+    de tamanho. O mesmo rastro pode ser reaproveitado entre execuções: o
+    controle o reinicia ao ser criado.
+    """
+
+    def __init__(self, capacidade=CAPACIDADE_PADRAO):
+        if capacidade < 1:
+            raise ValueError("A capacidade do rastro deve ser positiva")
+        self.capacidade = capacidade
+        self.iteracoes = array("q", bytes(8 * capacidade))
+        self.decorridos_ns = array("q", bytes(8 * capacidade))
+        self.avaliacoes = array("q", bytes(8 * capacidade))
+        self.melhores = array("d", bytes(8 * capacidade))
+        self.tamanho = 0
+        self.inicio_ns = time.perf_counter_ns()
+
+    def __len__(self):
+        return self.tamanho
+
+    def reiniciar(self):
+        """Esvazia o rastro (sem realocar) e recomeça a contagem do tempo."""
+        self.tamanho = 0
+        self.inicio_ns = time.perf_counter_ns()
+
+    def gravar(self, iteracao, avaliacoes, melhor):
+        """Grava um ponto; melhor None (nenhuma solução ainda) vira -inf."""
+        i = self.tamanho
+        if i == self.capacidade:
+            i = self.compactar()
+        self.iteracoes[i] = iteracao
+        self.decorridos_ns[i] = time.perf_counter_ns() - self.inicio_ns
+        self.avaliacoes[i] = avaliacoes
+        self.melhores[i] = -math.inf if melhor is None else melhor
+        self.tamanho = i + 1
+
+    def compactar(self):
+        """Mantém só o primeiro ponto de cada patamar do melhor valor; retorna o novo tamanho."""
+        melhores = self.melhores
+        k = 1
+        for i in range(1, self.tamanho):
+            if melhores[i] != melhores[k - 1]:
+                self.iteracoes[k] = self.iteracoes[i]
+                self.decorridos_ns[k] = self.decorridos_ns[i]
+                self.avaliacoes[k] = self.avaliacoes[i]
+                melhores[k] = melhores[i]
+                k += 1
+        self.tamanho = k
+        if k > self.capacidade // 2:
+            for buffer in (self.iteracoes, self.decorridos_ns, self.avaliacoes, self.melhores):
+                buffer.frombytes(bytes(8 * self.capacidade))
+            self.capacidade *= 2
+        return k
+
+    def pontos(self):
+        """Lista de tuplas (iteracao, decorrido_ns, avaliacoes, melhor) gravadas."""
+        return [
+            (self.iteracoes[i], self.decorridos_ns[i], self.avaliacoes[i], self.melhores[i])
+            for i in range(self.tamanho)
+        ]
+
+    def ate_alvo(self, alvo):
+        """Primeiro ponto (iteracao, decorrido_ns, avaliacoes) com melhor >= alvo; None se não chegou."""
+        melhores = self.melhores
+        for i in range(self.tamanho):
+            if melhores[i] >= alvo:
+                return self.iteracoes[i], self.decorridos_ns[i], self.avaliacoes[i]
+        return None
+
+
+def quantil(amostras, q):
+    """Quantil q (posto mais próximo) das amostras; execuções que não chegaram ao alvo (None) contam como inf."""
+    ordenadas = sorted(math.inf if a is None else a for a in amostras)
+    return ordenadas[max(0, math.ceil(q * len(ordenadas)) - 1)]
+
+def medir_ate_alvo(algoritmo, pesos, valores, capacidade, alvos, n_execucoes=10, semente=0,
+                   capacidade_rastro=CAPACIDADE_PADRAO, **parametros):
+    """
+    Tempo e avaliações até cada alvo em n_execucoes independentes do algoritmo.
+
+    Cada execução usa um gerador filho da semente e um único Rastro, reiniciado
+    a cada execução; a execução para assim que a incumbente atinge o maior alvo.
+
+    Returns:
+        Dicionário alvo -> (segundos, avaliacoes), listas com uma entrada por
+        execução (None quando a execução não chegou ao alvo)
+    """
+    from resolvedores import resolver
+
+    rastro = Rastro(capacidade_rastro)
+    medidas = {alvo: ([], []) for alvo in alvos}
+    for filha in SequenciaSementes(semente).spawn(n_execucoes):
+        controle = ControleExecucao(limitante=max(alvos), rastro=rastro)
+        resolver(algoritmo, pesos, valores, capacidade, controle=controle, rng=filha.criar_gerador(), **parametros)
+        for alvo, (segundos, avaliacoes) in medidas.items():
+            ponto = rastro.ate_alvo(alvo)
+            segundos.append(None if ponto is None else ponto[1] / 1e9)
+            avaliacoes.append(None if ponto is None else ponto[2])
+    return medidas
+
+def resumir_ate_alvo(algoritmo, medidas, quantis=QUANTIS):
+    """Linhas (uma por alvo) com a taxa de sucesso e os quantis de tempo e de avaliações até o alvo."""
+    linhas = []
+    for alvo, (segundos, avaliacoes) in medidas.items():
+        linha = {
+            "algoritmo": algoritmo,
+            "alvo": alvo,
+            "sucesso": sum(s is not None for s in segundos) / len(segundos),
+        }
+        for q in quantis:
+            linha[f"tempo_p{round(q * 100)}"] = quantil(segundos, q)
+            linha[f"avaliacoes_p{round(q * 100)}"] = quantil(avaliacoes, q)
+        linhas.append(linha)
+    return linhas
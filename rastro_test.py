@@ -0,0 +1,112 @@
+import pytest
+import math
+import random
+import tracemalloc
+from controle import ControleExecucao
+from rastro import Rastro, medir_ate_alvo, quantil, resumir_ate_alvo
+from resolvedores import resolver
+from utils import gerar_instancia_aleatoria
+import pso.algEnxParticulas_ref as modulo_pso
+
+
+class TestRastro:
+    """Classe de testes para o rastro de convergência e as medidas até o alvo"""
+
+    def setup_method(self):
+        """Configuração executada antes de cada teste"""
+        self.pesos, self.valores, self.capacidade = gerar_instancia_aleatoria(40, rng=random.Random(3))
+
+    def test_gravar_e_ate_alvo(self):
+        """Testa os pontos gravados e o primeiro ponto que atinge o alvo"""
+        rastro = Rastro(8)
+        rastro.gravar(0, 5, None)
+        rastro.gravar(0, 10, 3)
+        rastro.gravar(1, 20, 7)
+        assert [(i, a, m) for i, _, a, m in rastro.pontos()] == [(0, 5, -math.inf), (0, 10, 3.0), (1, 20, 7.0)]
+        assert rastro.ate_alvo(5)[0::2] == (1, 20)
+        assert rastro.ate_alvo(8) is None
+        decorridos = [d for _, d, _, _ in rastro.pontos()]
+        assert decorridos == sorted(decorridos)
+        rastro.reiniciar()
+        assert len(rastro) == 0 and rastro.capacidade == 8
+
+    def test_compactar_patamares_sem_crescer(self):
+        """Testa que o buffer cheio descarta os pontos de patamar e mantém as melhorias"""
+        rastro = Rastro(8)
+        for iteracao in range(100):
+            rastro.gravar(iteracao, iteracao, iteracao // 40)
+        assert rastro.capacidade == 8
+        assert [m for _, _, _, m in rastro.pontos()][:3] == [0.0, 1.0, 2.0]
+        assert rastro.ate_alvo(1)[0] == 40 and rastro.ate_alvo(2)[0] == 80
+
+    def test_buffer_cresce_so_com_melhorias(self):
+        """Testa que, sem patamares para descartar, o buffer dobra e nada se perde"""
+        rastro = Rastro(4)
+        for iteracao in range(10):
+            rastro.gravar(iteracao, 0, iteracao)
+        assert rastro.capacidade == 16
+        assert [i for i, _, _, _ in rastro.pontos()] == list(range(10))
+
+    def test_gravar_nao_aloca(self):
+        """Testa que gravar pontos não aloca memória por iteração"""
+        rastro = Rastro(10000)
+        rastro.gravar(0, 0, 1.0)
+        tracemalloc.start()
+        for iteracao in range(5000):
+            rastro.gravar(iteracao, iteracao, 2.0)
+        _, pico = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        assert pico < 10000
+
+    @pytest.mark.parametrize("algoritmo, parametros, n_iteracoes", [
+        ("aco", {"n_formigas": 5, "n_iteracoes": 6}, 6),
+        ("cuckoo", {"n_ninhos": 6, "n_iteracoes": 6}, 6),
+        ("cuckoo", {"n_ninhos": 6, "n_iteracoes": 6, "levy_mantegna": True}, 6),
+        ("cuckoo", {"n_ninhos": 6, "n_iteracoes": 6, "matricial": True}, 6),
+        ("genetico", {"tam_populacao": 6, "n_geracoes": 6}, 6),
+        ("genetico", {"tam_populacao": 6, "n_geracoes": 6, "buffer_duplo": True}, 6),
+        ("pso", {}, 3),
+        ("bee", {"n_abelhas": 8, "n_melhores": 3, "n_vizinhos": 2, "n_iter": 6}, 6),
+        ("bee", {"n_abelhas": 8, "n_melhores": 3, "n_vizinhos": 2, "n_iter": 6, "persistente": True}, 6),
+    ])
+    def test_rastro_em_cada_algoritmo(self, algoritmo, parametros, n_iteracoes, monkeypatch):
+        """Testa que cada algoritmo grava o fim de cada iteração e termina no valor retornado"""
+        monkeypatch.setattr(modulo_pso, "n_iteracoes", 3)
+        rastro = Rastro()
+        resultado = resolver(algoritmo, self.pesos, self.valores, self.capacidade,
+                             controle=ControleExecucao(rastro=rastro), rng=random.Random(1), **parametros)
+        pontos = rastro.pontos()
+        assert set(range(n_iteracoes)) <= {i for i, _, _, _ in pontos}
+        melhores = [m for _, _, _, m in pontos]
+        assert melhores == sorted(melhores)
+        avaliacoes = [a for _, _, a, _ in pontos]
+        assert avaliacoes == sorted(avaliacoes) and avaliacoes[-1] > 0
+        assert melhores[-1] == resultado.valor
+
+    def test_quantil(self):
+        """Testa o quantil por posto mais próximo, com falhas como infinito"""
+        assert quantil([3, 1, 2, None], 0.5) == 2
+        assert quantil([3, 1, 2, None], 0.9) == math.inf
+        assert quantil([4], 0.1) == 4
+
+    def test_medir_ate_alvo(self):
+        """Testa as distribuições até o alvo: alvo fácil sempre atingido, impossível nunca"""
+        alvos = [1, 10 ** 9]
+        medidas = medir_ate_alvo("aco", self.pesos, self.valores, self.capacidade, alvos, n_execucoes=3,
+                                 n_formigas=4, n_iteracoes=4)
+        segundos, avaliacoes = medidas[1]
+        assert all(s is not None and s >= 0 for s in segundos)
+        assert all(0 < a <= 16 for a in avaliacoes)
+        assert medidas[10 ** 9] == ([None] * 3, [None] * 3)
+        facil, impossivel = resumir_ate_alvo("aco", medidas)
+        assert (facil["algoritmo"], facil["alvo"], facil["sucesso"]) == ("aco", 1, 1.0)
+        assert facil["avaliacoes_p50"] <= facil["avaliacoes_p90"]
+        assert impossivel["sucesso"] == 0 and impossivel["tempo_p50"] == math.inf
+
+    def test_para_no_maior_alvo(self):
+        """Testa que a execução para assim que atinge o maior alvo"""
+        alvo = resolver("aco", self.pesos, self.valores, self.capacidade, rng=random.Random(0),
+                        n_formigas=4, n_iteracoes=2).valor
+        _, avaliacoes = medir_ate_alvo("aco", self.pesos, self.valores, self.capacidade, [alvo], n_execucoes=2,
+                                       n_formigas=4, n_iteracoes=200)[alvo]
+        assert all(a is not None and a < 4 * 200 for a in avaliacoes)
@@ -0,0 +1,192 @@
+import hashlib
+from array import array
+
+# Campos lógicos de um resultado de teste, na ordem das colunas do DataFrame expandido
+CAMPOS = (
+    "algoritmo", "n_itens", "capacidade", "valor_total", "peso_total", "tempo_execucao",
+    "pesos", "valores", "melhor_solucao",
+)
+
+# Colunas do DataFrame compacto: a instância entra pelo identificador e a solução como bitset
+CAMPOS_COMPACTOS = (
+    "algoritmo", "n_itens", "capacidade", "valor_total", "peso_total", "tempo_execucao",
+    "instancia", "solucao_bits",
+)
+
+
+def identificar_instancia(pesos, valores, capacidade):
+    """Identificador de conteúdo (hash) de uma instância (pesos, valores, capacidade)."""
+    h = hashlib.blake2b(digest_size=16)
+    h.update(f"{len(pesos)}:{capacidade}:".encode())
+    h.update(array("q", pesos).tobytes())
+    h.update(array("q", valores).tobytes())
+    return h.hexdigest()
+
+def _array_compacto(numeros):
+    """array de inteiros com 4 bytes por elemento quando cabem em int32, senão 8."""
+    try:
+        return array("i", numeros)
+    except OverflowError:
+        return array("q", numeros)
+
+def compactar_solucao(solucao):
+    """Empacota um vetor binário em bytes (bit i = item i, little-endian); None continua None."""
+    if solucao is None:
+        return None
+    bits = "".join("1" if s else "0" for s in reversed(solucao))
+    return int(bits or "0", 2).to_bytes((len(solucao) + 7) // 8, "little")
+
+def expandir_solucao(bits, n_itens):
+    """Inverso de compactar_solucao: lista de 0/1 com n_itens posições."""
+    if bits is None:
+        return None
+    if n_itens == 0:
+        return []
+    texto = format(int.from_bytes(bits, "little"), f"0{n_itens}b")
+    return [int(b) for b in reversed(texto)]
+
+
+class CatalogoInstancias:
+    """
+    Instâncias guardadas uma única vez, em arrays compactos, pelo identificador de conteúdo.
+
+    Registros de várias execuções sobre a mesma instância compartilham a mesma
+    entrada; remover() libera uma instância quando seus registros não precisam
+    mais expandi-la.
+    """
+
+    def __init__(self):
+        self._instancias = {}
+
+    def __len__(self):
+        return len(self._instancias)
+
+    def __contains__(self, identificador):
+        return identificador in self._instancias
+
+    def registrar(self, pesos, valores, capacidade):
+        """Guarda a instância (se ainda não estiver no catálogo) e retorna seu identificador."""
+        identificador = identificar_instancia(pesos, valores, capacidade)
+        if identificador not in self._instancias:
+            self._instancias[identificador] = (_array_compacto(pesos), _array_compacto(valores), capacidade)
+        return identificador
+
+    def obter(self, identificador):
+        """Expande a instância em (pesos, valores, capacidade), com listas novas."""
+        try:
+            pesos, valores, capacidade = self._instancias[identificador]
+        except KeyError:
+            raise KeyError(f"Instância {identificador} não está no catálogo") from None
+        return pesos.tolist(), valores.tolist(), capacidade
+
+    def remover(self, identificador):
+        self._instancias.pop(identificador, None)
+
+
+class RegistroResultado:
+    """
+    Resultado de um teste de um algoritmo, sem dependência de pandas.
+
+    Guarda só o identificador da instância (as listas ficam no catálogo) e a
+    solução empacotada em bits; pesos, valores e melhor_solucao são expandidos
+    quando acessados. Os campos são lidos como atributos ou por chave
+    (registro["valor_total"]), como nos dicionários usados antes.
+    """
+
+    __slots__ = (
+        "algoritmo", "n_itens", "capacidade", "valor_total", "peso_total", "tempo_execucao",
+        "instancia", "solucao_bits", "n_bits", "catalogo",
+    )
+
+    def __init__(self, algoritmo, n_itens, capacidade, valor_total, peso_total, tempo_execucao, instancia,
+                 solucao_bits, n_bits=None, catalogo=None):
+        self.algoritmo = algoritmo
+        self.n_itens = n_itens
+        self.capacidade = capacidade
+        self.valor_total = valor_total
+        self.peso_total = peso_total
+        self.tempo_execucao = tempo_execucao
+        self.instancia = instancia
+        self.solucao_bits = solucao_bits
+        self.n_bits = n_itens if n_bits is None else n_bits
+        self.catalogo = catalogo
+
+    def expandir_instancia(self):
+        """(pesos, valores, capacidade) a partir do catálogo; KeyError se a instância foi liberada."""
+        if self.catalogo is None:
+            raise KeyError(f"Instância {self.instancia} não está no catálogo")
+        return self.catalogo.obter(self.instancia)
+
+    @property
+    def pesos(self):
+        return self.expandir_instancia()[0]
+
+    @property
+    def valores(self):
+        return self.expandir_instancia()[1]
+
+    @property
+    def melhor_solucao(self):
+        return expandir_solucao(self.solucao_bits, self.n_bits)
+
+    def __getitem__(self, campo):
+        if campo not in CAMPOS and campo not in CAMPOS_COMPACTOS:
+            raise KeyError(campo)
+        return getattr(self, campo)
+
+    def __contains__(self, campo):
+        return campo in CAMPOS or campo in CAMPOS_COMPACTOS
+
+    def __eq__(self, outro):
+        if not isinstance(outro, RegistroResultado):
+            return NotImplemented
+        return self.para_dict(expandir=False) == outro.para_dict(expandir=False)
+
+    def __repr__(self):
+        return f"RegistroResultado({self.algoritmo!r}, n_itens={self.n_itens}, valor_total={self.valor_total})"
+
+    def keys(self):
+        return CAMPOS
+
+    def para_dict(self, expandir=True):
+        """Dicionário no formato dos resultados antigos, ou só com os CAMPOS_COMPACTOS."""
+        campos = CAMPOS if expandir else CAMPOS_COMPACTOS
+        return {campo: getattr(self, campo) for campo in campos}
+
+    def para_linha(self):
+        """Dicionário compacto serializável em JSON/CSV (solucao_bits em hexadecimal)."""
+        linha = self.para_dict(expandir=False)
+        if self.solucao_bits is not None:
+            linha["solucao_bits"] = self.solucao_bits.hex()
+        return linha
+
+
+def criar_registro(algoritmo, n_itens, capacidade, valor, peso, tempo_execucao, pesos, valores, solucao,
+                   casas_tempo=5, catalogo=None):
+    """
+    Cria o registro de um teste, com o tempo arredondado a casas_tempo casas (None: sem arredondar).
+
+    A instância é guardada no catálogo do chamador, que decide quando
+    removê-la (catalogo=None guarda só o hash); a solução é empacotada em bits.
+    """
+    if catalogo is None:
+        instancia = identificar_instancia(pesos, valores, capacidade)
+    else:
+        instancia = catalogo.registrar(pesos, valores, capacidade)
+    if casas_tempo is not None:
+        tempo_execucao = round(tempo_execucao, casas_tempo)
+    return RegistroResultado(
+        algoritmo, n_itens, capacidade, valor, peso, tempo_execucao, instancia, compactar_solucao(solucao),
+        None if solucao is None else len(solucao), catalogo
+    )
+
+def para_dataframe(registros, expandir=False):
+    """
+    Converte registros em pandas.DataFrame; pandas só é importado aqui.
+
+    Por padrão a tabela é compacta (CAMPOS_COMPACTOS); expandir=True recria as
+    colunas pesos, valores e melhor_solucao a partir do catálogo.
+    """
+    import pandas as pd
+    campos = CAMPOS if expandir else CAMPOS_COMPACTOS
+    return pd.DataFrame([registro.para_dict(expandir) for registro in registros], columns=list(campos))
@@ -0,0 +1,103 @@
+import pytest
+import subprocess
+import sys
+from registros import (
+    CAMPOS, CAMPOS_COMPACTOS, CatalogoInstancias, RegistroResultado, compactar_solucao, criar_registro,
+    expandir_solucao, identificar_instancia, para_dataframe
+)
+
+
+class TestRegistros:
+    """Classe de testes para os registros de resultado sem pandas"""
+
+    def setup_method(self):
+        """Configuração executada antes de cada teste"""
+        self.catalogo = CatalogoInstancias()
+        self.registro = criar_registro(
+            "Algoritmo ACO", 3, 5, 40, 4, 0.123456, [1, 2, 3], [10, 20, 30], [1, 0, 1], catalogo=self.catalogo
+        )
+
+    def test_acesso_por_chave_e_atributo(self):
+        """Testa que o registro se comporta como o dicionário antigo"""
+        assert self.registro["valor_total"] == self.registro.valor_total == 40
+        assert self.registro["tempo_execucao"] == 0.12346
+        assert "pesos" in self.registro
+        assert dict(self.registro) == self.registro.para_dict()
+        assert list(self.registro.para_dict()) == list(CAMPOS)
+        with pytest.raises(KeyError):
+            self.registro["inexistente"]
+
+    def test_para_dataframe(self):
+        """Testa a conversão opcional para DataFrame, compacta por padrão"""
+        df = para_dataframe([self.registro, self.registro])
+
+        assert list(df.columns) == list(CAMPOS_COMPACTOS)
+        assert df["valor_total"].tolist() == [40, 40]
+        assert df["instancia"][0] == identificar_instancia([1, 2, 3], [10, 20, 30], 5)
+        assert para_dataframe([]).empty
+
+        expandido = para_dataframe([self.registro], expandir=True)
+        assert list(expandido.columns) == list(CAMPOS)
+        assert expandido["pesos"][0] == [1, 2, 3]
+        assert expandido["melhor_solucao"][0] == [1, 0, 1]
+
+    @pytest.mark.parametrize("solucao", [[], [1], [0] * 8, [1, 0, 1, 1, 0, 0, 1, 0, 1], None])
+    def test_solucao_empacotada(self, solucao):
+        """Testa o bitset da solução, ida e volta"""
+        bits = compactar_solucao(solucao)
+        if solucao is not None:
+            assert len(bits) == (len(solucao) + 7) // 8
+            assert expandir_solucao(bits, len(solucao)) == solucao
+        else:
+            assert expandir_solucao(bits, 0) is None
+
+    def test_catalogo_compartilha_e_libera_instancias(self):
+        """Testa que a mesma instância é guardada uma vez e pode ser liberada"""
+        outro = criar_registro(
+            "Cuckoo Search", 3, 5, 30, 3, 0.5, [1, 2, 3], [10, 20, 30], [0, 0, 1], catalogo=self.catalogo
+        )
+
+        assert len(self.catalogo) == 1
+        assert outro.instancia == self.registro.instancia
+        assert outro.expandir_instancia() == ([1, 2, 3], [10, 20, 30], 5)
+
+        self.catalogo.remover(outro.instancia)
+        with pytest.raises(KeyError):
+            outro["pesos"]
+        assert outro["melhor_solucao"] == [0, 0, 1]
+
+        so_hash = criar_registro("PSO", 1, 1, 1, 1, 0.1, [1], [1], [1], catalogo=None)
+        assert so_hash.instancia == identificar_instancia([1], [1], 1)
+        with pytest.raises(KeyError):
+            so_hash.expandir_instancia()
+
+    def test_resolvedores_nao_importam_pandas(self):
+        """Testa que importar os algoritmos _ref não carrega pandas"""
+        codigo = (
+            "import sys\n"
+            "import aco.algColonFormigas_ref, bee_algorithm.beeAlgorithm_ref, cuckoo.algCuckoo_ref\n"
+            "import geneticos.algGeneticos_ref, pso.algEnxParticulas_ref, resolvedores\n"
+            "assert 'pandas' not in sys.modules\n"
+        )
+        subprocess.run([sys.executable, "-c", codigo], check=True)
+
+    def test_main_retorna_registros(self, monkeypatch):
+        """Testa que main() das versões _ref retorna registros, e não DataFrame"""
+        import aco.algColonFormigas_ref as modulo_aco
+        monkeypatch.setattr(modulo_aco, "aco_knapsack", lambda pesos, valores, capacidade: ([0] * len(pesos), 0, 0))
+
+        resultados = modulo_aco.main()
+
+        assert all(isinstance(resultado, RegistroResultado) for resultado in resultados)
+        assert [resultado["n_itens"] for resultado in resultados] == [5, 1000, 10000]
+        with pytest.raises(KeyError):  # sem catálogo do chamador, só o hash é guardado
+            resultados[0].expandir_instancia()
+
+        catalogo = CatalogoInstancias()
+        resultados = modulo_aco.main(catalogo=catalogo)
+        assert len(catalogo) == 3
+        assert len(resultados[0].expandir_instancia()[0]) == 5
+
+        avisados = []
+        resultados = modulo_aco.main(ao_concluir=avisados.append, concluidos={5, 10000})
+        assert avisados == resultados and [resultado.n_itens for resultado in resultados] == [1000]
@@ -0,0 +1,211 @@
+import queue
+import threading
+import time
+from collections import namedtuple
+from multiprocessing import Pool
+from aleatorio import SequenciaSementes
+from avaliadores import BACKENDS, criar_avaliador
+from controle import ControleExecucao, ExecucaoEsgotada
+from exato import calcular_gap, limitante_dantzig
+from memoria_compartilhada import InstanciaCompartilhada, ReferenciaInstancia, anexar_instancia
+
+# Forma comum de retorno de todos os resolvedores
+Resultado = namedtuple("Resultado", ["solucao", "valor", "peso"])
+
+# Resolvedores registrados: nome -> função(pesos, valores, capacidade, avaliar, controle=None, **parametros)
+RESOLVEDORES = {}
+# Parâmetros que o PSO aceita por chamada (os demais são globais do módulo)
+PARAMETROS_CHAMADA_PSO = ("rng", "partida_gulosa", "busca_local")
+
+
+def registrar_resolvedor(nome):
+    """Decorador que registra um resolvedor com a assinatura comum."""
+    def decorador(funcao):
+        RESOLVEDORES[nome] = funcao
+        return funcao
+    return decorador
+
+
+@registrar_resolvedor("aco")
+def resolver_aco(pesos, valores, capacidade, avaliar, controle=None, **parametros):
+    """Adapta aco_knapsack à interface comum."""
+    from aco.algColonFormigas_ref import aco_knapsack
+
+    solucao, valor, peso = aco_knapsack(
+        pesos, valores, capacidade, avaliar=avaliar, controle=controle, **parametros
+    )
+    if solucao is None:  # Nenhuma formiga superou a mochila vazia
+        return Resultado([0] * len(pesos), 0, 0)
+    return Resultado(solucao, valor, peso)
+
+
+@registrar_resolvedor("bee")
+def resolver_bee(pesos, valores, capacidade, avaliar, controle=None, **parametros):
+    """Adapta bee_algorithm à interface comum."""
+    from bee_algorithm.beeAlgorithm_ref import bee_algorithm
+
+    return Resultado(*bee_algorithm(
+        pesos, valores, capacidade, avaliar=avaliar, controle=controle, **parametros
+    ))
+
+
+@registrar_resolvedor("cuckoo")
+def resolver_cuckoo(pesos, valores, capacidade, avaliar, controle=None, **parametros):
+    """Adapta cuckoo_search à interface comum."""
+    from cuckoo.algCuckoo_ref import cuckoo_search
+
+    return Resultado(*cuckoo_search(
+        pesos, valores, capacidade, avaliar=avaliar, controle=controle, **parametros
+    ))
+
+
+@registrar_resolvedor("genetico")
+def resolver_genetico(pesos, valores, capacidade, avaliar, controle=None, **parametros):
+    """Adapta algoritmo_genetico à interface comum (valor sem penalização)."""
+    from geneticos.algGeneticos_ref import algoritmo_genetico
+
+    solucao, _ = algoritmo_genetico(
+        pesos, valores, capacidade, avaliar=avaliar, controle=controle, **parametros
+    )
+    valor, peso = avaliar(solucao, pesos, valores, capacidade)
+    return Resultado(solucao, valor, peso)
+
+
+@registrar_resolvedor("pso")
+def resolver_pso(pesos, valores, capacidade, avaliar, controle=None, **parametros):
+    """
+    Adapta pso à interface comum. Os demais parâmetros são os globais do módulo;
+    por chamada, só rng, partida_gulosa e busca_local.
+    """
+    from pso.algEnxParticulas_ref import pso
+
+    por_chamada = {nome: parametros.pop(nome) for nome in PARAMETROS_CHAMADA_PSO if nome in parametros}
+    if parametros:
+        raise TypeError(f"PSO não aceita parâmetros por chamada: {sorted(parametros)}")
+    solucao, _ = pso(len(pesos), pesos, valores, capacidade, avaliar, controle, **por_chamada)
+    valor, peso = avaliar(solucao, pesos, valores, capacidade)
+    return Resultado(solucao, valor, peso)
+
+
+def resolver(algoritmo, pesos, valores, capacidade, backend="python", controle=None, gap=None, limitante=None,
+             **parametros):
+    """
+    Executa um algoritmo registrado com o backend de avaliação escolhido.
+
+    Args:
+        algoritmo: Nome registrado ("aco", "bee", "cuckoo", "genetico", "pso")
+        pesos: Lista com os pesos dos itens
+        valores: Lista com os valores dos itens
+        capacidade: Capacidade máxima da mochila
+        backend: Backend de avaliação ("python", "numpy" ou "delta")
+        controle: ControleExecucao opcional (prazo, orçamento e melhorias)
+        gap: Se informado, para assim que a incumbente estiver a esse gap
+            relativo do limitante superior (0 = ótimo provado)
+        limitante: Limitante superior já calculado para a instância
+            (padrão: limitante_dantzig, calculado uma vez aqui)
+        **parametros: Parâmetros específicos do algoritmo
+
+    Returns:
+        Resultado(solucao, valor, peso); a mochila vazia se o controle esgotar
+        antes de o algoritmo ter uma solução
+    """
+    try:
+        resolvedor = RESOLVEDORES[algoritmo]
+    except KeyError:
+        raise ValueError(f"Algoritmo desconhecido: {algoritmo!r}") from None
+    avaliar = criar_avaliador(backend, pesos, valores)
+    if gap is not None:
+        controle = controle or ControleExecucao()
+        controle.limitante = limitante if limitante is not None else limitante_dantzig(pesos, valores, capacidade)
+        controle.gap = gap
+    try:
+        return resolvedor(pesos, valores, capacidade, avaliar, controle=controle, **parametros)
+    except ExecucaoEsgotada:  # Esgotado ainda na inicialização: mochila vazia é sempre viável
+        return Resultado([0] * len(pesos), 0, 0)
+
+
+def iterar_incumbentes(algoritmo, pesos, valores, capacidade, prazo=None, max_avaliacoes=None,
+                       backend="python", gap=None, **parametros):
+    """
+    Executa um algoritmo em modo anytime, produzindo cada melhoria da solução incumbente.
+
+    O algoritmo roda em uma thread auxiliar e para ao atingir o prazo (segundos),
+    o orçamento de avaliações ou, se informado, o gap para o limitante superior.
+    Interromper a iteração cancela a execução.
+
+    Yields:
+        Tuplas (decorrido, avaliacoes, melhor_valor, melhor_peso)
+
+    Returns:
+        O Resultado final, disponível como valor de retorno do gerador
+        (por exemplo, via `resultado = yield from iterar_incumbentes(...)`)
+    """
+    fila = queue.Queue()
+    controle = ControleExecucao(prazo, max_avaliacoes, callback=lambda *melhoria: fila.put(melhoria))
+
+    def executar():
+        try:
+            fila.put(resolver(algoritmo, pesos, valores, capacidade, backend, controle, gap, **parametros))
+        except BaseException as erro:
+            fila.put(erro)
+
+    thread = threading.Thread(target=executar, daemon=True)
+    thread.start()
+    try:
+        while True:
+            item = fila.get()
+            if isinstance(item, Resultado):
+                return item
+            if isinstance(item, BaseException):
+                raise item
+            yield item
+    finally:
+        controle.cancelar()
+        thread.join()
+
+
+def comparar_backends(algoritmo, pesos, valores, capacidade, backends=None, gap=None, **parametros):
+    """Executa o mesmo algoritmo com cada backend e mede o tempo e o gap para o limitante."""
+    limitante = limitante_dantzig(pesos, valores, capacidade)
+    resultados = []
+    for backend in backends or BACKENDS:
+        inicio = time.time()
+        resultado = resolver(algoritmo, pesos, valores, capacidade, backend, gap=gap, limitante=limitante, **parametros)
+        fim = time.time()
+
+        resultados.append({
+            "algoritmo": algoritmo,
+            "backend": backend,
+            "valor_total": resultado.valor,
+            "peso_total": resultado.peso,
+            "tempo_execucao": round(fim - inicio, 5),
+            "gap_limitante": calcular_gap(resultado.valor, limitante),
+        })
+    return resultados
+
+
+def _resolver_replica(tarefa):
+    """Executa uma réplica com o gerador da sua própria sequência de sementes (roda nos workers)."""
+    algoritmo, instancia, backend, sementes, parametros = tarefa
+    if isinstance(instancia, ReferenciaInstancia):
+        instancia = anexar_instancia(instancia, numpy=False)
+    return resolver(algoritmo, *instancia, backend, rng=sementes.criar_gerador(), **parametros)
+
+
+def resolver_replicas(algoritmo, pesos, valores, capacidade, n_replicas, semente, n_workers=None,
+                      backend="python", **parametros):
+    """
+    Executa n_replicas execuções independentes do algoritmo, reproduzíveis a partir de uma semente raiz.
+
+    Cada réplica sorteia do gerador de uma filha de SequenciaSementes(semente),
+    sem estado aleatório compartilhado; o resultado (na ordem das réplicas) é
+    o mesmo em série ou com n_workers processos. Em paralelo, a instância vai
+    uma única vez para a memória compartilhada e as tarefas levam só a
+    referência a ela (ver memoria_compartilhada).
+    """
+    sementes = SequenciaSementes(semente).spawn(n_replicas)
+    if not n_workers or n_workers <= 1:
+        return [_resolver_replica((algoritmo, (pesos, valores, capacidade), backend, s, parametros)) for s in sementes]
+    with InstanciaCompartilhada(pesos, valores, capacidade) as instancia, Pool(n_workers) as pool:
+        tarefas = [(algoritmo, instancia.referencia, backend, s, parametros) for s in sementes]
+        return pool.map(_resolver_replica, tarefas)
@@ -0,0 +1,159 @@
+import pytest
+import random
+import time
+from utils import avaliar_solucao, gerar_instancia_aleatoria
+from controle import ControleExecucao
+from resolvedores import (
+    RESOLVEDORES, Resultado, resolver, comparar_backends, registrar_resolvedor, iterar_incumbentes
+)
+
+PARAMETROS_RAPIDOS = {
+    "aco": {"n_formigas": 5, "n_iteracoes": 5},
+    "bee": {"n_abelhas": 6, "n_melhores": 2, "n_vizinhos": 1, "n_iter": 5},
+    "cuckoo": {"n_ninhos": 5, "n_iteracoes": 5},
+    "genetico": {"tam_populacao": 6, "n_geracoes": 5},
+    "pso": {},
+}
+
+
+class TestResolvedores:
+    """Classe de testes para a interface comum dos algoritmos"""
+
+    def setup_method(self):
+        """Configuração executada antes de cada teste"""
+        random.seed(42)
+        self.pesos = [2, 1, 3, 2]
+        self.valores = [12, 10, 20, 15]
+        self.capacidade = 5
+
+    def test_todos_algoritmos_registrados(self):
+        """Testa que os cinco algoritmos estão no registro"""
+        assert set(RESOLVEDORES) == {"aco", "bee", "cuckoo", "genetico", "pso"}
+
+    @pytest.mark.parametrize("algoritmo", sorted(PARAMETROS_RAPIDOS))
+    @pytest.mark.parametrize("backend", ["python", "numpy", "delta"])
+    def test_resolver_retorno_comum(self, algoritmo, backend):
+        """Testa que todo algoritmo retorna Resultado consistente em todo backend"""
+        resultado = resolver(
+            algoritmo, self.pesos, self.valores, self.capacidade, backend,
+            **PARAMETROS_RAPIDOS[algoritmo]
+        )
+
+        assert isinstance(resultado, Resultado)
+        assert len(resultado.solucao) == len(self.pesos)
+        assert (resultado.valor, resultado.peso) == \
+            avaliar_solucao(resultado.solucao, self.pesos, self.valores, self.capacidade)
+
+    def test_resolver_nomes_invalidos(self):
+        """Testa os erros para algoritmo ou backend desconhecidos"""
+        with pytest.raises(ValueError, match="Algoritmo"):
+            resolver("tabu", self.pesos, self.valores, self.capacidade)
+        with pytest.raises(ValueError, match="Backend"):
+            resolver("aco", self.pesos, self.valores, self.capacidade, backend="gpu")
+        with pytest.raises(TypeError):
+            resolver("pso", self.pesos, self.valores, self.capacidade, n_particulas=5)
+
+    def test_registrar_resolvedor(self):
+        """Testa o registro de um novo resolvedor"""
+        @registrar_resolvedor("vazio")
+        def resolver_vazio(pesos, valores, capacidade, avaliar, controle=None):
+            return Resultado([0] * len(pesos), *avaliar([0] * len(pesos), pesos, valores, capacidade))
+
+        try:
+            assert resolver("vazio", self.pesos, self.valores, self.capacidade, "numpy") == \
+                Resultado([0, 0, 0, 0], 0, 0)
+        finally:
+            del RESOLVEDORES["vazio"]
+
+    def test_comparar_backends(self):
+        """Testa a comparação de backends no mesmo algoritmo"""
+        linhas = comparar_backends("cuckoo", self.pesos, self.valores, self.capacidade, n_iteracoes=3)
+        assert [linha["backend"] for linha in linhas] == ["python", "numpy", "delta"]
+        assert all(linha["tempo_execucao"] >= 0 for linha in linhas)
+        assert all(0 <= linha["gap_limitante"] <= 1 for linha in linhas)
+
+    @pytest.mark.parametrize("algoritmo", sorted(PARAMETROS_RAPIDOS))
+    def test_orcamento_de_avaliacoes(self, algoritmo):
+        """Testa que todo algoritmo para no orçamento e retorna a melhor solução notificada"""
+        pesos, valores, capacidade = gerar_instancia_aleatoria(30)
+        melhorias = []
+        controle = ControleExecucao(max_avaliacoes=40, callback=lambda *m: melhorias.append(m))
+
+        resultado = resolver(algoritmo, pesos, valores, capacidade, controle=controle)
+
+        assert controle.avaliacoes <= 40
+        assert (resultado.valor, resultado.peso) == \
+            avaliar_solucao(resultado.solucao, pesos, valores, capacidade)
+        valores_notificados = [valor for _, _, valor, _ in melhorias]
+        assert valores_notificados == sorted(set(valores_notificados))
+        assert all(valor >= 0 and peso <= capacidade for _, _, valor, peso in melhorias)
+        if melhorias:
+            assert resultado.valor == valores_notificados[-1]
+
+    @pytest.mark.parametrize("algoritmo", ["aco", "cuckoo"])
+    def test_prazo(self, algoritmo):
+        """Testa que o prazo interrompe execuções longas"""
+        pesos, valores, capacidade = gerar_instancia_aleatoria(500)
+        controle = ControleExecucao(prazo=0.05)
+
+        inicio = time.perf_counter()
+        resolver(algoritmo, pesos, valores, capacidade, controle=controle, n_iteracoes=10 ** 6)
+
+        assert time.perf_counter() - inicio < 2
+
+    @pytest.mark.parametrize("algoritmo, parametros", [
+        ("aco", {"n_iteracoes": 10 ** 4}),
+        ("bee", {"n_iter": 10 ** 4}),
+        ("cuckoo", {"n_iteracoes": 10 ** 4}),
+        ("genetico", {"n_geracoes": 10 ** 4}),
+    ])
+    def test_parada_por_gap(self, algoritmo, parametros):
+        """Testa que os algoritmos param cedo ao chegar perto do limitante de Dantzig"""
+        # Ótimo 37 e limitante 38: com gap de 5% basta encontrar o ótimo
+        controle = ControleExecucao()
+
+        resultado = resolver(algoritmo, self.pesos, self.valores, self.capacidade,
+                             controle=controle, gap=0.05, **parametros)
+
+        assert controle.limitante == 38
+        assert resultado.valor == 37
+        assert controle.avaliacoes < 10 ** 4
+
+    def test_iterar_incumbentes(self):
+        """Testa o gerador anytime e o resultado final como valor de retorno"""
+        def consumir():
+            resultado = yield from iterar_incumbentes(
+                "cuckoo", self.pesos, self.valores, self.capacidade, max_avaliacoes=200, matricial=True
+            )
+            return resultado
+
+        gerador = consumir()
+        melhorias = []
+        try:
+            while True:
+                melhorias.append(next(gerador))
+        except StopIteration as fim:
+            resultado = fim.value
+
+        assert melhorias
+        assert [m[0] for m in melhorias] == sorted(m[0] for m in melhorias)
+        assert resultado.valor == melhorias[-1][2]
+        assert resultado.peso == melhorias[-1][3]
+
+    def test_iterar_incumbentes_interrompido(self):
+        """Testa que abandonar o gerador cancela a execução em andamento"""
+        pesos, valores, capacidade = gerar_instancia_aleatoria(200)
+        gerador = iterar_incumbentes("aco", pesos, valores, capacidade, n_iteracoes=10 ** 6)
+
+        primeira = next(gerador)
+        inicio = time.perf_counter()
+        gerador.close()
+
+        assert len(primeira) == 4
+        assert time.perf_counter() - inicio < 2
+
+    def test_esgotado_na_inicializacao(self):
+        """Testa que esgotar antes da primeira solução retorna a mochila vazia"""
+        controle = ControleExecucao(max_avaliacoes=1)
+        resultado = resolver("genetico", self.pesos, self.valores, self.capacidade, controle=controle)
+        assert resultado == Resultado([0, 0, 0, 0], 0, 0)
@@ -0,0 +1,404 @@
+import asyncio
+import importlib
+import itertools
+import json
+import multiprocessing
+import os
+import socket
+import sys
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from aleatorio import SequenciaSementes
+from cache_resultados import chave_resultado
+from controle import ControleExecucao
+from memoria_compartilhada import InstanciaCompartilhada, anexar_instancia, desanexar_instancia
+from resolvedores import Resultado, resolver
+
+# Módulos importados uma única vez por worker, na inicialização do pool
+MODULOS_SOLVERS = (
+    "aco.algColonFormigas_ref", "bee_algorithm.beeAlgorithm_ref", "cuckoo.algCuckoo_ref",
+    "geneticos.algGeneticos_ref", "pso.algEnxParticulas_ref",
+)
+# Trabalhos aguardando um worker; além disso, novos pedidos são recusados com "fila cheia"
+TAMANHO_FILA = 64
+# Bytes pendentes de envio acima dos quais o progresso de uma conexão lenta é descartado
+LIMITE_BUFFER_PROGRESSO = 1 << 20
+# Intervalo (segundos) com que o worker verifica o sinal de cancelamento do seu slot
+INTERVALO_CANCELAMENTO = 0.02
+
+# Estado de cada worker do pool
+_fila_progresso = None
+_sinais = None
+
+
+def _iniciar_worker(fila_progresso, sinais):
+    """Inicializador dos workers: guarda os canais com o servidor e importa os solvers."""
+    global _fila_progresso, _sinais
+    _fila_progresso = fila_progresso
+    _sinais = sinais
+    for modulo in MODULOS_SOLVERS:
+        importlib.import_module(modulo)
+
+def _executar_trabalho(slot, numero, algoritmo, referencia, parametros, semente, prazo, max_avaliacoes, gap):
+    """
+    Resolve um trabalho no worker; retorna (solucao, valor, peso, avaliacoes, decorrido, cancelado).
+
+    Cada melhoria vai para a fila de progresso; uma thread vigia o sinal de
+    cancelamento do slot e, se ele for levantado, cancela o controle, de modo
+    que o algoritmo para na próxima avaliação com a melhor solução até ali.
+    """
+    controle = ControleExecucao(
+        prazo, max_avaliacoes, callback=lambda *melhoria: _fila_progresso.put((numero, *melhoria))
+    )
+    terminado = threading.Event()
+
+    def vigiar():
+        while not terminado.wait(INTERVALO_CANCELAMENTO):
+            if _sinais[slot]:
+                controle.cancelar()
+                return
+
+    vigia = threading.Thread(target=vigiar, daemon=True)
+    vigia.start()
+    pesos, valores, capacidade = anexar_instancia(referencia, numpy=False)
+    try:
+        resultado = resolver(algoritmo, pesos, valores, capacidade, controle=controle, gap=gap,
+                             rng=SequenciaSementes(semente).criar_gerador(), **parametros)
+    finally:
+        terminado.set()
+        vigia.join()
+        del pesos, valores
+        desanexar_instancia(referencia)
+    return (list(resultado.solucao), int(resultado.valor), int(resultado.peso), controle.avaliacoes,
+            controle.decorrido(), controle.cancelado)
+
+def _aquecer_worker():
+    """Tarefa vazia que faz o pool subir (e inicializar) um worker antes do primeiro trabalho."""
+
+def _validar_instancia(pesos, valores, capacidade):
+    """Motivo pelo qual a instância de um pedido não pode ser resolvida, ou None se ela é válida."""
+    if not isinstance(pesos, list) or not isinstance(valores, list):
+        return "pesos e valores devem ser listas"
+    if len(pesos) != len(valores):
+        return f"pesos e valores têm tamanhos diferentes: {len(pesos)} e {len(valores)}"
+    if not all(isinstance(x, (int, float)) and not isinstance(x, bool) for x in [*pesos, *valores, capacidade]):
+        return "pesos, valores e capacidade devem ser números"
+    return None
+
+class Trabalho:
+    """Pedido de resolução de uma conexão, da fila até a resposta final."""
+
+    def __init__(self, numero, conexao, identificador, pedido):
+        self.numero = numero  # Identifica o trabalho junto aos workers
+        self.conexao = conexao
+        self.identificador = identificador
+        self.algoritmo = pedido["algoritmo"]
+        self.pesos = pedido["pesos"]
+        self.valores = pedido["valores"]
+        self.capacidade = pedido["capacidade"]
+        self.parametros = pedido.get("parametros", {})
+        self.semente = pedido.get("semente", 0)
+        self.prazo = pedido.get("prazo")
+        self.max_avaliacoes = pedido.get("max_avaliacoes")
+        self.gap = pedido.get("gap")
+        self.slot = None  # Slot do worker enquanto roda
+        self.chave_cache = None
+        self.cancelado = False
+        self.concluido = False
+
+class ServicoResolucao:
+    """
+    Serviço local de resolução: front end asyncio, fila de trabalhos e pool de processos aquecido.
+
+    Os clientes conversam por um socket local (TCP em localhost ou socket Unix,
+    se caminho for informado) em JSON, uma mensagem por linha. O cliente envia
+        {"tipo": "resolver", "id": ..., "algoritmo": ..., "pesos": [...],
+         "valores": [...], "capacidade": ..., "parametros": {...},
+         "semente": ..., "prazo": ..., "max_avaliacoes": ..., "gap": ...}
+        {"tipo": "cancelar", "id": ...}
+    e recebe, para cada id, "aceito" ou "recusado" (fila cheia ou pedido
+    inválido), "iniciado", zero ou mais "progresso" (decorrido, avaliacoes,
+    valor, peso) e por fim "resultado", "cancelado" ou "erro"; "resultado" e
+    "cancelado" trazem sempre solucao, valor, peso, avaliacoes e decorrido
+    (cancelado ainda na fila: a mochila vazia). Os workers já
+    importaram os solvers (MODULOS_SOLVERS) e recebem a instância pela memória
+    compartilhada. A fila tem tamanho limitado: com ela cheia, novos pedidos
+    são recusados na hora e o cliente decide quando reenviar, sem que a leitura
+    da conexão pare (os cancelamentos continuam chegando). O progresso de um
+    cliente que não lê as respostas é descartado (LIMITE_BUFFER_PROGRESSO).
+    Um trabalho na fila é cancelado sem rodar; um em execução para na próxima
+    avaliação e responde com a melhor solução até ali. Se um worker morre,
+    os trabalhos em execução respondem "erro" e o pool é recriado. Com um cache
+    (cache_resultados.CacheResultados), pedidos sem prazo e com semente são
+    procurados nele antes de entrar na fila ("resultado" com "cache": true) e
+    os resultados completos são guardados.
+    """
+
+    def __init__(self, n_workers=None, tamanho_fila=TAMANHO_FILA, host="127.0.0.1", porta=0, caminho=None,
+                 cache=None):
+        self.n_workers = n_workers or os.cpu_count()
+        self.tamanho_fila = tamanho_fila
+        self.host = host
+        self.porta = porta
+        self.caminho = caminho
+        self.cache = cache
+        self.endereco = None
+
+    async def iniciar(self):
+        """Sobe o pool de workers e começa a aceitar conexões; retorna o endereço."""
+        self._laco = asyncio.get_running_loop()
+        self._fila = asyncio.Queue(self.tamanho_fila)
+        self._fila_progresso = multiprocessing.Queue()
+        self._sinais = multiprocessing.Array("b", self.n_workers, lock=False)
+        self._trabalhos = {}  # (conexao, id) -> Trabalho
+        self._em_execucao = {}  # numero -> Trabalho, para o progresso vindo dos workers
+        self._numeros = itertools.count()
+        self._conexoes = set()
+        self._pool = self._criar_pool()
+        self._leitor_progresso = threading.Thread(target=self._ler_progresso, daemon=True)
+        self._leitor_progresso.start()
+        self._despachantes = [asyncio.create_task(self._despachar(slot)) for slot in range(self.n_workers)]
+        if self.caminho is not None:
+            self._servidor = await asyncio.start_unix_server(self._atender, self.caminho)
+            self.endereco = self.caminho
+        else:
+            self._servidor = await asyncio.start_server(self._atender, self.host, self.porta)
+            self.endereco = self._servidor.sockets[0].getsockname()[:2]
+        return self.endereco
+
+    def _criar_pool(self):
+        """Pool de workers já inicializados (um por slot)."""
+        pool = ProcessPoolExecutor(
+            self.n_workers, initializer=_iniciar_worker, initargs=(self._fila_progresso, self._sinais)
+        )
+        for _ in range(self.n_workers):
+            pool.submit(_aquecer_worker)
+        return pool
+
+    def _recriar_pool(self, quebrado):
+        """Troca o pool quebrado (um worker morreu) por um novo, uma única vez por quebra."""
+        if self._pool is quebrado:
+            quebrado.shutdown(wait=False, cancel_futures=True)
+            self._pool = self._criar_pool()
+
+    async def fechar(self):
+        """Para de aceitar conexões, encerra os workers e o leitor de progresso."""
+        self._servidor.close()
+        for conexao in list(self._conexoes):
+            conexao.close()
+        await self._servidor.wait_closed()
+        for despachante in self._despachantes:
+            despachante.cancel()
+        await asyncio.gather(*self._despachantes, return_exceptions=True)
+        self._sinais[:] = [1] * self.n_workers  # Os trabalhos em execução param na próxima avaliação
+        self._pool.shutdown(wait=True, cancel_futures=True)
+        self._fila_progresso.put(None)
+        self._leitor_progresso.join()
+
+    async def servir(self):
+        """Inicia o serviço e atende até ser cancelado."""
+        await self.iniciar()
+        try:
+            await asyncio.Event().wait()
+        finally:
+            await self.fechar()
+
+    def _ler_progresso(self):
+        """Thread que repassa ao laço asyncio as melhorias enviadas pelos workers."""
+        while True:
+            item = self._fila_progresso.get()
+            if item is None:
+                return
+            self._laco.call_soon_threadsafe(self._progresso, item)
+
+    def _progresso(self, item):
+        numero, decorrido, avaliacoes, valor, peso = item
+        trabalho = self._em_execucao.get(numero)
+        if trabalho is None:
+            return  # O resultado final já saiu (e traz a melhor solução)
+        if trabalho.conexao.transport.get_write_buffer_size() > LIMITE_BUFFER_PROGRESSO:
+            return
+        self._enviar(trabalho.conexao, {
+            "tipo": "progresso", "id": trabalho.identificador, "decorrido": decorrido,
+            "avaliacoes": avaliacoes, "valor": valor, "peso": peso,
+        })
+
+    def _enviar(self, conexao, mensagem):
+        if not conexao.is_closing():
+            conexao.write(json.dumps(mensagem).encode() + b"\n")
+
+    def _concluir(self, trabalho, mensagem):
+        trabalho.concluido = True
+        self._trabalhos.pop((trabalho.conexao, trabalho.identificador), None)
+        self._enviar(trabalho.conexao, {**mensagem, "id": trabalho.identificador})
+
+    async def _despachar(self, slot):
+        """Leva os trabalhos da fila, um por vez, ao worker do slot."""
+        while True:
+            trabalho = await self._fila.get()
+            if trabalho.cancelado:
+                continue
+            self._sinais[slot] = 0
+            trabalho.slot = slot
+            self._em_execucao[trabalho.numero] = trabalho
+            self._enviar(trabalho.conexao, {"tipo": "iniciado", "id": trabalho.identificador})
+            pool = self._pool
+            try:
+                with InstanciaCompartilhada(trabalho.pesos, trabalho.valores, trabalho.capacidade) as instancia:
+                    solucao, valor, peso, avaliacoes, decorrido, cancelado = await asyncio.wrap_future(pool.submit(
+                        _executar_trabalho, slot, trabalho.numero, trabalho.algoritmo, instancia.referencia,
+                        trabalho.parametros, trabalho.semente, trabalho.prazo, trabalho.max_avaliacoes, trabalho.gap,
+                    ))
+            except BrokenProcessPool as erro:  # Um worker morreu: o trabalho se perde e o pool é recriado
+                self._recriar_pool(pool)
+                self._concluir(trabalho, {"tipo": "erro", "mensagem": f"{type(erro).__name__}: {erro}"})
+                continue
+            except Exception as erro:  # Um trabalho com defeito não derruba o despachante do slot
+                self._concluir(trabalho, {"tipo": "erro", "mensagem": f"{type(erro).__name__}: {erro}"})
+                continue
+            finally:
+                trabalho.slot = None
+                self._em_execucao.pop(trabalho.numero, None)
+            if trabalho.chave_cache is not None and not cancelado:
+                self.cache.guardar(trabalho.chave_cache, Resultado(solucao, valor, peso))
+            self._concluir(trabalho, {
+                "tipo": "cancelado" if cancelado else "resultado", "solucao": solucao, "valor": valor,
+                "peso": peso, "avaliacoes": avaliacoes, "decorrido": decorrido,
+            })
+
+    def _cancelar(self, trabalho):
+        trabalho.cancelado = True
+        if trabalho.slot is not None:
+            self._sinais[trabalho.slot] = 1  # O worker responde com a melhor solução até ali
+        elif not trabalho.concluido:  # Ainda na fila: nada rodou, a melhor solução é a mochila vazia
+            self._concluir(trabalho, {
+                "tipo": "cancelado", "solucao": [0] * len(trabalho.pesos), "valor": 0, "peso": 0, "avaliacoes": 0,
+                "decorrido": 0.0,
+            })
+
+    async def _atender(self, leitor, conexao):
+        """Lê os pedidos de uma conexão; ao fechar, cancela os trabalhos dela."""
+        self._conexoes.add(conexao)
+        try:
+            while linha := await leitor.readline():
+                try:
+                    pedido = json.loads(linha)
+                    tipo, identificador = pedido["tipo"], pedido["id"]
+                    hash(identificador)
+                except (ValueError, KeyError, TypeError) as erro:
+                    self._enviar(conexao, {"tipo": "erro", "id": None, "mensagem": f"pedido inválido: {erro}"})
+                    continue
+                trabalho = self._trabalhos.get((conexao, identificador))
+                if tipo == "cancelar":
+                    if trabalho is not None:
+                        self._cancelar(trabalho)
+                elif tipo != "resolver":
+                    self._enviar(conexao, {
+                        "tipo": "erro", "id": identificador, "mensagem": f"tipo desconhecido: {tipo!r}",
+                    })
+                elif trabalho is not None:
+                    self._enviar(conexao, {"tipo": "recusado", "id": identificador, "mensagem": "id em uso"})
+                else:
+                    self._admitir(conexao, identificador, pedido)
+                await conexao.drain()
+        except ConnectionError:
+            pass
+        finally:
+            for (dona, _), trabalho in list(self._trabalhos.items()):
+                if dona is conexao:
+                    self._cancelar(trabalho)
+            self._conexoes.discard(conexao)
+            conexao.close()
+
+    def _admitir(self, conexao, identificador, pedido):
+        try:
+            trabalho = Trabalho(next(self._numeros), conexao, identificador, pedido)
+        except KeyError as erro:
+            self._enviar(conexao, {"tipo": "recusado", "id": identificador, "mensagem": f"campo ausente: {erro}"})
+            return
+        motivo = _validar_instancia(trabalho.pesos, trabalho.valores, trabalho.capacidade)
+        if motivo is not None:
+            self._enviar(conexao, {"tipo": "recusado", "id": identificador, "mensagem": f"pedido inválido: {motivo}"})
+            return
+        # Com prazo, o resultado depende do relógio; sem semente, de entropia nova
+        if self.cache is not None and trabalho.prazo is None and trabalho.semente is not None:
+            try:
+                trabalho.chave_cache = chave_resultado(
+                    trabalho.algoritmo, trabalho.pesos, trabalho.valores, trabalho.capacidade,
+                    {**trabalho.parametros, "max_avaliacoes": trabalho.max_avaliacoes, "gap": trabalho.gap},
+                    trabalho.semente,
+                )
+            except (ValueError, TypeError) as erro:
+                self._enviar(conexao, {
+                    "tipo": "recusado", "id": identificador, "mensagem": f"pedido inválido: {erro}",
+                })
+                return
+            resultado = self.cache.obter(trabalho.chave_cache)
+            if resultado is not None:
+                self._enviar(conexao, {"tipo": "aceito", "id": identificador, "fila": self._fila.qsize()})
+                self._enviar(conexao, {
+                    "tipo": "resultado", "id": identificador, "solucao": resultado.solucao,
+                    "valor": resultado.valor, "peso": resultado.peso, "cache": True,
+                })
+                return
+        try:
+            self._fila.put_nowait(trabalho)
+        except asyncio.QueueFull:
+            self._enviar(conexao, {"tipo": "recusado", "id": identificador, "mensagem": "fila cheia"})
+            return
+        self._trabalhos[conexao, identificador] = trabalho
+        self._enviar(conexao, {"tipo": "aceito", "id": identificador, "fila": self._fila.qsize()})
+
+def conectar(endereco):
+    """Socket conectado ao serviço: endereco é (host, porta) ou o caminho de um socket Unix."""
+    if isinstance(endereco, str):
+        cliente = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        cliente.connect(endereco)
+        return cliente
+    return socket.create_connection(tuple(endereco))
+
+def resolver_no_servico(endereco, algoritmo, pesos, valores, capacidade, parametros=None, semente=0,
+                        ao_progredir=None, espera_fila_cheia=0.1, **limites):
+    """
+    Cliente síncrono: envia um trabalho ao serviço e espera a resposta final.
+
+    ao_progredir(decorrido, avaliacoes, valor, peso) recebe cada melhoria.
+    Se a fila estiver cheia, reenvia o pedido a cada espera_fila_cheia
+    segundos. limites aceita prazo, max_avaliacoes e gap.
+
+    Returns:
+        Resultado(solucao, valor, peso)
+    """
+    pedido = json.dumps({
+        "tipo": "resolver", "id": 0, "algoritmo": algoritmo, "pesos": list(pesos), "valores": list(valores),
+        "capacidade": capacidade, "parametros": parametros or {}, "semente": semente, **limites,
+    }).encode() + b"\n"
+    with conectar(endereco) as cliente, cliente.makefile("rb") as respostas:
+        cliente.sendall(pedido)
+        for linha in respostas:
+            mensagem = json.loads(linha)
+            tipo = mensagem["tipo"]
+            if tipo == "progresso" and ao_progredir is not None:
+                ao_progredir(mensagem["decorrido"], mensagem["avaliacoes"], mensagem["valor"], mensagem["peso"])
+            elif tipo == "recusado" and mensagem["mensagem"] == "fila cheia":
+                time.sleep(espera_fila_cheia)
+                cliente.sendall(pedido)
+            elif tipo in ("resultado", "cancelado"):
+                return Resultado(mensagem["solucao"], mensagem["valor"], mensagem["peso"])
+            elif tipo in ("erro", "recusado"):
+                raise RuntimeError(mensagem["mensagem"])
+    raise ConnectionError("o serviço fechou a conexão antes do resultado")
+
+def main():
+    porta = int(sys.argv[1]) if len(sys.argv) > 1 else 8765
+    servico = ServicoResolucao(porta=porta)
+    print(f"Serviço de resolução em 127.0.0.1:{porta} ({servico.n_workers} workers)")
+    try:
+        asyncio.run(servico.servir())
+    except KeyboardInterrupt:
+        pass
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,175 @@
+import pytest
+import asyncio
+import json
+import multiprocessing
+import os
+import random
+import signal
+import threading
+from aleatorio import SequenciaSementes
+from resolvedores import resolver
+from servico import ServicoResolucao, conectar, resolver_no_servico
+from utils import gerar_instancia_aleatoria
+
+
+class Conexao:
+    """Cliente de teste que fala o protocolo do serviço mensagem a mensagem."""
+
+    def __init__(self, endereco):
+        self.socket = conectar(endereco)
+        self.socket.settimeout(30)
+        self.respostas = self.socket.makefile("rb")
+
+    def enviar(self, **mensagem):
+        self.socket.sendall(json.dumps(mensagem).encode() + b"\n")
+
+    def receber(self, tipo=None):
+        """Próxima mensagem (ou a próxima do tipo pedido, descartando as demais)."""
+        while True:
+            mensagem = json.loads(self.respostas.readline())
+            if tipo is None or mensagem["tipo"] == tipo:
+                return mensagem
+
+    def fechar(self):
+        self.respostas.close()
+        self.socket.close()
+
+
+def iniciar_servico(**opcoes):
+    """Sobe o serviço em um laço asyncio próprio, numa thread; retorna (servico, parar)."""
+    laco = asyncio.new_event_loop()
+    thread = threading.Thread(target=laco.run_forever, daemon=True)
+    thread.start()
+    servico = ServicoResolucao(**opcoes)
+    asyncio.run_coroutine_threadsafe(servico.iniciar(), laco).result(30)
+
+    def parar():
+        asyncio.run_coroutine_threadsafe(servico.fechar(), laco).result(30)
+        laco.call_soon_threadsafe(laco.stop)
+        thread.join()
+        laco.close()
+
+    return servico, parar
+
+
+class TestServico:
+    """Classe de testes para o serviço local de resolução"""
+
+    def setup_method(self):
+        """Configuração executada antes de cada teste"""
+        self.pesos, self.valores, self.capacidade = gerar_instancia_aleatoria(60, rng=random.Random(4))
+
+    def pedido(self, identificador, **parametros):
+        """Mensagem de resolução da instância do teste"""
+        return dict(tipo="resolver", id=identificador, algoritmo="aco", pesos=self.pesos, valores=self.valores,
+                    capacidade=self.capacidade, parametros=parametros, semente=3)
+
+    @pytest.fixture
+    def servico(self):
+        servico, parar = iniciar_servico(n_workers=1, tamanho_fila=1)
+        yield servico
+        parar()
+
+    def test_resultado_e_progresso(self, servico):
+        """Testa que o serviço reproduz a execução local e transmite cada melhoria"""
+        parametros = {"n_formigas": 5, "n_iteracoes": 10}
+        melhorias = []
+        resultado = resolver_no_servico(
+            servico.endereco, "aco", self.pesos, self.valores, self.capacidade, parametros, semente=3,
+            ao_progredir=lambda *melhoria: melhorias.append(melhoria),
+        )
+        esperado = resolver("aco", self.pesos, self.valores, self.capacidade,
+                            rng=SequenciaSementes(3).criar_gerador(), **parametros)
+        assert resultado == esperado
+        assert melhorias and melhorias[-1][2] <= resultado.valor
+        assert [valor for _, _, valor, _ in melhorias] == sorted(valor for _, _, valor, _ in melhorias)
+
+    def test_fila_cheia_e_cancelamento(self, servico):
+        """Testa a recusa com a fila cheia e o cancelamento na fila e em execução"""
+        conexao = Conexao(servico.endereco)
+        try:
+            conexao.enviar(**self.pedido("a", n_iteracoes=10 ** 6))
+            assert conexao.receber()["tipo"] == "aceito"
+            assert conexao.receber("iniciado")["id"] == "a"
+            conexao.enviar(**self.pedido("b", n_iteracoes=10 ** 6))
+            assert conexao.receber("aceito")["id"] == "b"
+            conexao.enviar(**self.pedido("c"))
+            assert conexao.receber("recusado") == {"tipo": "recusado", "id": "c", "mensagem": "fila cheia"}
+
+            conexao.enviar(tipo="cancelar", id="b")
+            assert conexao.receber("cancelado") == {
+                "tipo": "cancelado", "id": "b", "solucao": [0] * len(self.pesos), "valor": 0, "peso": 0,
+                "avaliacoes": 0, "decorrido": 0.0,
+            }
+            conexao.receber("progresso")
+            conexao.enviar(tipo="cancelar", id="a")
+            cancelado = conexao.receber("cancelado")
+            assert cancelado["id"] == "a" and 0 < cancelado["valor"] and cancelado["peso"] <= self.capacidade
+
+            # O worker fica livre e o próximo trabalho roda até o fim
+            conexao.enviar(**self.pedido("d", n_formigas=3, n_iteracoes=3))
+            assert conexao.receber("resultado")["id"] == "d"
+        finally:
+            conexao.fechar()
+
+    def test_pedidos_invalidos(self, servico):
+        """Testa as respostas a pedidos malformados e a erros do solver"""
+        conexao = Conexao(servico.endereco)
+        try:
+            conexao.socket.sendall(b"nao e json\n")
+            assert conexao.receber()["tipo"] == "erro"
+            conexao.enviar(tipo="resolver", id=1, algoritmo="aco")
+            assert conexao.receber()["tipo"] == "recusado"
+            conexao.enviar(**{**self.pedido(2), "algoritmo": "inexistente"})
+            assert "Algoritmo desconhecido" in conexao.receber("erro")["mensagem"]
+            for pesos, valores in ((["x", 2], [3, 4]), ([1, 2], [3]), (5, [3])):
+                conexao.enviar(**{**self.pedido(3), "pesos": pesos, "valores": valores})
+                assert conexao.receber()["mensagem"].startswith("pedido inválido")
+
+            # Instância que passa pela admissão mas não cabe em int64: erro, e o único worker continua servindo
+            conexao.enviar(**{**self.pedido(4), "pesos": [2 ** 70, 1], "valores": [1, 1]})
+            assert "ValueError" in conexao.receber("erro")["mensagem"]
+            conexao.enviar(**self.pedido(5, n_formigas=3, n_iteracoes=3))
+            assert conexao.receber("resultado")["id"] == 5
+        finally:
+            conexao.fechar()
+        with pytest.raises(RuntimeError):
+            resolver_no_servico(servico.endereco, "pso", self.pesos, self.valores, self.capacidade, {"x": 1})
+
+    def test_worker_morto(self, servico):
+        """Testa que a morte do worker vira erro para o trabalho e que o serviço segue atendendo"""
+        conexao = Conexao(servico.endereco)
+        try:
+            conexao.enviar(**self.pedido("a", n_iteracoes=10 ** 6))
+            conexao.receber("progresso")
+            for worker in multiprocessing.active_children():
+                os.kill(worker.pid, signal.SIGKILL)
+            assert "BrokenProcessPool" in conexao.receber("erro")["mensagem"]
+
+            conexao.enviar(**self.pedido("b", n_formigas=3, n_iteracoes=3))
+            assert conexao.receber("resultado")["id"] == "b"
+        finally:
+            conexao.fechar()
+
+    def test_socket_unix_e_varios_clientes(self, tmp_path):
+        """Testa o serviço em socket Unix atendendo vários clientes ao mesmo tempo"""
+        servico, parar = iniciar_servico(n_workers=2, tamanho_fila=1, caminho=str(tmp_path / "servico.sock"))
+        resultados = [None] * 4
+
+        def cliente(i):
+            resultados[i] = resolver_no_servico(
+                servico.endereco, "genetico", self.pesos, self.valores, self.capacidade,
+                {"tam_populacao": 6, "n_geracoes": 5}, semente=i, espera_fila_cheia=0.01,
+            )
+
+        try:
+            threads = [threading.Thread(target=cliente, args=(i,)) for i in range(4)]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+        finally:
+            parar()
+        for i, resultado in enumerate(resultados):
+            assert resultado == resolver("genetico", self.pesos, self.valores, self.capacidade,
+                                         rng=SequenciaSementes(i).criar_gerador(), tam_populacao=6, n_geracoes=5)
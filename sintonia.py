@@ -0,0 +1,188 @@
+import math
+import os
+import time
+from collections import namedtuple
+from contextlib import ExitStack
+from itertools import product
+from multiprocessing import Pool
+from aleatorio import SequenciaSementes
+from exato import limitante_dantzig
+from memoria_compartilhada import InstanciaCompartilhada, anexar_instancia
+from utils import gerar_instancia_aleatoria
+
+# Valores candidatos de cada parâmetro (o PSO fica de fora: seus parâmetros são globais do módulo)
+ESPACOS = {
+    "aco": {"n_formigas": [10, 25, 50], "alfa": [0.5, 1.0, 2.0], "beta": [1.0, 2.0, 4.0], "rho": [0.05, 0.1, 0.3]},
+    "bee": {"n_abelhas": [10, 30], "n_melhores": [3, 10], "n_vizinhos": [1, 2, 4]},
+    "cuckoo": {"n_ninhos": [10, 25, 50], "pa": [0.1, 0.25, 0.4]},
+    "genetico": {"tam_populacao": [10, 20, 50], "taxa_mutacao": [0.01, 0.05, 0.1]},
+}
+# Classes de tamanho: nome -> número de itens das instâncias da classe
+CLASSES_TAMANHO = {"pequena": 50, "media": 500, "grande": 5000}
+# Critérios de comparação entre configurações
+CRITERIOS = ("eficiencia", "qualidade")
+
+# Configuração vencedora de uma classe de tamanho; qualidade é a fração média do limitante de Dantzig
+ResultadoSintonia = namedtuple("ResultadoSintonia", [
+    "classe", "algoritmo", "parametros", "qualidade", "tempo_cpu", "eficiencia", "avaliadas", "execucoes",
+])
+
+# Instâncias do worker: (classe, indice) -> (pesos, valores, capacidade, limitante)
+_instancias = {}
+
+
+def gerar_configuracoes(espaco, n_configuracoes=None, semente=0):
+    """Configurações do produto cartesiano do espaço; com n_configuracoes, uma amostra reproduzível delas."""
+    nomes = sorted(espaco)
+    configuracoes = [dict(zip(nomes, valores)) for valores in product(*(espaco[nome] for nome in nomes))]
+    if n_configuracoes is not None and n_configuracoes < len(configuracoes):
+        configuracoes = SequenciaSementes(semente).criar_gerador().sample(configuracoes, n_configuracoes)
+    return configuracoes
+
+def gerar_instancias(classes, n_instancias, semente=0):
+    """n_instancias reproduzíveis por classe, com o limitante de Dantzig de cada uma."""
+    sementes = SequenciaSementes(semente)
+    instancias = {}
+    for c, (classe, n_itens) in enumerate(sorted(classes.items())):
+        for k in range(n_instancias):
+            pesos, valores, capacidade = gerar_instancia_aleatoria(n_itens, rng=sementes.filha(c, k).criar_gerador())
+            instancias[classe, k] = (pesos, valores, capacidade, limitante_dantzig(pesos, valores, capacidade))
+    return instancias
+
+def _iniciar_worker(referencias):
+    """Inicializador dos workers: anexa as instâncias a partir da memória compartilhada."""
+    _instancias.clear()
+    for chave, (referencia, limitante) in referencias.items():
+        _instancias[chave] = (*anexar_instancia(referencia, numpy=False), limitante)
+
+def _executar_tarefa(tarefa):
+    """Resolve uma instância com uma configuração; retorna (qualidade, segundos de CPU)."""
+    from resolvedores import resolver
+
+    algoritmo, parametros, chave, semente = tarefa
+    pesos, valores, capacidade, limitante = _instancias[chave]
+    inicio = time.process_time()
+    resultado = resolver(algoritmo, pesos, valores, capacidade, rng=semente.criar_gerador(), **parametros)
+    tempo_cpu = time.process_time() - inicio
+    return (resultado.valor / limitante if limitante > 0 else 1.0), tempo_cpu
+
+def pontuar(execucoes, criterio="eficiencia"):
+    """Qualidade média ou qualidade por segundo de CPU (soma das qualidades / soma dos tempos)."""
+    qualidade = sum(q for q, _ in execucoes)
+    if criterio == "qualidade":
+        return qualidade / len(execucoes)
+    return qualidade / max(sum(t for _, t in execucoes), 1e-9)
+
+def correr(configuracoes, tarefas, executar, criterio="eficiencia", eta=2, orcamento_inicial=None):
+    """
+    Corrida por successive halving.
+
+    Na rodada r, cada configuração viva roda até as primeiras
+    orcamento_inicial * eta ** r tarefas (só as que ainda não rodou), e só
+    o 1/eta melhor, pela pontuação acumulada, segue para a próxima. Todas as
+    configurações de uma rodada veem as mesmas tarefas (instância e semente).
+    executar(lista de (configuracao, tarefa)) retorna os resultados na mesma
+    ordem. Retorna (indice_vencedora, execucoes_por_configuracao).
+    """
+    if not configuracoes:
+        raise ValueError("Nenhuma configuração para sintonizar")
+    if criterio not in CRITERIOS:
+        raise ValueError(f"Critério desconhecido: {criterio!r}")
+    if orcamento_inicial is None:
+        rodadas = math.ceil(math.log(len(configuracoes), eta)) if len(configuracoes) > 1 else 0
+        orcamento_inicial = max(1, len(tarefas) // eta ** rodadas)
+    execucoes = [[] for _ in configuracoes]
+    vivas = list(range(len(configuracoes)))
+    limite = orcamento_inicial
+    while True:
+        limite = min(limite, len(tarefas))
+        pendentes = [(i, tarefa) for i in vivas for tarefa in tarefas[len(execucoes[i]):limite]]
+        resultados = executar([(configuracoes[i], tarefa) for i, tarefa in pendentes])
+        for (i, _), resultado in zip(pendentes, resultados):
+            execucoes[i].append(resultado)
+        vivas.sort(key=lambda i: pontuar(execucoes[i], criterio), reverse=True)
+        if len(vivas) == 1 or limite == len(tarefas):
+            return vivas[0], execucoes
+        vivas = vivas[:max(1, math.ceil(len(vivas) / eta))]
+        limite *= eta
+
+def sintonizar(algoritmo, espaco=None, classes=None, n_instancias=4, n_sementes=2, n_configuracoes=None,
+               criterio="eficiencia", eta=2, n_workers=None, semente=0, parametros_fixos=None):
+    """
+    Escolhe, para cada classe de tamanho, a configuração com melhor qualidade por segundo de CPU.
+
+    As configurações (de ESPACOS[algoritmo] ou espaco) correm sobre
+    n_instancias x n_sementes tarefas por classe em um pool de n_workers
+    processos (padrão: os.cpu_count()), e as claramente piores saem cedo
+    (successive halving, ver correr). A qualidade de uma execução é o valor
+    dividido pelo limitante de Dantzig; com criterio="qualidade", o tempo é
+    ignorado. parametros_fixos entram em todas as configurações.
+
+    Returns:
+        Lista de ResultadoSintonia, uma por classe, na ordem das classes
+    """
+    espaco = ESPACOS[algoritmo] if espaco is None else espaco
+    classes = CLASSES_TAMANHO if classes is None else classes
+    n_workers = os.cpu_count() if n_workers is None else n_workers
+    configuracoes = [
+        {**(parametros_fixos or {}), **configuracao}
+        for configuracao in gerar_configuracoes(espaco, n_configuracoes, semente)
+    ]
+    instancias = gerar_instancias(classes, n_instancias, semente)
+    sementes = SequenciaSementes(semente).filha(len(classes))  # Fora dos caminhos usados pelas instâncias
+    recursos = ExitStack()
+    if n_workers > 1:
+        # Cada instância vai uma única vez para a memória compartilhada; os workers recebem só as referências
+        referencias = {
+            chave: (recursos.enter_context(InstanciaCompartilhada(pesos, valores, capacidade)).referencia, limitante)
+            for chave, (pesos, valores, capacidade, limitante) in instancias.items()
+        }
+        pool = recursos.enter_context(Pool(n_workers, initializer=_iniciar_worker, initargs=(referencias,)))
+    else:
+        pool = None
+        _instancias.clear()
+        _instancias.update(instancias)
+
+    def executar(pendentes):
+        tarefas = [(algoritmo, configuracao, chave, semente_tarefa)
+                   for configuracao, (chave, semente_tarefa) in pendentes]
+        return pool.map(_executar_tarefa, tarefas) if pool is not None else list(map(_executar_tarefa, tarefas))
+
+    resultados = []
+    with recursos:
+        for classe in sorted(classes, key=classes.get):
+            tarefas = [
+                ((classe, k), sementes.filha(k, s))
+                for s in range(n_sementes) for k in range(n_instancias)
+            ]
+            vencedora, execucoes = correr(configuracoes, tarefas, executar, criterio, eta)
+            melhores = execucoes[vencedora]
+            qualidade = pontuar(melhores, "qualidade")
+            tempo_cpu = sum(t for _, t in melhores) / len(melhores)
+            resultados.append(ResultadoSintonia(
+                classe, algoritmo, configuracoes[vencedora], qualidade, tempo_cpu, pontuar(melhores, "eficiencia"),
+                len(configuracoes), sum(len(e) for e in execucoes),
+            ))
+    return resultados
+
+def formatar_relatorio(resultados):
+    """Tabela em texto com a configuração vencedora de cada algoritmo e classe de tamanho."""
+    linhas = [
+        f"{'algoritmo':<10} {'classe':<8} {'qualidade':>9} {'cpu (s)':>8} {'qual./s':>9} {'execuções':>9}  parâmetros"
+    ]
+    for r in resultados:
+        parametros = ", ".join(f"{nome}={valor}" for nome, valor in sorted(r.parametros.items()))
+        linhas.append(
+            f"{r.algoritmo:<10} {r.classe:<8} {r.qualidade:>9.4f} {r.tempo_cpu:>8.3f} {r.eficiencia:>9.3g} "
+            f"{r.execucoes:>9}  {parametros}"
+        )
+    return "\n".join(linhas)
+
+def main():
+    resultados = []
+    for algoritmo in ("aco", "cuckoo", "genetico"):
+        resultados.extend(sintonizar(algoritmo, n_configuracoes=8))
+    print(formatar_relatorio(resultados))
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,73 @@
+import pytest
+from sintonia import correr, formatar_relatorio, gerar_configuracoes, gerar_instancias, pontuar, sintonizar
+
+
+class TestSintonia:
+    """Classe de testes para a corrida de configurações (successive halving)"""
+
+    def setup_method(self):
+        """Configuração executada antes de cada teste"""
+        self.configuracoes = [{"q": 0.1}, {"q": 0.9}, {"q": 0.5}, {"q": 0.7}]
+        self.chamadas = []
+
+    def executar(self, pendentes):
+        """Executor falso: qualidade fixa por configuração e 1 segundo por tarefa"""
+        self.chamadas.append(len(pendentes))
+        return [(configuracao["q"], configuracao.get("t", 1.0)) for configuracao, _ in pendentes]
+
+    def test_gerar_configuracoes(self):
+        """Testa o produto cartesiano do espaço e a amostra reproduzível"""
+        espaco = {"b": [1, 2], "a": [0.1, 0.2, 0.3]}
+        todas = gerar_configuracoes(espaco)
+        assert len(todas) == 6
+        assert todas[0] == {"a": 0.1, "b": 1}
+        amostra = gerar_configuracoes(espaco, 3, semente=5)
+        assert len(amostra) == 3 and amostra == gerar_configuracoes(espaco, 3, semente=5)
+        assert all(configuracao in todas for configuracao in amostra)
+
+    def test_successive_halving_descarta_cedo(self):
+        """Testa que a melhor vence e que as piores rodam menos tarefas"""
+        vencedora, execucoes = correr(self.configuracoes, list(range(8)), self.executar, criterio="qualidade")
+        assert vencedora == 1
+        # 4 configurações em 2 tarefas, 2 em 4, 1 em 8: 16 execuções em vez de 32
+        assert self.chamadas == [8, 4, 4]
+        assert [len(e) for e in execucoes] == [2, 8, 2, 4]
+
+    def test_eficiencia_considera_tempo(self):
+        """Testa que, por qualidade por segundo de CPU, a configuração mais rápida vence"""
+        configuracoes = [{"q": 0.9, "t": 2.0}, {"q": 0.8, "t": 0.5}]
+        vencedora, _ = correr(configuracoes, list(range(4)), self.executar)
+        assert vencedora == 1
+        vencedora, _ = correr(configuracoes, list(range(4)), self.executar, criterio="qualidade")
+        assert vencedora == 0
+        assert pontuar([(0.8, 0.5), (0.6, 0.5)]) == pytest.approx(1.4)
+
+    def test_validacao(self):
+        """Testa os erros de configuração da corrida"""
+        with pytest.raises(ValueError):
+            correr([], [0], self.executar)
+        with pytest.raises(ValueError):
+            correr(self.configuracoes, [0], self.executar, criterio="tempo")
+
+    def test_gerar_instancias(self):
+        """Testa que as instâncias das classes são reproduzíveis e trazem o limitante"""
+        instancias = gerar_instancias({"a": 5, "b": 12}, 2, semente=3)
+        assert sorted(instancias) == [("a", 0), ("a", 1), ("b", 0), ("b", 1)]
+        assert len(instancias["b", 1][0]) == 12
+        assert instancias == gerar_instancias({"a": 5, "b": 12}, 2, semente=3)
+
+    def test_sintonizar_independe_do_numero_de_workers(self):
+        """Testa a sintonia ponta a ponta em série e no pool de processos"""
+        opcoes = dict(
+            espaco={"n_formigas": [1, 8], "beta": [0.5, 2.0]}, classes={"pequena": 15, "media": 40},
+            n_instancias=2, n_sementes=1, criterio="qualidade", parametros_fixos={"n_iteracoes": 3},
+        )
+        serie = sintonizar("aco", n_workers=1, **opcoes)
+        paralelo = sintonizar("aco", n_workers=2, **opcoes)
+        assert [r.classe for r in serie] == ["pequena", "media"]
+        assert [(r.parametros, r.qualidade) for r in serie] == [(r.parametros, r.qualidade) for r in paralelo]
+        for resultado in serie:
+            assert resultado.parametros["n_iteracoes"] == 3
+            assert 0 < resultado.qualidade <= 1
+            assert resultado.avaliadas == 4 and resultado.execucoes < 4 * 2
+        assert "n_formigas=" in formatar_relatorio(serie)
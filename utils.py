@@ -1,9 +1,10 @@
-import random
+from aleatorio import gerador, sortear_bits
 
-def gerar_instancia_aleatoria(n_itens, max_peso=10, max_valor=20, proporcao_capacidade=(0.3, 0.6)):
-    pesos = [random.randint(1, max_peso) for _ in range(n_itens)]
-    valores = [random.randint(1, max_valor) for _ in range(n_itens)]
-    capacidade = random.randint(int(sum(pesos) * proporcao_capacidade[0]), int(sum(pesos) * proporcao_capacidade[1]))
+def gerar_instancia_aleatoria(n_itens, max_peso=10, max_valor=20, proporcao_capacidade=(0.3, 0.6), rng=None):
+    rng = gerador(rng)
+    pesos = [rng.randint(1, max_peso) for _ in range(n_itens)]
+    valores = [rng.randint(1, max_valor) for _ in range(n_itens)]
+    capacidade = rng.randint(int(sum(pesos) * proporcao_capacidade[0]), int(sum(pesos) * proporcao_capacidade[1]))
     return pesos, valores, capacidade
 
 def avaliar_solucao(solucao, pesos, valores, capacidade):
@@ -13,11 +14,11 @@ def avaliar_solucao(solucao, pesos, valores, capacidade):
         return 0, peso_total
     return valor_total, peso_total
 
-def gerar_solucao_binaria(n):
-    return [random.randint(0, 1) for _ in range(n)]
+def gerar_solucao_binaria(n, rng=None):
+    return sortear_bits(rng, n)
 
-def gerar_vizinho(solucao):
+def gerar_vizinho(solucao, rng=None):
     vizinho = solucao[:]
-    idx = random.randint(0, len(solucao) - 1)
+    idx = gerador(rng).randint(0, len(solucao) - 1)
     vizinho[idx] = 1 - vizinho[idx]
     return vizinho